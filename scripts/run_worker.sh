@@ -17,6 +17,6 @@ source venv/bin/activate
 
 # Run worker with Xvfb (virtual display for headless browser)
 echo "Starting worker with virtual display..."
-xvfb-run python3 src/vm/worker.py
+xvfb-run python3 src/vm/worker.py "$@"
 
 echo "Worker finished."
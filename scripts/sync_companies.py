@@ -0,0 +1,87 @@
+"""
+Script to sync the Companies table with companies.json.
+
+Companies are matched by name: new ones are inserted and changed ones
+updated in bulk, and companies no longer in companies.json are deleted.
+Each change then bumps the catalog version, so workers refresh their
+cached company catalog.
+
+The version stamp lives in a Metadata table:
+    create table "Metadata" (key text primary key, value text not null);
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.repository import CompanyRepository
+from src.models import Company
+
+COMPANIES_PATH = project_root / "src" / "shared" / "companies.json"
+
+
+def load_companies(path: Path = COMPANIES_PATH) -> list[Company]:
+    """
+    Load companies from a companies.json file.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        List of Company objects
+    """
+    with open(path) as f:
+        data = json.load(f)
+
+    return [
+        Company(
+            name=company["name"],
+            url=company["url"],
+            paged=company["paged"],
+            page_query_param=company["page_query_param"],
+        )
+        for company in data["companies"]
+    ]
+
+
+def sync_companies(delete: bool = True, dry_run: bool = False):
+    """
+    Sync the Companies table with companies.json and print the changes.
+
+    Args:
+        delete: Delete companies that are not in companies.json
+        dry_run: Only print the changes without applying them
+    """
+    companies = load_companies()
+    print(f"Found {len(companies)} companies in {COMPANIES_PATH.name}")
+
+    changes = CompanyRepository().sync(companies, delete=delete, dry_run=dry_run)
+
+    for action, symbol in (("created", "+"), ("updated", "~"), ("deleted", "-")):
+        for company in changes[action]:
+            print(f"  {symbol} {company.name}")
+
+    summary = ", ".join(f"{len(changes[action])} {action}" for action in ("created", "updated", "deleted"))
+    if dry_run:
+        print(f"\nDry run, nothing applied: {summary}")
+    else:
+        print(f"\nDone! {summary}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync the Companies table with companies.json")
+    parser.add_argument("--dry-run", action="store_true", help="Print the changes without applying them")
+    parser.add_argument("--keep-missing", action="store_true",
+                        help="Do not delete companies that are missing from companies.json")
+    args = parser.parse_args()
+
+    sync_companies(delete=not args.keep_missing, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,24 @@
 """
 InternDrop - Job scraper core library.
 """
-from src.core.fetch import BaseFetcher, HeadedFetcher, HeadlessFetcher
-from src.utils.config import Config
-
-__all__ = [
-    'BaseFetcher',
-    'HeadedFetcher',
-    'HeadlessFetcher',
-    'Config',
-]
\ No newline at end of file
+from typing import TYPE_CHECKING
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.fetch.base import BaseFetcher
+    from src.core.fetch.headed import HeadedFetcher
+    from src.core.fetch.headless import HeadlessFetcher
+    from src.core.fetch.router import RoutingFetcher
+    from src.utils.config import Config
+
+_EXPORTS = {
+    'BaseFetcher': 'src.core.fetch.base',
+    'HeadedFetcher': 'src.core.fetch.headed',
+    'HeadlessFetcher': 'src.core.fetch.headless',
+    'RoutingFetcher': 'src.core.fetch.router',
+    'Config': 'src.utils.config',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,10 +1,22 @@
 """
 Core fetching and scraping logic - framework agnostic.
 """
-from src.core.fetch import BaseFetcher, HeadedFetcher, HeadlessFetcher
+from typing import TYPE_CHECKING
+from src.utils.lazy import lazy_exports
 
-__all__ = [
-    'BaseFetcher',
-    'HeadedFetcher',
-    'HeadlessFetcher',
-]
\ No newline at end of file
+if TYPE_CHECKING:
+    from src.core.fetch.base import BaseFetcher
+    from src.core.fetch.headed import HeadedFetcher
+    from src.core.fetch.headless import HeadlessFetcher
+    from src.core.fetch.router import RoutingFetcher
+
+_EXPORTS = {
+    'BaseFetcher': 'src.core.fetch.base',
+    'HeadedFetcher': 'src.core.fetch.headed',
+    'HeadlessFetcher': 'src.core.fetch.headless',
+    'RoutingFetcher': 'src.core.fetch.router',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
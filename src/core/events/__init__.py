@@ -0,0 +1,26 @@
+"""
+Posting events published as postings are created, updated and deleted.
+"""
+from typing import TYPE_CHECKING
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.events.base import EventSink, POSTING_CREATED, POSTING_UPDATED, POSTING_DELETED
+    from src.core.events.log import EventLog, create_event_log
+    from src.core.events.webhook import WebhookForwarder
+    from src.core.events.server import EventServer
+
+_EXPORTS = {
+    'EventSink': 'src.core.events.base',
+    'POSTING_CREATED': 'src.core.events.base',
+    'POSTING_UPDATED': 'src.core.events.base',
+    'POSTING_DELETED': 'src.core.events.base',
+    'EventLog': 'src.core.events.log',
+    'create_event_log': 'src.core.events.log',
+    'WebhookForwarder': 'src.core.events.webhook',
+    'EventServer': 'src.core.events.server',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
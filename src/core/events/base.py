@@ -0,0 +1,50 @@
+"""
+Base event sink class for posting events.
+"""
+from abc import ABC, abstractmethod
+from src.models import Posting, codec
+
+# Event types
+POSTING_CREATED = "posting.created"
+POSTING_UPDATED = "posting.updated"
+POSTING_DELETED = "posting.deleted"
+
+
+class EventSink(ABC):
+    """
+    Abstract base class for destinations of posting events.
+
+    Subclasses must implement publish(). The posting_* helpers build the
+    event data from postings so callers do not depend on the event format.
+    """
+
+    @abstractmethod
+    def publish(self, event_type: str, posting_id: str, data: dict) -> dict:
+        """
+        Publish an event.
+
+        Args:
+            event_type: POSTING_CREATED, POSTING_UPDATED or POSTING_DELETED
+            posting_id: ID of the posting the event is about
+            data: Event data
+
+        Returns:
+            The published event
+        """
+        pass
+
+    def posting_created(self, posting: Posting) -> dict:
+        """Publish that a posting was created."""
+        return self.publish(POSTING_CREATED, posting.id, codec.to_dict(posting))
+
+    def posting_updated(self, posting: Posting) -> dict:
+        """Publish that a posting was updated with new details."""
+        return self.publish(POSTING_UPDATED, posting.id, codec.to_dict(posting))
+
+    def posting_deleted(self, posting_id: str, posting: Posting = None) -> dict:
+        """Publish that a posting was deleted, with its last known content if available."""
+        return self.publish(POSTING_DELETED, posting_id, codec.to_dict(posting) if posting is not None else {})
+
+    def close(self):
+        """Release the sink's resources."""
+        pass
@@ -0,0 +1,158 @@
+"""
+Append-only JSONL log of posting events with offsets.
+"""
+import threading
+import time
+from pathlib import Path
+import orjson
+from src.core.events.base import EventSink
+from src.utils.config import Config
+
+# Offsets between entries of the in-memory position index
+INDEX_INTERVAL = 1000
+
+
+class EventLog(EventSink):
+    """
+    Posting events appended to a local JSONL file, one event per line.
+
+    Each event carries its offset, the line number of the event in the log,
+    so subscribers can resume from the last offset they processed. Events
+    are never rewritten or removed. A partly written last line (from a
+    crash mid-write) is cut off when the log is opened. Thread-safe for
+    concurrent use; readers can block until new events arrive with wait().
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Open the event log, creating it if needed.
+
+        Args:
+            path: Path of the JSONL file (defaults to Config.EVENT_LOG_PATH)
+        """
+        self.path = path or Config.EVENT_LOG_PATH
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._condition = threading.Condition()
+        # Byte position of every INDEX_INTERVAL-th event
+        self._index = {}
+        self._file = open(self.path, "a+b")
+        self._next_offset = self._scan()
+
+    def _scan(self) -> int:
+        """Index the log and cut off a partly written last line, returning the next offset."""
+        self._file.seek(0)
+        offset = position = 0
+        for line in self._file:
+            if not line.endswith(b"\n"):
+                self._file.truncate(position)
+                break
+            if offset % INDEX_INTERVAL == 0:
+                self._index[offset] = position
+            position += len(line)
+            offset += 1
+        self._size = position
+        return offset
+
+    @property
+    def next_offset(self) -> int:
+        """Offset the next published event will get."""
+        with self._condition:
+            return self._next_offset
+
+    def publish(self, event_type: str, posting_id: str, data: dict) -> dict:
+        """
+        Append an event to the log and wake up waiting readers.
+
+        Args:
+            event_type: POSTING_CREATED, POSTING_UPDATED or POSTING_DELETED
+            posting_id: ID of the posting the event is about
+            data: Event data
+
+        Returns:
+            The event with its offset
+        """
+        with self._condition:
+            event = {
+                "offset": self._next_offset,
+                "type": event_type,
+                "id": posting_id,
+                "time": time.time(),
+                "data": data,
+            }
+            line = orjson.dumps(event) + b"\n"
+            self._file.write(line)
+            self._file.flush()
+
+            if self._next_offset % INDEX_INTERVAL == 0:
+                self._index[self._next_offset] = self._size
+            self._size += len(line)
+            self._next_offset += 1
+            self._condition.notify_all()
+
+        return event
+
+    def read(self, offset: int = 0, limit: int = None) -> list[dict]:
+        """
+        Read events starting at an offset.
+
+        Args:
+            offset: Offset of the first event to read
+            limit: Maximum number of events to return (all if not provided)
+
+        Returns:
+            Events in offset order
+        """
+        with self._condition:
+            end_offset = self._next_offset
+            end_position = self._size
+            start = max(min(offset, end_offset), 0) // INDEX_INTERVAL * INDEX_INTERVAL
+            position = self._index.get(start, 0)
+
+        if limit is not None:
+            end_offset = min(end_offset, max(offset, 0) + limit)
+
+        events = []
+        with open(self.path, "rb") as f:
+            f.seek(position)
+            current = start
+            while current < end_offset and f.tell() < end_position:
+                line = f.readline()
+                if current >= offset:
+                    events.append(orjson.loads(line))
+                current += 1
+        return events
+
+    def wait(self, offset: int, timeout: float = None) -> bool:
+        """
+        Block until the event at an offset has been published.
+
+        Args:
+            offset: Offset to wait for
+            timeout: Maximum seconds to wait (forever if not provided)
+
+        Returns:
+            True if the event exists, False if the wait timed out
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._next_offset > offset, timeout)
+
+    def close(self):
+        """Close the log file."""
+        with self._condition:
+            self._file.close()
+
+
+def create_event_log(path: str = None) -> EventLog | None:
+    """
+    Open the worker's event log if posting events are enabled.
+
+    Args:
+        path: Path of the JSONL file (defaults to Config.EVENT_LOG_PATH)
+
+    Returns:
+        EventLog instance, or None if Config.EVENT_LOG_ENABLED is off
+    """
+    if not Config.EVENT_LOG_ENABLED:
+        return None
+    return EventLog(path)
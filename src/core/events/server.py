@@ -0,0 +1,111 @@
+"""
+Local server streaming posting events to subscribers as server-sent events.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from src.core.events.log import EventLog
+from src.utils.config import Config
+
+# Seconds between keep-alive comments on idle streams
+KEEPALIVE_SECONDS = 15
+
+# Events read from the log per write to a stream
+READ_BATCH_SIZE = 100
+
+
+class EventServer:
+    """
+    HTTP server streaming the event log at GET /events.
+
+    Subscribers resume with the offset of the first event they want, given
+    as ?offset=N or, when reconnecting, through the Last-Event-ID header
+    the browser EventSource API sends (the last event received). Without
+    either, only new events are streamed. Each event is sent with its
+    offset as the SSE id and its type as the SSE event name.
+    """
+
+    def __init__(self, log: EventLog, host: str = None, port: int = None):
+        """
+        Initialize the event server.
+
+        Args:
+            log: Event log to stream
+            host: Interface to listen on (defaults to Config.EVENT_SERVER_HOST)
+            port: Port to listen on (defaults to Config.EVENT_SERVER_PORT, 0 picks a free port)
+        """
+        self.log = log
+        self._stopping = threading.Event()
+        self._server = ThreadingHTTPServer(
+            (host or Config.EVENT_SERVER_HOST, port if port is not None else Config.EVENT_SERVER_PORT),
+            self._handler_class(),
+        )
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Host and port the server listens on."""
+        return self._server.server_address[:2]
+
+    def _handler_class(self):
+        """Build the request handler class bound to this server."""
+        server = self
+
+        class EventStreamHandler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def start_offset(self) -> int:
+                query = parse_qs(urlparse(self.path).query)
+                if "offset" in query:
+                    return int(query["offset"][0])
+                if self.headers.get("Last-Event-ID"):
+                    return int(self.headers["Last-Event-ID"]) + 1
+                return server.log.next_offset
+
+            def do_GET(self):
+                if urlparse(self.path).path != "/events":
+                    self.send_error(404)
+                    return
+                try:
+                    offset = self.start_offset()
+                except ValueError:
+                    self.send_error(400, "offset must be an integer")
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+
+                try:
+                    while not server._stopping.is_set():
+                        events = server.log.read(offset, READ_BATCH_SIZE)
+                        for event in events:
+                            self.wfile.write(
+                                f"id: {event['offset']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n".encode()
+                            )
+                        if events:
+                            offset = events[-1]["offset"] + 1
+                        elif not server.log.wait(offset, timeout=KEEPALIVE_SECONDS):
+                            self.wfile.write(b": keep-alive\n\n")
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        return EventStreamHandler
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        host, port = self.address
+        print(f"Streaming posting events at http://{host}:{port}/events")
+
+    def stop(self):
+        """Stop serving and close open streams."""
+        self._stopping.set()
+        self._server.shutdown()
+        self._server.server_close()
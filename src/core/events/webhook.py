@@ -0,0 +1,122 @@
+"""
+Delivery of posting events from the event log to a webhook.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from src.core.events.log import EventLog
+from src.utils.config import Config
+from src.utils.transport import get_http_client
+
+# Longest wait between failed deliveries
+MAX_BACKOFF_SECONDS = 60
+
+
+class WebhookForwarder:
+    """
+    Posts events from the event log to a webhook URL in batches.
+
+    The offset of the next undelivered event is saved after every
+    successful delivery, so a restarted worker resumes where the last one
+    stopped. Delivery is at-least-once: receivers should deduplicate by
+    event offset.
+    """
+
+    def __init__(self, log: EventLog, url: str = None, cursor_path: str = None, batch_size: int = None):
+        """
+        Initialize the forwarder.
+
+        Args:
+            log: Event log to forward
+            url: Webhook URL (defaults to Config.EVENT_WEBHOOK_URL)
+            cursor_path: Path of the file storing the next offset to deliver
+                         (defaults to Config.EVENT_WEBHOOK_CURSOR_PATH)
+            batch_size: Maximum events per request (defaults to Config.EVENT_WEBHOOK_BATCH_SIZE)
+        """
+        self.log = log
+        self.url = url or Config.EVENT_WEBHOOK_URL
+        self.cursor_path = cursor_path or Config.EVENT_WEBHOOK_CURSOR_PATH
+        self.batch_size = batch_size or Config.EVENT_WEBHOOK_BATCH_SIZE
+        self.offset = self._load_cursor()
+
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _load_cursor(self) -> int:
+        """Load the next offset to deliver, starting at new events if there is none."""
+        try:
+            with open(self.cursor_path) as f:
+                return json.load(f)["offset"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return self.log.next_offset
+
+    def _save_cursor(self):
+        """Write the next offset to deliver to disk."""
+        Path(self.cursor_path).parent.mkdir(parents=True, exist_ok=True)
+        temp_path = f"{self.cursor_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"offset": self.offset}, f)
+        os.replace(temp_path, self.cursor_path)
+
+    def deliver(self, events: list[dict]) -> bool:
+        """
+        Post a batch of events to the webhook.
+
+        Args:
+            events: Events to deliver
+
+        Returns:
+            True if the webhook accepted the batch
+        """
+        try:
+            response = get_http_client().post(self.url, json={"events": events})
+        except Exception as e:
+            print(f"Event webhook: delivery failed: {e}")
+            return False
+
+        if response.status_code >= 300:
+            print(f"Event webhook: delivery rejected with status {response.status_code}")
+            return False
+        return True
+
+    def run(self):
+        """
+        Deliver events until stopped.
+
+        Once stopped, events already in the log are still delivered unless
+        the webhook is failing, in which case they are left for the next run.
+        """
+        failures = 0
+        while True:
+            # Checked before reading, so events published before stop() are still delivered
+            stopping = self._stop_event.is_set()
+            events = self.log.read(self.offset, self.batch_size)
+            if not events:
+                if stopping:
+                    break
+                self.log.wait(self.offset, timeout=1)
+                continue
+
+            if self.deliver(events):
+                failures = 0
+                self.offset = events[-1]["offset"] + 1
+                self._save_cursor()
+                continue
+
+            if stopping:
+                print(f"Event webhook: leaving events from offset {self.offset} for the next run")
+                break
+            failures += 1
+            self._stop_event.wait(min(2 ** failures, MAX_BACKOFF_SECONDS))
+
+    def start(self):
+        """Start delivering events in a background thread."""
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Deliver the remaining events and stop the background thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
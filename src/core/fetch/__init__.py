@@ -1,12 +1,31 @@
 """
 Fetcher module with base and specialized fetcher implementations.
 """
-from src.core.fetch.base import BaseFetcher
-from src.core.fetch.headed import HeadedFetcher
-from src.core.fetch.headless import HeadlessFetcher
-
-__all__ = [
-    'BaseFetcher',
-    'HeadedFetcher',
-    'HeadlessFetcher',
-]
+from typing import TYPE_CHECKING
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.fetch.base import BaseFetcher
+    from src.core.fetch.headed import HeadedFetcher
+    from src.core.fetch.headless import HeadlessFetcher
+    from src.core.fetch.health import CircuitOpenError, DomainHealth
+    from src.core.fetch.page import FetchedPage
+    from src.core.fetch.profiles import BrowserProfiles
+    from src.core.fetch.regions import ListingRegionCache
+    from src.core.fetch.router import RoutingFetcher
+
+_EXPORTS = {
+    'BaseFetcher': 'src.core.fetch.base',
+    'HeadedFetcher': 'src.core.fetch.headed',
+    'HeadlessFetcher': 'src.core.fetch.headless',
+    'CircuitOpenError': 'src.core.fetch.health',
+    'DomainHealth': 'src.core.fetch.health',
+    'FetchedPage': 'src.core.fetch.page',
+    'BrowserProfiles': 'src.core.fetch.profiles',
+    'ListingRegionCache': 'src.core.fetch.regions',
+    'RoutingFetcher': 'src.core.fetch.router',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -2,10 +2,19 @@
 Base fetcher class with common fetching logic.
 """
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import partial
+import json
 import time
 import threading
+from src.core.fetch.health import CircuitOpenError, DomainHealth
+from src.core.fetch.job_data import find_job_data
+from src.core.fetch.page import FetchedPage, extract_structured_data
+from src.core.fetch.profiles import get_browser_profiles
+from src.core.fetch.regions import css_path, detect_listing_region, select_region
 from src.utils.config import Config
+from src.utils.cpu_pool import run_with_shared_text
 
 
 class BaseFetcher(ABC):
@@ -16,25 +25,56 @@ class BaseFetcher(ABC):
     how pages are fetched (headed vs headless browser).
     """
 
-    def __init__(self):
-        """Initialize the fetcher with rate limiting tracking."""
+    def __init__(self, health: DomainHealth = None):
+        """
+        Initialize the fetcher with rate limiting and domain health tracking.
+
+        Args:
+            health: Domain health tracker to share with other fetchers (created if not provided)
+        """
         self._last_fetch_time = 0
         self._fetch_lock = threading.Lock()
+        self.health = health or DomainHealth()
 
     def fetch(self, url: str) -> str:
         """
         Fetch and clean HTML content from a URL with rate limiting.
 
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Cleaned text content from the page
+
+        Raises:
+            CircuitOpenError: If the URL's domain has failed too many times in a row
+        """
+        return self.fetch_page(url).text
+
+    def fetch_page(self, url: str, listing_region: str = None) -> FetchedPage:
+        """
+        Fetch a page from a URL with rate limiting, keeping its structured data.
+
         This method enforces a minimum delay between fetches using
         Config.MIN_CRAWL_DELAY to be respectful to servers.
+        Latency and failures (errors or empty pages) are recorded per domain,
+        and domains whose circuit breaker has tripped fail immediately.
         Thread-safe for concurrent use.
 
         Args:
             url: The URL to fetch
+            listing_region: Job list region to extract: None for none, a learned
+                            CSS selector, or an empty string to detect it
 
         Returns:
-            Cleaned text content from the page
+            Fetched page with cleaned text and JSON-LD data
+
+        Raises:
+            CircuitOpenError: If the URL's domain has failed too many times in a row
         """
+        if self.health.is_open(url):
+            raise CircuitOpenError(f"Skipping {url} - site is not responding")
+
         with self._fetch_lock:
             # Calculate time since last fetch
             time_since_last_fetch = time.time() - self._last_fetch_time
@@ -46,15 +86,25 @@ class BaseFetcher(ABC):
                 time.sleep(wait_time)
 
             # Perform the actual fetch
-            result = self._fetch_impl(url)
+            start_time = time.time()
+            try:
+                result = self._fetch_impl(url, listing_region)
+            except Exception:
+                self.health.record_failure(url)
+                raise
+            finally:
+                # Update last fetch time
+                self._last_fetch_time = time.time()
 
-            # Update last fetch time
-            self._last_fetch_time = time.time()
+            if result.text.strip():
+                self.health.record_success(url, (self._last_fetch_time - start_time) * 1000)
+            else:
+                self.health.record_failure(url)
 
             return result
 
     @abstractmethod
-    def _fetch_impl(self, url: str) -> str:
+    def _fetch_impl(self, url: str, listing_region: str = None) -> FetchedPage:
         """
         Implementation-specific fetch logic.
 
@@ -63,15 +113,122 @@ class BaseFetcher(ABC):
 
         Args:
             url: The URL to fetch
+            listing_region: Job list region to extract (see fetch_page())
 
         Returns:
-            Cleaned text content from the page
+            Fetched page built from the raw HTML with parse_html()
         """
         pass
 
+    def timeout_ms(self, url: str) -> int:
+        """
+        Get the page load timeout for a URL, adapted to its domain's latency.
+
+        Args:
+            url: The URL about to be fetched
+
+        Returns:
+            Timeout in milliseconds
+        """
+        return self.health.timeout_ms(url)
+
+    @contextmanager
+    def browser_context(self, playwright, url: str, headless: bool):
+        """
+        Launch a browser for fetching a URL.
+
+        With Config.BROWSER_PROFILES enabled, the browser runs on the
+        persistent profile of the URL's domain, reusing its disk cache,
+        cookies and local storage. Otherwise it starts from a blank profile.
+
+        Args:
+            playwright: Playwright instance from sync_playwright()
+            url: URL about to be fetched
+            headless: Whether to run the browser without a window
+
+        Yields:
+            Playwright BrowserContext, closed on exit
+        """
+        if Config.BROWSER_PROFILES:
+            with get_browser_profiles().open(playwright, url, headless) as context:
+                yield context
+            return
+
+        browser = playwright.chromium.launch(headless=headless)
+        try:
+            yield browser.new_context()
+        finally:
+            browser.close()
+
+    def capture_json_responses(self, page) -> list:
+        """
+        Start recording the JSON API responses a Playwright page receives.
+
+        Args:
+            page: Playwright page, before navigating
+
+        Returns:
+            List the responses are appended to while the page loads
+        """
+        responses = []
+        if not Config.JOB_DATA_CAPTURE:
+            return responses
+
+        def on_response(response):
+            if response.request.resource_type in ("xhr", "fetch") and response.ok \
+                    and "json" in response.headers.get("content-type", ""):
+                responses.append(response)
+
+        page.on("response", on_response)
+        return responses
+
+    def read_json_responses(self, responses: list) -> list[tuple[str, object]]:
+        """
+        Read the bodies of recorded JSON responses. Must run before the browser closes.
+
+        Responses past Config.JOB_DATA_MAX_RESPONSES, larger than
+        Config.JOB_DATA_MAX_BYTES or not valid JSON are skipped.
+
+        Args:
+            responses: Responses recorded by capture_json_responses()
+
+        Returns:
+            URL and decoded body of each response
+        """
+        bodies = []
+        for response in responses[:Config.JOB_DATA_MAX_RESPONSES]:
+            try:
+                body = response.body()
+                if len(body) <= Config.JOB_DATA_MAX_BYTES:
+                    bodies.append((response.url, json.loads(body)))
+            except Exception:
+                continue
+        return bodies
+
+    def build_page(self, html: str, json_responses: list[tuple[str, object]] = None,
+                   listing_region: str = None) -> FetchedPage:
+        """
+        Build the fetched page from rendered HTML and the JSON responses received while rendering.
+
+        Args:
+            html: Raw HTML content
+            json_responses: URL and decoded body of each JSON response
+            listing_region: Job list region to extract (see fetch_page())
+
+        Returns:
+            Fetched page with cleaned text, JSON-LD data and any job list found in the responses
+        """
+        fetched_page = self.parse_html(html, listing_region)
+
+        job_data_url, job_data = find_job_data(json_responses or [])
+        if not job_data:
+            return fetched_page
+        return replace(fetched_page, job_data=job_data, job_data_url=job_data_url)
+
     def clean_html(self, html: str) -> str:
         """
         Clean HTML and extract text content, including links with their hrefs.
+        Runs in the CPU process pool when Config.CPU_POOL_SIZE is set.
 
         Args:
             html: Raw HTML content
@@ -79,34 +236,106 @@ class BaseFetcher(ABC):
         Returns:
             Cleaned text content with links formatted as "text (href)"
         """
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Remove script and style elements
-        for element in soup(["script", "style"]):
-            element.decompose()
-
-        # This is so the LLM can extract links
-        # Replace <a> tags with "text (href)" format
-        for link in soup.find_all('a'):
-            href = link.get('href', '')
-            if href:
-                link_text = link.get_text(strip=True)
-                link.replace_with(f"{link_text} (HREF: {href})")
-
-        # Get text and clean it up
-        text = soup.get_text()
-
-        # Normalize Unicode punctuation to ASCII equivalents
-        text = text.replace('\u2013', '-')  # en dash
-        text = text.replace('\u2014', '-')  # em dash
-        text = text.replace('\u2018', "'")  # left single quote
-        text = text.replace('\u2019', "'")  # right single quote
-        text = text.replace('\u201c', '"')  # left double quote
-        text = text.replace('\u201d', '"')  # right double quote
-        text = text.replace('\u2026', '...')  # ellipsis
-
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        cleaned_text = '\n'.join(chunk for chunk in chunks if chunk)
-
-        return cleaned_text
+        return run_with_shared_text(clean_html, html)
+
+    def parse_html(self, html: str, listing_region: str = None) -> FetchedPage:
+        """
+        Clean HTML and extract its JSON-LD structured data in one pass.
+        Runs in the CPU process pool when Config.CPU_POOL_SIZE is set.
+
+        Args:
+            html: Raw HTML content
+            listing_region: Job list region to extract (see fetch_page())
+
+        Returns:
+            Fetched page with cleaned text and JSON-LD data
+        """
+        return run_with_shared_text(partial(parse_html, listing_region=listing_region), html)
+
+
+def clean_html(html: str) -> str:
+    """
+    Clean HTML and extract text content, including links with their hrefs.
+
+    Args:
+        html: Raw HTML content
+
+    Returns:
+        Cleaned text content with links formatted as "text (href)"
+    """
+    return parse_html(html).text
+
+
+def parse_html(html: str, listing_region: str = None) -> FetchedPage:
+    """
+    Clean HTML and extract its text content and JSON-LD structured data.
+
+    Args:
+        html: Raw HTML content
+        listing_region: Job list region to extract: None for none, a learned
+                        CSS selector, or an empty string to detect it
+                        (a selector that no longer matches falls back to detection)
+
+    Returns:
+        Fetched page with cleaned text (links formatted as "text (href)"),
+        JSON-LD data and the job list region if requested
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Structured data lives in script tags, capture it before they are removed
+    structured_data = extract_structured_data(soup)
+
+    # Remove script and style elements
+    for element in soup(["script", "style"]):
+        element.decompose()
+
+    # Find the job list region before links are flattened into text
+    region, region_selector = None, ""
+    if listing_region is not None:
+        if listing_region:
+            region = select_region(soup, listing_region)
+            region_selector = listing_region
+        if region is None:
+            region = detect_listing_region(soup)
+            region_selector = css_path(region) if region is not None else ""
+
+    # This is so the LLM can extract links
+    # Replace <a> tags with "text (href)" format
+    for link in soup.find_all('a'):
+        href = link.get('href', '')
+        if href:
+            link_text = link.get_text(strip=True)
+            link.replace_with(f"{link_text} (HREF: {href})")
+
+    return FetchedPage(
+        text=normalize_text(soup.get_text()),
+        structured_data=structured_data,
+        region_text=normalize_text(region.get_text()) if region is not None else "",
+        region_selector=region_selector,
+    )
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize punctuation and whitespace of text extracted from HTML.
+
+    Args:
+        text: Text extracted from HTML
+
+    Returns:
+        Text with ASCII punctuation and one phrase per line
+    """
+    # Normalize Unicode punctuation to ASCII equivalents
+    text = text.replace('\u2013', '-')  # en dash
+    text = text.replace('\u2014', '-')  # em dash
+    text = text.replace('\u2018', "'")  # left single quote
+    text = text.replace('\u2019', "'")  # right single quote
+    text = text.replace('\u201c', '"')  # left double quote
+    text = text.replace('\u201d', '"')  # right double quote
+    text = text.replace('\u2026', '...')  # ellipsis
+
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return '\n'.join(chunk for chunk in chunks if chunk)
@@ -1,9 +1,9 @@
 """
 Headless browser fetcher for standard websites.
 """
-from playwright.sync_api import sync_playwright
 from src.core.fetch.base import BaseFetcher
-from src.utils.config import Config
+from src.core.fetch.health import DomainHealth
+from src.core.fetch.page import FetchedPage
 
 
 class HeadlessFetcher(BaseFetcher):
@@ -11,33 +11,43 @@ class HeadlessFetcher(BaseFetcher):
     Fetcher using a headless (invisible) browser.
     """
 
-    def __init__(self):
-        """Initialize the headless fetcher."""
-        super().__init__()
+    def __init__(self, health: DomainHealth = None):
+        """
+        Initialize the headless fetcher.
+
+        Args:
+            health: Domain health tracker to share with other fetchers
+        """
+        super().__init__(health)
 
-    def _fetch_impl(self, url: str) -> str:
+    def _fetch_impl(self, url: str, listing_region: str = None) -> FetchedPage:
         """
         Fetch HTML content using a headless browser.
 
         Args:
             url: The URL to fetch
+            listing_region: Job list region to extract (see BaseFetcher.fetch_page())
 
         Returns:
-            Cleaned text content from the page
+            Fetched page with cleaned text and JSON-LD data
         """
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p, self.browser_context(p, url, headless=True) as context:
+            page = context.new_page()
+
+            responses = self.capture_json_responses(page)
 
             # Try networkidle for timeout duration
             try:
-                page.goto(url, wait_until="networkidle", timeout=Config.FETCH_TIMEOUT_MS)
+                page.goto(url, wait_until="networkidle", timeout=self.timeout_ms(url))
                 html = page.content()
             except:
                 # If it times out, just continue with what's loaded
                 print("Network idle timed out - continuing anyways")
                 html = page.content()
             finally:
-                browser.close()
+                # Response bodies can only be read while the browser is open
+                json_responses = self.read_json_responses(responses)
 
-            return self.clean_html(html)
+        return self.build_page(html, json_responses, listing_region)
@@ -0,0 +1,174 @@
+"""
+Per-domain fetch latency tracking, adaptive timeouts and circuit breaking.
+"""
+import statistics
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+from src.utils.config import Config
+
+# Samples needed before a domain's own latency replaces the default timeout
+MIN_LATENCY_SAMPLES = 3
+
+
+class CircuitOpenError(Exception):
+    """Raised when fetching from a domain whose circuit breaker has tripped."""
+    pass
+
+
+class DomainHealth:
+    """
+    Tracks fetch latency and failures per domain.
+
+    Timeouts adapt to each domain's rolling p95 latency, clamped between
+    Config.FETCH_MIN_TIMEOUT_MS and Config.FETCH_TIMEOUT_MS. After
+    Config.CIRCUIT_BREAKER_FAILURES consecutive failures a domain's circuit
+    opens, so later fetches fail fast and callers can tell "site down" apart
+    from "no jobs". It stays open for the rest of the run unless
+    Config.CIRCUIT_BREAKER_COOLDOWN_SECONDS is set: the circuit is then
+    half-open after the cooldown, letting a single trial fetch through,
+    which closes it on success and opens it for another cooldown on failure.
+    Thread-safe for concurrent use.
+    """
+
+    def __init__(self):
+        """Initialize empty latency and failure tracking."""
+        self._lock = threading.Lock()
+        self._latencies = {}
+        self._consecutive_failures = {}
+        # Open domains and when their circuit opened
+        self._open_domains = {}
+        # Open domains whose trial fetch is in flight
+        self._half_open_domains = set()
+
+    def _domain(self, url: str) -> str:
+        return urlparse(url).netloc
+
+    def record_success(self, url: str, latency_ms: float):
+        """
+        Record a successful fetch.
+
+        Args:
+            url: URL that was fetched
+            latency_ms: Time the fetch took in milliseconds
+        """
+        domain = self._domain(url)
+        with self._lock:
+            latencies = self._latencies.setdefault(domain, deque(maxlen=Config.FETCH_LATENCY_WINDOW))
+            latencies.append(latency_ms)
+            self._consecutive_failures[domain] = 0
+            if self._open_domains.pop(domain, None) is not None:
+                print(f"Circuit breaker closed for {domain}")
+            self._half_open_domains.discard(domain)
+
+    def record_failure(self, url: str):
+        """
+        Record a failed fetch, opening the domain's circuit after too many in a row.
+
+        Args:
+            url: URL that failed
+        """
+        domain = self._domain(url)
+        with self._lock:
+            failures = self._consecutive_failures.get(domain, 0) + 1
+            self._consecutive_failures[domain] = failures
+            if domain in self._half_open_domains:
+                print(f"Circuit breaker open again for {domain} after a failed trial fetch")
+                self._half_open_domains.discard(domain)
+                self._open_domains[domain] = time.time()
+            elif failures >= Config.CIRCUIT_BREAKER_FAILURES and domain not in self._open_domains:
+                print(f"Circuit breaker open for {domain} after {failures} consecutive failures")
+                self._open_domains[domain] = time.time()
+
+    def is_open(self, url: str) -> bool:
+        """
+        Check whether the circuit breaker for a URL's domain has tripped.
+
+        Once the cooldown has passed, the first caller is let through as
+        the trial fetch and the circuit is half-open until it is recorded.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            True if fetches to the domain should fail fast
+        """
+        domain = self._domain(url)
+        with self._lock:
+            opened_at = self._open_domains.get(domain)
+            if opened_at is None:
+                return False
+            if domain in self._half_open_domains:
+                return True
+
+            cooldown = Config.CIRCUIT_BREAKER_COOLDOWN_SECONDS
+            if cooldown > 0 and time.time() - opened_at >= cooldown:
+                self._half_open_domains.add(domain)
+                return False
+            return True
+
+    def is_failing(self, url: str) -> bool:
+        """
+        Check whether the last fetch from a URL's domain failed.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            True if the domain's circuit is open or its most recent fetch failed
+        """
+        domain = self._domain(url)
+        with self._lock:
+            return domain in self._open_domains or self._consecutive_failures.get(domain, 0) > 0
+
+    def _percentile(self, latencies, percentile: int) -> float:
+        if len(latencies) == 1:
+            return latencies[0]
+        return statistics.quantiles(latencies, n=100, method="inclusive")[percentile - 1]
+
+    def timeout_ms(self, url: str) -> int:
+        """
+        Get the fetch timeout for a URL's domain.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            Timeout in milliseconds
+        """
+        with self._lock:
+            latencies = list(self._latencies.get(self._domain(url), ()))
+
+        if len(latencies) < MIN_LATENCY_SAMPLES:
+            return Config.FETCH_TIMEOUT_MS
+
+        timeout = self._percentile(latencies, 95) * Config.FETCH_TIMEOUT_MULTIPLIER
+        return int(min(max(timeout, Config.FETCH_MIN_TIMEOUT_MS), Config.FETCH_TIMEOUT_MS))
+
+    def snapshot(self) -> dict:
+        """
+        Get latency statistics and breaker state for every domain seen.
+
+        Returns:
+            Mapping of domain to p50/p95 latency, timeout, failures and breaker state
+        """
+        with self._lock:
+            domains = set(self._latencies) | set(self._consecutive_failures)
+            latencies = {domain: list(self._latencies.get(domain, ())) for domain in domains}
+            failures = dict(self._consecutive_failures)
+            open_domains = set(self._open_domains)
+            half_open_domains = set(self._half_open_domains)
+
+        snapshot = {}
+        for domain in sorted(domains):
+            domain_latencies = latencies[domain]
+            snapshot[domain] = {
+                "p50_ms": round(self._percentile(domain_latencies, 50)) if domain_latencies else None,
+                "p95_ms": round(self._percentile(domain_latencies, 95)) if domain_latencies else None,
+                "timeout_ms": self.timeout_ms(f"https://{domain}/"),
+                "consecutive_failures": failures.get(domain, 0),
+                "circuit_open": domain in open_domains,
+                "circuit_half_open": domain in half_open_domains,
+            }
+        return snapshot
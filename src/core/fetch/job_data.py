@@ -0,0 +1,100 @@
+"""
+Detection of job lists in JSON responses captured while pages render.
+
+Careers single-page apps fetch their jobs from a JSON API. A job list in
+such a response is an array of objects with title and location keys,
+usually with a link to each job too.
+"""
+
+# Key names used by job board APIs, compared without case, "_" or "-"
+TITLE_KEYS = ("title", "jobtitle", "name", "text", "position", "positionname", "postingname")
+LOCATION_KEYS = ("location", "locations", "locationname", "locationstext", "joblocation", "city", "office", "offices")
+URL_KEYS = ("absoluteurl", "hostedurl", "joburl", "applyurl", "url", "externalurl", "canonicalurl", "href",
+            "link", "externalpath", "path")
+DEPARTMENT_KEYS = ("department", "departments", "team", "jobfamily", "function", "category")
+WORK_ARRANGEMENT_KEYS = ("workplacetype", "worktype", "locationtype", "remote", "isremote")
+EMPLOYMENT_TYPE_KEYS = ("employmenttype", "employmenttypes", "jobtype", "commitment", "timetype", "positiontype",
+                        "type")
+
+# Share of an array's objects that must have a title and a location
+MIN_JOB_SHARE = 0.8
+
+# Nesting depth searched for job arrays
+MAX_DEPTH = 6
+
+
+def _normalize_key(key: str) -> str:
+    """Normalize a key name for comparison."""
+    return key.lower().replace("_", "").replace("-", "")
+
+
+def field_value(item: dict, keys: tuple[str, ...]):
+    """
+    Get the first non-empty value of an object under any of the given key names.
+
+    Args:
+        item: Object from a JSON response
+        keys: Normalized key names, most specific first
+
+    Returns:
+        The value, or None if the object has none of the keys
+    """
+    values = {_normalize_key(key): value for key, value in item.items() if isinstance(key, str)}
+    for key in keys:
+        value = values.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _score(items: list) -> float:
+    """Score an array as a job list, 0 if it is not one."""
+    objects = [item for item in items if isinstance(item, dict)]
+    if not objects or len(objects) < len(items) * MIN_JOB_SHARE:
+        return 0
+
+    titled = [item for item in objects
+              if isinstance(field_value(item, TITLE_KEYS), str) and field_value(item, LOCATION_KEYS) is not None]
+    if len(titled) < len(objects) * MIN_JOB_SHARE:
+        return 0
+
+    # Links and departments make an array more likely to be the job list itself
+    bonus = sum(1 for keys in (URL_KEYS, DEPARTMENT_KEYS)
+                if any(field_value(item, keys) is not None for item in titled))
+    return len(titled) * (1 + bonus)
+
+
+def _job_arrays(data, depth: int = 0):
+    """Yield the arrays nested in a JSON value with their scores."""
+    if depth > MAX_DEPTH:
+        return
+    if isinstance(data, list):
+        score = _score(data)
+        if score:
+            yield score, data
+            return
+        for item in data:
+            yield from _job_arrays(item, depth + 1)
+    elif isinstance(data, dict):
+        for value in data.values():
+            yield from _job_arrays(value, depth + 1)
+
+
+def find_job_data(responses: list[tuple[str, object]]) -> tuple[str, list[dict]]:
+    """
+    Pick the job list among captured JSON responses.
+
+    Args:
+        responses: URL and decoded body of each JSON response
+
+    Returns:
+        URL of the response holding the highest scoring job array and the
+        array's objects, or ("", []) if no response holds one
+    """
+    best_url, best_items, best_score = "", [], 0
+    for url, data in responses:
+        for score, items in _job_arrays(data):
+            if score > best_score:
+                best_url, best_items, best_score = url, items, score
+
+    return best_url, [item for item in best_items if isinstance(item, dict)]
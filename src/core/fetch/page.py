@@ -0,0 +1,63 @@
+"""
+Fetched page content and the structured data embedded in it.
+"""
+import json
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class FetchedPage:
+    """
+    Result of fetching a page.
+
+    Attributes:
+        text: Cleaned text content with links formatted as "text (HREF: href)"
+        structured_data: JSON-LD objects embedded in the page, with @graph
+                         containers and top-level arrays flattened
+        region_text: Cleaned text of the job list region, empty if it was
+                     not requested or no job list was found
+        region_selector: CSS selector of the job list region
+        job_data: Job objects from the JSON API response the page rendered
+                  its job list from, empty if none was captured
+        job_data_url: URL of that JSON response
+    """
+    text: str
+    structured_data: list[dict] = field(default_factory=list)
+    region_text: str = ""
+    region_selector: str = ""
+    job_data: list[dict] = field(default_factory=list)
+    job_data_url: str = ""
+
+
+def extract_structured_data(soup) -> list[dict]:
+    """
+    Extract the JSON-LD objects of a parsed page.
+
+    Must run before script tags are removed from the page. Blocks that
+    are not valid JSON are skipped.
+
+    Args:
+        soup: BeautifulSoup of the raw HTML
+
+    Returns:
+        JSON-LD objects in page order
+    """
+    objects = []
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or script.get_text() or "")
+        except ValueError:
+            continue
+
+        pending = data if isinstance(data, list) else [data]
+        while pending:
+            item = pending.pop(0)
+            if isinstance(item, list):
+                pending[:0] = item
+            elif isinstance(item, dict):
+                if "@graph" in item:
+                    pending[:0] = item["@graph"] if isinstance(item["@graph"], list) else [item["@graph"]]
+                else:
+                    objects.append(item)
+
+    return objects
@@ -0,0 +1,232 @@
+"""
+Persistent per-domain browser profiles reused across fetches and runs.
+
+A profile keeps a site's HTTP disk cache, cookies and local storage, so
+repeat visits reuse its scripts, fonts and stylesheets and skip consent
+interstitials that were already accepted.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+from src.utils.config import Config
+
+# Chromium user data directory and saved storage state inside a profile
+USER_DATA_DIR = "user-data"
+STORAGE_STATE_FILE = "storage_state.json"
+
+# Restores local storage saved in the storage state into a fresh profile
+_RESTORE_LOCAL_STORAGE = """
+(origins) => {
+    const items = origins[window.location.origin];
+    if (!items) return;
+    for (const [name, value] of Object.entries(items)) {
+        if (window.localStorage.getItem(name) === null) window.localStorage.setItem(name, value);
+    }
+}
+"""
+
+
+def _directory_size(path: Path) -> int:
+    """Total size in bytes of the files under a directory."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class BrowserProfiles:
+    """
+    Browser profile directories kept per domain under a root directory.
+
+    Each profile holds a Chromium user data directory, with its disk cache
+    capped at Config.BROWSER_PROFILE_CACHE_MB, and the storage state
+    (cookies and local storage) saved after every fetch. When cleanup()
+    evicts a profile's user data to stay under the size cap, its storage
+    state is kept and restored into the next fresh profile. A profile is
+    used by one browser at a time. Thread-safe for concurrent use.
+    """
+
+    def __init__(self, root: str = None, max_mb: int = None, max_age_days: float = None, cache_mb: int = None):
+        """
+        Initialize the profiles and clean up the ones over the limits.
+
+        Args:
+            root: Directory holding the profiles (defaults to Config.BROWSER_PROFILE_DIR)
+            max_mb: Total size cap of the profiles (defaults to Config.BROWSER_PROFILE_MAX_MB)
+            max_age_days: Days after which an unused profile is deleted
+                          (defaults to Config.BROWSER_PROFILE_MAX_AGE_DAYS)
+            cache_mb: Disk cache cap of each profile (defaults to Config.BROWSER_PROFILE_CACHE_MB)
+        """
+        self.root = Path(root or Config.BROWSER_PROFILE_DIR)
+        self.max_bytes = (max_mb if max_mb is not None else Config.BROWSER_PROFILE_MAX_MB) * 1024 * 1024
+        self.max_age_seconds = (max_age_days if max_age_days is not None
+                                else Config.BROWSER_PROFILE_MAX_AGE_DAYS) * 24 * 3600
+        self.cache_bytes = (cache_mb if cache_mb is not None else Config.BROWSER_PROFILE_CACHE_MB) * 1024 * 1024
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        # One lock per domain, a Chromium user data directory cannot be shared by two browsers
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+        # Domains whose profile is open, skipped by cleanup()
+        self._in_use = set()
+
+        self.cleanup()
+
+    def profile_dir(self, url: str) -> Path:
+        """
+        Get the profile directory of a URL's domain.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            Path of the domain's profile
+        """
+        domain = urlparse(url).netloc.lower() or "default"
+        return self.root / domain.replace(":", "_")
+
+    def _lock(self, name: str) -> threading.Lock:
+        """Get the lock of a profile."""
+        with self._locks_lock:
+            return self._locks.setdefault(name, threading.Lock())
+
+    @contextmanager
+    def open(self, playwright, url: str, headless: bool):
+        """
+        Launch a browser on the persistent profile of a URL's domain.
+
+        Waits while another fetch uses the same profile. The storage state
+        is saved when the context exits, before the browser closes.
+
+        Args:
+            playwright: Playwright instance from sync_playwright()
+            url: URL about to be fetched
+            headless: Whether to run the browser without a window
+
+        Yields:
+            Playwright BrowserContext using the profile
+        """
+        profile = self.profile_dir(url)
+        user_data = profile / USER_DATA_DIR
+        state_path = profile / STORAGE_STATE_FILE
+
+        with self._lock(profile.name):
+            with self._locks_lock:
+                self._in_use.add(profile.name)
+            try:
+                fresh = not user_data.exists()
+                profile.mkdir(parents=True, exist_ok=True)
+                context = playwright.chromium.launch_persistent_context(
+                    str(user_data),
+                    headless=headless,
+                    args=[f"--disk-cache-size={self.cache_bytes}"],
+                )
+                try:
+                    if fresh:
+                        self._restore_state(context, state_path)
+                    yield context
+                    self._save_state(context, state_path)
+                finally:
+                    context.close()
+                # Marks the profile as recently used for cleanup
+                os.utime(profile)
+            finally:
+                with self._locks_lock:
+                    self._in_use.discard(profile.name)
+
+    def _restore_state(self, context, state_path: Path):
+        """Load a saved storage state into a context on a fresh profile."""
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+
+        if state.get("cookies"):
+            context.add_cookies(state["cookies"])
+        origins = {
+            origin["origin"]: {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+            for origin in state.get("origins", [])
+        }
+        if origins:
+            context.add_init_script(script=f"({_RESTORE_LOCAL_STORAGE})({json.dumps(origins)})")
+
+    def _save_state(self, context, state_path: Path):
+        """Save a context's storage state, keeping the previous one if it cannot be read."""
+        try:
+            context.storage_state(path=str(state_path))
+        except Exception as e:
+            print(f"Could not save browser storage state to {state_path}: {e}")
+
+    def cleanup(self):
+        """
+        Delete profiles unused for longer than the age limit, then evict the
+        user data of the least recently used profiles until the total size
+        is under the cap. Profiles that are open are left alone.
+        """
+        now = time.time()
+        with self._locks_lock:
+            in_use = set(self._in_use)
+
+        profiles = []
+        for profile in self.root.iterdir():
+            if not profile.is_dir() or profile.name in in_use:
+                continue
+            last_used = profile.stat().st_mtime
+            if self.max_age_seconds and now - last_used > self.max_age_seconds:
+                shutil.rmtree(profile, ignore_errors=True)
+                print(f"Deleted browser profile {profile.name}, unused for {(now - last_used) / 86400:.0f} days")
+                continue
+            profiles.append((last_used, profile, _directory_size(profile)))
+
+        total = sum(size for _, _, size in profiles)
+        if not self.max_bytes or total <= self.max_bytes:
+            return
+
+        for _, profile, size in sorted(profiles, key=lambda entry: entry[0]):
+            user_data = profile / USER_DATA_DIR
+            evicted = _directory_size(user_data)
+            shutil.rmtree(user_data, ignore_errors=True)
+            total -= evicted
+            print(f"Evicted browser profile {profile.name} ({evicted / 1024 / 1024:.1f} MB), keeping its storage state")
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> dict:
+        """
+        Summarize the profiles on disk.
+
+        Returns:
+            Number of profiles and their total size in MB
+        """
+        profiles = [profile for profile in self.root.iterdir() if profile.is_dir()]
+        size = sum(_directory_size(profile) for profile in profiles)
+        return {"profiles": len(profiles), "size_mb": round(size / 1024 / 1024, 1)}
+
+
+# Shared profiles, created on first use
+_browser_profiles = None
+_profiles_lock = threading.Lock()
+
+
+def get_browser_profiles() -> BrowserProfiles:
+    """
+    Get or create the shared browser profiles (lazy singleton).
+
+    Returns:
+        BrowserProfiles instance shared by all fetchers
+    """
+    global _browser_profiles
+    with _profiles_lock:
+        if _browser_profiles is None:
+            _browser_profiles = BrowserProfiles()
+    return _browser_profiles
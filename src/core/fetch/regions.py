@@ -0,0 +1,249 @@
+"""
+Detection of the job list region of careers pages.
+
+Careers pages render their jobs from one template, so the job list shows
+up as sibling elements sharing a tag and classes, each holding a link.
+Sending only that region to the model leaves out navigation, footers,
+benefits blurbs and cookie banners.
+"""
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from src.utils.config import Config
+
+# Share of repeated siblings that must hold a link
+MIN_LINKED_SHARE = 0.8
+
+# Average text length of a job card; shorter repeated links are menus
+MIN_CARD_TEXT = 20
+
+# Card text length beyond which longer cards score no higher
+MAX_CARD_TEXT = 200
+
+# Class names kept in selectors, generated hash-like names are left out
+STABLE_CLASS = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*$")
+
+
+def _signature(tag) -> tuple:
+    """Get the tag name and classes shared by elements rendered from one template."""
+    return tag.name, tuple(sorted(tag.get("class", [])))
+
+
+def _has_link(tag) -> bool:
+    """Check whether an element is or contains a link."""
+    return (tag.name == "a" and bool(tag.get("href"))) or tag.find("a", href=True) is not None
+
+
+def detect_listing_region(soup, min_repeats: int = None):
+    """
+    Find the element holding the largest list of repeated job cards.
+
+    Candidates are groups of at least min_repeats siblings with the same
+    tag and classes, most of which hold a link. Groups score by their size
+    and the text of their cards, so navigation menus with short link text
+    lose to job lists. When the winning list is one of several sibling
+    lists (jobs grouped by department), their common parent is returned.
+
+    Args:
+        soup: BeautifulSoup of the page, without script and style elements
+        min_repeats: Minimum number of repeated siblings
+                     (defaults to Config.LISTING_REGION_MIN_REPEATS)
+
+    Returns:
+        The region's element, or None if the page has no job list
+    """
+    if min_repeats is None:
+        min_repeats = Config.LISTING_REGION_MIN_REPEATS
+
+    best_region, best_score = None, 0
+    for parent in soup.find_all(True):
+        if parent.name == "a":
+            continue
+
+        groups = {}
+        for child in parent.find_all(True, recursive=False):
+            groups.setdefault(_signature(child), []).append(child)
+
+        for members in groups.values():
+            if len(members) < min_repeats:
+                continue
+            linked = [member for member in members if _has_link(member)]
+            if len(linked) < len(members) * MIN_LINKED_SHARE:
+                continue
+
+            average_text = sum(len(member.get_text(" ", strip=True)) for member in linked) / len(linked)
+            if average_text < MIN_CARD_TEXT:
+                continue
+
+            score = len(linked) * min(average_text, MAX_CARD_TEXT)
+            if score > best_score:
+                best_region, best_score = parent, score
+
+    # Widen to the parent of sibling lists rendered from the same template
+    while best_region is not None and best_region.parent is not None and best_region.parent.name != "[document]":
+        siblings = [
+            sibling for sibling in best_region.parent.find_all(True, recursive=False)
+            if sibling is not best_region and _signature(sibling) == _signature(best_region) and _has_link(sibling)
+        ]
+        if not siblings:
+            break
+        best_region = best_region.parent
+
+    return best_region
+
+
+def css_path(tag) -> str:
+    """
+    Build a CSS selector for an element from its ancestors.
+
+    The path stops at the nearest ancestor with an id. Elements without
+    stable classes are told apart from same-named siblings by position.
+
+    Args:
+        tag: Element to build the selector for
+
+    Returns:
+        CSS selector matching the element
+    """
+    from soupsieve import escape
+
+    parts = []
+    for element in [tag, *tag.parents]:
+        if element.name in (None, "[document]"):
+            break
+
+        if element.get("id"):
+            parts.append(f"{element.name}#{escape(element['id'])}")
+            break
+
+        part = element.name
+        classes = [name for name in element.get("class", []) if STABLE_CLASS.match(name)]
+        if classes:
+            part += "".join(f".{name}" for name in classes)
+        elif element.parent is not None:
+            same_name = element.parent.find_all(element.name, recursive=False)
+            if len(same_name) > 1:
+                part += f":nth-of-type({same_name.index(element) + 1})"
+        parts.append(part)
+
+    return " > ".join(reversed(parts))
+
+
+def select_region(soup, selector: str, min_repeats: int = None):
+    """
+    Find a learned job list region on a page.
+
+    Args:
+        soup: BeautifulSoup of the page, without script and style elements
+        selector: CSS selector learned from an earlier fetch
+        min_repeats: Minimum number of links the region must hold
+                     (defaults to Config.LISTING_REGION_MIN_REPEATS)
+
+    Returns:
+        The region's element, or None if the selector no longer matches a job list
+    """
+    if min_repeats is None:
+        min_repeats = Config.LISTING_REGION_MIN_REPEATS
+
+    try:
+        region = soup.select_one(selector)
+    except Exception:
+        return None
+
+    if region is None or len(region.find_all("a", href=True)) < min_repeats:
+        return None
+    return region
+
+
+class ListingRegionCache:
+    """
+    Job list region selectors learned per company, kept between runs.
+
+    Stored as JSON in Config.LISTING_REGION_PATH. Thread-safe for concurrent use.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path of the JSON file (defaults to Config.LISTING_REGION_PATH)
+        """
+        self.path = path or Config.LISTING_REGION_PATH
+        self._lock = threading.Lock()
+        try:
+            with open(self.path) as f:
+                self._selectors = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._selectors = {}
+
+    def _save(self):
+        """Write the selectors to disk (caller holds the lock)."""
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self._selectors, f)
+        os.replace(temp_path, self.path)
+
+    def get(self, company_name: str) -> str:
+        """
+        Get the learned selector of a company.
+
+        Args:
+            company_name: Name of the company
+
+        Returns:
+            CSS selector, or an empty string if none was learned
+        """
+        with self._lock:
+            entry = self._selectors.get(company_name)
+        return entry["selector"] if entry else ""
+
+    def set(self, company_name: str, selector: str):
+        """
+        Remember the selector that gave a company's listings.
+
+        Args:
+            company_name: Name of the company
+            selector: CSS selector of the job list region
+        """
+        with self._lock:
+            entry = self._selectors.get(company_name)
+            if entry is not None and entry["selector"] == selector:
+                return
+            print(f"{company_name}: Learned job list region {selector}")
+            self._selectors[company_name] = {"selector": selector, "since": time.time()}
+            self._save()
+
+    def forget(self, company_name: str):
+        """
+        Drop a company's selector after its region missed the listings.
+
+        Args:
+            company_name: Name of the company
+        """
+        with self._lock:
+            if self._selectors.pop(company_name, None) is not None:
+                self._save()
+
+
+# Shared cache, created on first use
+_region_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_listing_region_cache() -> ListingRegionCache:
+    """
+    Get or create the shared listing region cache (lazy singleton).
+
+    Returns:
+        ListingRegionCache instance shared by all listing scrapers
+    """
+    global _region_cache
+    with _cache_lock:
+        if _region_cache is None:
+            _region_cache = ListingRegionCache()
+    return _region_cache
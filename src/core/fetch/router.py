@@ -0,0 +1,216 @@
+"""
+Fetcher that picks the cheapest browser mode that works for each site.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+from src.core.fetch.base import BaseFetcher
+from src.core.fetch.headed import HeadedFetcher
+from src.core.fetch.headless import HeadlessFetcher
+from src.core.fetch.health import DomainHealth
+from src.core.fetch.page import FetchedPage
+from src.utils.config import Config
+
+HEADLESS = "headless"
+HEADED = "headed"
+
+# Phrases shown by bot walls and interstitials instead of the real page
+BOT_WALL_MARKERS = (
+    "captcha",
+    "verify you are human",
+    "are you a robot",
+    "unusual traffic",
+    "checking your browser",
+    "just a moment",
+    "access denied",
+    "enable javascript",
+)
+
+# Pages longer than this are assumed to be real content even if they mention a marker
+BOT_WALL_MAX_LENGTH = 3000
+
+# Link counts remembered per URL
+MAX_REMEMBERED_URLS = 5000
+
+# Seconds between writes of changed link counts, new modes are written at once
+STATE_SAVE_INTERVAL = 60
+
+
+class RoutingFetcher(BaseFetcher):
+    """
+    Fetcher that tries a headless browser first and escalates to a headed one.
+
+    A headless result is considered degraded when it is empty, looks like a
+    bot wall, or has far fewer links than the last good fetch of the same URL.
+    Degraded results are fetched again headed, and domains that only work
+    headed are remembered in Config.FETCH_MODE_PATH so later fetches and runs
+    go straight to the headed browser. Headed domains are probed headless
+    again after Config.FETCH_MODE_RETRY_DAYS. A changed mode is written at
+    once, changed link counts at most every STATE_SAVE_INTERVAL seconds and
+    when the process exits.
+    """
+
+    def __init__(self, state_path: str = None, health: DomainHealth = None):
+        """
+        Initialize the routing fetcher.
+
+        Args:
+            state_path: Path of the JSON file storing modes per domain
+                        (defaults to Config.FETCH_MODE_PATH)
+            health: Domain health tracker, shared with both browser fetchers
+        """
+        super().__init__(health)
+        self.headless_fetcher = HeadlessFetcher(self.health)
+        self.headed_fetcher = HeadedFetcher(self.health)
+        self.state_path = state_path or Config.FETCH_MODE_PATH
+        self._state_lock = threading.Lock()
+        self._modes, self._link_counts = self._load_state()
+        self._dirty = False
+        self._last_save = time.time()
+        atexit.register(self.save_state)
+
+    def _load_state(self) -> tuple[dict, dict]:
+        """Load stored modes and link counts, starting empty if there are none."""
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+            return state.get("modes", {}), state.get("link_counts", {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}, {}
+
+    def _save_state(self):
+        """Write modes and link counts to disk (caller holds the state lock)."""
+        Path(self.state_path).parent.mkdir(parents=True, exist_ok=True)
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"modes": self._modes, "link_counts": self._link_counts}, f)
+        os.replace(temp_path, self.state_path)
+        self._dirty = False
+        self._last_save = time.time()
+
+    def save_state(self):
+        """Write modes and link counts to disk if they changed since the last write."""
+        with self._state_lock:
+            if self._dirty:
+                self._save_state()
+
+    def mode_for(self, url: str) -> str:
+        """
+        Get the browser mode to use first for a URL.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            "headless" or "headed"
+        """
+        domain = urlparse(url).netloc
+        with self._state_lock:
+            entry = self._modes.get(domain)
+
+        if entry is None or entry["mode"] == HEADLESS:
+            return HEADLESS
+        if time.time() - entry["since"] > Config.FETCH_MODE_RETRY_DAYS * 86400:
+            return HEADLESS
+        return HEADED
+
+    def is_blocked(self, text: str) -> bool:
+        """
+        Check whether a fetched page is empty or a bot wall.
+
+        Args:
+            text: Cleaned text of the page
+
+        Returns:
+            True if the page has no usable content
+        """
+        if not text or not text.strip():
+            return True
+
+        lowered = text.lower()
+        return len(text) < BOT_WALL_MAX_LENGTH and any(marker in lowered for marker in BOT_WALL_MARKERS)
+
+    def is_degraded(self, url: str, text: str) -> bool:
+        """
+        Check whether a fetched page looks broken compared to a real render.
+
+        Args:
+            url: URL that was fetched
+            text: Cleaned text of the page
+
+        Returns:
+            True if the page is empty, a bot wall, or missing most of its links
+        """
+        if self.is_blocked(text):
+            return True
+
+        with self._state_lock:
+            last_link_count = self._link_counts.get(url)
+        if last_link_count:
+            return text.count("(HREF:") < last_link_count * Config.FETCH_DEGRADED_LINK_RATIO
+
+        return False
+
+    def _record_success(self, url: str, text: str, mode: str | None):
+        """Remember the mode that worked for the URL's domain (if any) and the page's link count."""
+        domain = urlparse(url).netloc
+        mode_changed = False
+        with self._state_lock:
+            entry = self._modes.get(domain)
+            if mode is not None:
+                if entry is None or entry["mode"] != mode:
+                    print(f"Fetch mode for {domain}: {mode}")
+                    self._modes[domain] = {"mode": mode, "since": time.time()}
+                    mode_changed = True
+                elif mode == HEADED:
+                    # Headed still needed after a headless probe, wait another retry period
+                    entry["since"] = time.time()
+                    self._dirty = True
+
+            link_count = text.count("(HREF:")
+            if self._link_counts.pop(url, None) != link_count:
+                self._dirty = True
+            self._link_counts[url] = link_count
+            while len(self._link_counts) > MAX_REMEMBERED_URLS:
+                self._link_counts.pop(next(iter(self._link_counts)))
+
+            if mode_changed or (self._dirty and time.time() - self._last_save >= STATE_SAVE_INTERVAL):
+                self._save_state()
+
+    def _fetch_impl(self, url: str, listing_region: str = None) -> FetchedPage:
+        """
+        Fetch a page with the cheapest mode that gives a usable result.
+
+        Args:
+            url: The URL to fetch
+            listing_region: Job list region to extract (see BaseFetcher.fetch_page())
+
+        Returns:
+            Fetched page with cleaned text and JSON-LD data
+        """
+        if self.mode_for(url) == HEADLESS:
+            page = self.headless_fetcher._fetch_impl(url, listing_region)
+            # A job list captured from the site's API is usable however the page rendered
+            if page.job_data or not self.is_degraded(url, page.text):
+                self._record_success(url, page.text, HEADLESS)
+                return page
+            print(f"Headless fetch of {url} looks degraded - retrying headed")
+            headless_page = page
+        else:
+            headless_page = FetchedPage(text="")
+
+        page = self.headed_fetcher._fetch_impl(url, listing_region)
+        if not self.is_degraded(url, page.text):
+            self._record_success(url, page.text, HEADED)
+            return page
+
+        # Both modes look degraded, keep whichever result has more content
+        best_page = page if len(page.text) >= len(headless_page.text) else headless_page
+        if not self.is_blocked(best_page.text):
+            # The page really has fewer links now, use it as the new baseline
+            self._record_success(url, best_page.text, None)
+        return best_page
@@ -0,0 +1,20 @@
+"""
+In-memory indexes over postings.
+"""
+from typing import TYPE_CHECKING
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.index.identity import ListingIdentityIndex
+    from src.core.index.query import PostingIndex, Q, QueryResult
+
+_EXPORTS = {
+    'ListingIdentityIndex': 'src.core.index.identity',
+    'PostingIndex': 'src.core.index.query',
+    'Q': 'src.core.index.query',
+    'QueryResult': 'src.core.index.query',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
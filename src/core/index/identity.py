@@ -0,0 +1,217 @@
+"""
+Fuzzy identity index mapping new listings to existing postings.
+"""
+import re
+import mmh3
+from src.models import Listing, Posting
+from src.utils.config import Config
+
+# Suffixes stripped from title words so "Engineer"/"Engineering" and
+# "Intern"/"Internship" normalize to the same token
+_SUFFIXES = ("ing", "ship", "er", "s")
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _stem(word: str) -> str:
+    """Strip common suffixes until none applies."""
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in _SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+                word = word[:-len(suffix)]
+                stripped = True
+    return word
+
+
+def _as_list(value) -> list[str]:
+    """Older listing-only postings store their locations as one joined string."""
+    if isinstance(value, str):
+        return [value] if value else []
+    return list(value or [])
+
+
+def title_features(title: str) -> frozenset[str]:
+    """
+    Build the normalized feature set of a job title.
+
+    Args:
+        title: Job title
+
+    Returns:
+        Set of stemmed title words
+    """
+    return frozenset(_stem(word) for word in _WORD_PATTERN.findall(title.lower()))
+
+
+def identity_key(locations, terms) -> tuple[frozenset, frozenset]:
+    """
+    Build the part of a listing's identity that must match exactly.
+
+    Args:
+        locations: Locations of the job
+        terms: Terms of the job
+
+    Returns:
+        Normalized term set and location set
+    """
+    return (
+        frozenset(term.lower().strip() for term in _as_list(terms)),
+        frozenset(" ".join(_WORD_PATTERN.findall(location.lower())) for location in _as_list(locations)),
+    )
+
+
+def jaccard(first: frozenset, second: frozenset) -> float:
+    """Jaccard similarity of two feature sets."""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+class ListingIdentityIndex:
+    """
+    Per-company MinHash LSH index over existing postings.
+
+    Listing hashes are exact over LLM-extracted fields, so small extraction
+    differences between runs produce a new posting ID for the same job. This
+    index finds the existing posting a new listing most likely refers to, so
+    the worker can keep that posting instead of scraping and parsing a
+    duplicate and deleting the original.
+
+    Candidates come from LSH buckets over title words, must have exactly the
+    same terms and locations, and are verified with the exact Jaccard
+    similarity of their titles. Terms and locations are left out of the
+    score, where their shared words would outweigh a different title. Each posting can be matched once, so two distinct listings
+    never collapse onto the same posting.
+    """
+
+    def __init__(self, postings: list[Posting] = None, threshold: float = None,
+                 num_perm: int = 32, bands: int = 16):
+        """
+        Initialize the identity index.
+
+        Args:
+            postings: Existing postings to index
+            threshold: Minimum Jaccard similarity of the titles for a match
+                       (defaults to Config.LISTING_MATCH_THRESHOLD)
+            num_perm: Number of MinHash permutations
+            bands: Number of LSH bands (num_perm must be divisible by it)
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold if threshold is not None else Config.LISTING_MATCH_THRESHOLD
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        self._features = {}
+        self._keys = {}
+        self._company = {}
+        self._buckets = {}
+        self._claimed = set()
+
+        for posting in postings or []:
+            self.add(posting)
+
+    def _company_key(self, company: str) -> str:
+        return company.lower().replace(" ", "")
+
+    def _signature(self, features: frozenset) -> list[int]:
+        """Compute the MinHash signature of a feature set."""
+        if not features:
+            return [0] * self.num_perm
+        return [
+            min(mmh3.hash(feature, seed, signed=False) for feature in features)
+            for seed in range(self.num_perm)
+        ]
+
+    def _band_keys(self, company_key: str, features: frozenset) -> list[tuple]:
+        """Compute the LSH bucket keys of a feature set within a company."""
+        signature = self._signature(features)
+        return [
+            (company_key, band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    def add(self, posting: Posting):
+        """
+        Add an existing posting to the index.
+
+        Args:
+            posting: Posting to index
+        """
+        features = title_features(posting.title)
+        company_key = self._company_key(posting.company)
+
+        self._features[posting.id] = features
+        self._keys[posting.id] = identity_key(posting.location, posting.term)
+        self._company[posting.id] = company_key
+        for key in self._band_keys(company_key, features):
+            self._buckets.setdefault(key, set()).add(posting.id)
+
+    def remove(self, posting_id: str):
+        """
+        Remove a posting from the index.
+
+        Args:
+            posting_id: ID of the posting to remove
+        """
+        features = self._features.pop(posting_id, None)
+        if features is None:
+            return
+
+        self._keys.pop(posting_id, None)
+        company_key = self._company.pop(posting_id)
+        for key in self._band_keys(company_key, features):
+            bucket = self._buckets.get(key)
+            if bucket:
+                bucket.discard(posting_id)
+        self._claimed.discard(posting_id)
+
+    def claim(self, posting_id: str):
+        """
+        Mark a posting as matched, e.g. because a listing had its exact ID.
+
+        Args:
+            posting_id: ID of the posting to claim
+        """
+        self._claimed.add(posting_id)
+
+    def match(self, listing: Listing, claim: bool = True) -> str | None:
+        """
+        Find and claim the unclaimed posting most similar to a listing.
+
+        Only postings with the listing's exact terms and locations are
+        considered. Callers should claim every posting whose exact ID was
+        seen before matching, so a listing never takes a posting that its
+        own listing is still present for.
+
+        Args:
+            listing: Listing whose exact ID is not among the existing postings
+            claim: Claim the matched posting (False only looks it up)
+
+        Returns:
+            ID of the matched posting, or None if no posting is similar enough
+        """
+        features = title_features(listing.title)
+        key = identity_key(listing.location, listing.term)
+        company_key = self._company_key(listing.company)
+
+        candidates = set()
+        for band_key in self._band_keys(company_key, features):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        best_id = None
+        best_similarity = self.threshold
+        for posting_id in candidates - self._claimed:
+            if self._keys[posting_id] != key:
+                continue
+            similarity = jaccard(features, self._features[posting_id])
+            if similarity >= best_similarity:
+                best_id = posting_id
+                best_similarity = similarity
+
+        if best_id is not None and claim:
+            self._claimed.add(best_id)
+        return best_id
@@ -0,0 +1,241 @@
+"""
+In-process query engine over postings backed by inverted indexes.
+"""
+import re
+from dataclasses import dataclass
+from pyroaring import BitMap
+from sortedcontainers import SortedList
+from src.models import Posting
+
+# Fields indexed by exact (normalized) value, and whether the posting holds a list
+_VALUE_FIELDS = {
+    "term": True,
+    "location": True,
+    "categories": True,
+    "work_arrangement": False,
+    "company": False,
+    "salary_type": False,
+}
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _normalize(value: str) -> str:
+    return value.strip().lower()
+
+
+def _tokenize(text: str) -> set[str]:
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def _discard(index: dict, key, doc: int) -> bool:
+    """Remove a document from the bitmap of a key, dropping the bitmap once empty."""
+    bitmap = index[key]
+    bitmap.discard(doc)
+    if bitmap:
+        return False
+    del index[key]
+    return True
+
+
+class Q:
+    """
+    Query filter over postings.
+
+    Keyword conditions are combined with AND. A field given a list matches
+    any of its values. Filters combine with & (AND) and | (OR).
+
+    Supported conditions:
+        term, location, categories, work_arrangement, company, salary_type:
+            exact value or list of values (case-insensitive)
+        salary_min, salary_max: inclusive salary bounds
+        title: every word must appear in the title
+
+    Example:
+        Q(term="fall", categories=["software", "data"]) & (Q(company="Stripe") | Q(salary_min=40))
+    """
+
+    def __init__(self, **conditions):
+        unknown = set(conditions) - set(_VALUE_FIELDS) - {"salary_min", "salary_max", "title"}
+        if unknown:
+            raise ValueError(f"Unknown query fields: {', '.join(sorted(unknown))}")
+        self.conditions = conditions
+
+    def __and__(self, other: "Q") -> "Q":
+        return _Combined("and", self, other)
+
+    def __or__(self, other: "Q") -> "Q":
+        return _Combined("or", self, other)
+
+
+class _Combined(Q):
+    def __init__(self, operator: str, left: Q, right: Q):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+
+@dataclass
+class QueryResult:
+    total: int
+    postings: list[Posting]
+
+
+class PostingIndex:
+    """
+    Postings indexed for filtering without scanning.
+
+    Every posting gets an integer document ID. Each field value maps to a
+    bitmap of the documents holding it, distinct salaries are kept sorted
+    with a bitmap each for range filters, and title words map to bitmaps
+    for keyword filters. Filters are evaluated as bitmap intersections and
+    unions, and results are paged in insertion order. Postings can be added
+    and removed at any time; PostingMirror.query() keeps an index in step
+    with the postings the worker creates and deletes.
+    """
+
+    def __init__(self, postings: list[Posting] = None):
+        """
+        Initialize the posting index.
+
+        Args:
+            postings: Postings to index
+        """
+        self._next_doc = 0
+        self._docs = {}
+        self._postings = {}
+        self._all = BitMap()
+        self._values = {field: {} for field in _VALUE_FIELDS}
+        self._titles = {}
+        self._salary_values = SortedList()
+        self._salaries = {}
+
+        for posting in postings or []:
+            self.add(posting)
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def _field_values(self, posting: Posting, field: str) -> set[str]:
+        value = getattr(posting, field)
+        if _VALUE_FIELDS[field] and not isinstance(value, str):
+            return {_normalize(item) for item in value or []}
+        return {_normalize(value)} if value else set()
+
+    def add(self, posting: Posting):
+        """
+        Add a posting, replacing any posting with the same ID.
+
+        Args:
+            posting: Posting to index
+        """
+        if posting.id in self._docs:
+            self.remove(posting.id)
+
+        doc = self._next_doc
+        self._next_doc += 1
+        self._docs[posting.id] = doc
+        self._postings[doc] = posting
+        self._all.add(doc)
+
+        for field, index in self._values.items():
+            for value in self._field_values(posting, field):
+                index.setdefault(value, BitMap()).add(doc)
+        for token in _tokenize(posting.title):
+            self._titles.setdefault(token, BitMap()).add(doc)
+        salary = posting.salary or 0
+        if salary not in self._salaries:
+            self._salaries[salary] = BitMap()
+            self._salary_values.add(salary)
+        self._salaries[salary].add(doc)
+
+    def remove(self, posting_id: str):
+        """
+        Remove a posting from the index.
+
+        Args:
+            posting_id: ID of the posting to remove
+        """
+        doc = self._docs.pop(posting_id, None)
+        if doc is None:
+            return
+
+        posting = self._postings.pop(doc)
+        self._all.discard(doc)
+        # Bitmaps left empty are dropped, so values of deleted postings don't pile up
+        for field, index in self._values.items():
+            for value in self._field_values(posting, field):
+                _discard(index, value, doc)
+        for token in _tokenize(posting.title):
+            _discard(self._titles, token, doc)
+        salary = posting.salary or 0
+        if _discard(self._salaries, salary, doc):
+            self._salary_values.remove(salary)
+
+    def _salary_range(self, salary_min: int | None, salary_max: int | None) -> BitMap:
+        salaries = self._salary_values.irange(salary_min, salary_max)
+        return BitMap.union(BitMap(), *(self._salaries[salary] for salary in salaries))
+
+    def _evaluate(self, query: Q) -> BitMap:
+        if isinstance(query, _Combined):
+            left = self._evaluate(query.left)
+            right = self._evaluate(query.right)
+            return left & right if query.operator == "and" else left | right
+
+        result = self._all
+        conditions = query.conditions
+
+        for field in _VALUE_FIELDS:
+            if field not in conditions:
+                continue
+            values = conditions[field]
+            if isinstance(values, str):
+                values = [values]
+            matches = BitMap()
+            for value in values:
+                matches |= self._values[field].get(_normalize(value), BitMap())
+            result = result & matches
+
+        if "title" in conditions:
+            for token in _tokenize(conditions["title"]):
+                result = result & self._titles.get(token, BitMap())
+
+        if "salary_min" in conditions or "salary_max" in conditions:
+            result = result & self._salary_range(conditions.get("salary_min"), conditions.get("salary_max"))
+
+        return result
+
+    def query(self, query: Q = None, offset: int = 0, limit: int = 50, newest_first: bool = False) -> QueryResult:
+        """
+        Find postings matching a filter.
+
+        Args:
+            query: Filter to apply (all postings when omitted)
+            offset: Number of matching postings to skip
+            limit: Maximum number of postings to return
+            newest_first: Page from the most recently added postings
+
+        Returns:
+            QueryResult with the total number of matches and the requested page
+        """
+        matches = self._evaluate(query) if query is not None else self._all
+        total = len(matches)
+
+        if newest_first:
+            start = max(total - offset - limit, 0)
+            docs = list(reversed(matches[start:max(total - offset, 0)]))
+        else:
+            docs = matches[offset:offset + limit]
+
+        return QueryResult(total=total, postings=[self._postings[doc] for doc in docs])
+
+    def count(self, query: Q = None) -> int:
+        """
+        Count postings matching a filter.
+
+        Args:
+            query: Filter to apply (all postings when omitted)
+
+        Returns:
+            Number of matching postings
+        """
+        return len(self._evaluate(query)) if query is not None else len(self._all)
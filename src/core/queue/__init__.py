@@ -0,0 +1,25 @@
+"""
+Durable work queues shared by worker processes.
+"""
+from typing import TYPE_CHECKING
+from src.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.core.queue.base import BaseWorkQueue, Job, COMPANY_TOPIC, LISTING_TOPIC, FUZZY_LISTING_TOPIC, FINISH_TOPIC
+    from src.core.queue.sqlite import SQLiteWorkQueue
+    from src.core.queue.postgres import PostgresWorkQueue
+
+_EXPORTS = {
+    'BaseWorkQueue': 'src.core.queue.base',
+    'Job': 'src.core.queue.base',
+    'COMPANY_TOPIC': 'src.core.queue.base',
+    'LISTING_TOPIC': 'src.core.queue.base',
+    'FUZZY_LISTING_TOPIC': 'src.core.queue.base',
+    'FINISH_TOPIC': 'src.core.queue.base',
+    'SQLiteWorkQueue': 'src.core.queue.sqlite',
+    'PostgresWorkQueue': 'src.core.queue.postgres',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
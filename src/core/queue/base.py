@@ -0,0 +1,217 @@
+"""
+Base work queue class with lease-based delivery semantics.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import uuid
+from src.utils.config import Config
+
+# Topics used by the worker
+COMPANY_TOPIC = "companies"
+LISTING_TOPIC = "listings"
+# Listings resembling an existing posting, matched once every listing has been parsed
+FUZZY_LISTING_TOPIC = "fuzzy_listings"
+# Single job of the run whose holder matches fuzzy listings and deletes stale postings
+FINISH_TOPIC = "finish"
+
+# Job statuses
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+DEAD = "dead"
+
+
+@dataclass
+class Job:
+    id: int
+    topic: str
+    key: str
+    payload: dict
+    attempts: int
+    lease_token: str
+
+
+class BaseWorkQueue(ABC):
+    """
+    Abstract base class for durable, lease-based work queues.
+
+    Jobs belong to a run and a topic, and are unique by key within them, so
+    several worker processes can seed the same run without duplicating work.
+    A leased job is invisible to other workers until its lease expires, after
+    which it is handed out again. Completion is idempotent: only the holder of
+    the current lease can complete a job, and a completed key is only queued
+    again for the same run through requeue().
+    """
+
+    def __init__(self, run_id: str, lease_seconds: int = None, max_attempts: int = None):
+        """
+        Initialize the work queue.
+
+        Args:
+            run_id: Identifier of the run the jobs belong to
+            lease_seconds: Visibility timeout for leased jobs
+                           (defaults to Config.WORK_QUEUE_LEASE_SECONDS)
+            max_attempts: Leases allowed before a job is marked dead
+                          (defaults to Config.WORK_QUEUE_MAX_ATTEMPTS)
+        """
+        self.run_id = run_id
+        self.lease_seconds = lease_seconds if lease_seconds is not None else Config.WORK_QUEUE_LEASE_SECONDS
+        self.max_attempts = max_attempts if max_attempts is not None else Config.WORK_QUEUE_MAX_ATTEMPTS
+
+    def _new_lease_token(self) -> str:
+        """Create a unique token identifying a single lease."""
+        return uuid.uuid4().hex
+
+    @abstractmethod
+    def put(self, topic: str, key: str, payload: dict) -> bool:
+        """
+        Add a job to the queue unless its key already exists in this run.
+
+        Args:
+            topic: Topic to add the job to
+            key: Unique key of the job within the run and topic
+            payload: JSON-serializable job payload
+
+        Returns:
+            True if the job was added, False if the key was already queued
+        """
+        pass
+
+    @abstractmethod
+    def requeue(self, topic: str, key: str, payload: dict) -> bool:
+        """
+        Add a job to the queue, queuing a key again if its job is done or dead.
+
+        Jobs still pending or leased are left as they are. A re-queued job
+        gets the new payload and its attempts start over.
+
+        Args:
+            topic: Topic to add the job to
+            key: Unique key of the job within the run and topic
+            payload: JSON-serializable job payload
+
+        Returns:
+            True if the job was added or re-queued, False if it is still waiting
+        """
+        pass
+
+    @abstractmethod
+    def lease(self, topic: str) -> Job | None:
+        """
+        Lease the next visible job from a topic.
+
+        Pending jobs and jobs whose lease has expired are visible. Expired
+        jobs that have used up their attempts are marked dead instead.
+
+        Args:
+            topic: Topic to lease from
+
+        Returns:
+            The leased Job, or None if no job is currently visible
+        """
+        pass
+
+    @abstractmethod
+    def extend(self, job: Job) -> bool:
+        """
+        Extend the lease of a job by another lease period.
+
+        Args:
+            job: Job previously returned by lease()
+
+        Returns:
+            True if the lease is still held and was extended
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job: Job) -> bool:
+        """
+        Mark a leased job as done.
+
+        Args:
+            job: Job previously returned by lease()
+
+        Returns:
+            True if the job was completed, False if the lease was lost
+        """
+        pass
+
+    @abstractmethod
+    def release(self, job: Job, count_attempt: bool = True) -> bool:
+        """
+        Give up a leased job after a failure so it can be retried.
+
+        The job is marked dead once it has used up its attempts. Jobs
+        postponed rather than failed (e.g. for budget reasons) are returned
+        without using up the attempt of their lease.
+
+        Args:
+            job: Job previously returned by lease()
+            count_attempt: Whether the lease counts as a failed attempt
+
+        Returns:
+            True if the job was released, False if the lease was lost
+        """
+        pass
+
+    @abstractmethod
+    def counts(self, topic: str) -> dict[str, int]:
+        """
+        Count the jobs of a topic in this run by status.
+
+        Args:
+            topic: Topic to count
+
+        Returns:
+            Mapping of status to number of jobs
+        """
+        pass
+
+    @abstractmethod
+    def keys(self, topic: str) -> set[str]:
+        """
+        Get the keys of every job of a topic in this run, whatever its status.
+
+        Args:
+            topic: Topic to list
+
+        Returns:
+            Set of job keys
+        """
+        pass
+
+    @abstractmethod
+    def prune(self, topic: str) -> int:
+        """
+        Delete the finished jobs of a topic in this run.
+
+        Done and dead jobs are deleted, along with expired leases that have
+        used up their attempts. Queues whose run carries over between runs
+        call this at the start of each run so finished jobs do not pile up.
+
+        Args:
+            topic: Topic to prune
+
+        Returns:
+            Number of jobs deleted
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """Close the underlying connection."""
+        pass
+
+    def is_drained(self, topic: str) -> bool:
+        """
+        Check whether a topic has no pending or leased jobs left.
+
+        Args:
+            topic: Topic to check
+
+        Returns:
+            True if every job of the topic is done or dead
+        """
+        counts = self.counts(topic)
+        return counts.get(PENDING, 0) == 0 and counts.get(LEASED, 0) == 0
@@ -0,0 +1,186 @@
+"""
+Postgres-backed work queue for workers on different machines.
+"""
+import threading
+import time
+import psycopg
+from psycopg.types.json import Jsonb
+from src.core.queue.base import BaseWorkQueue, Job, PENDING, LEASED, DONE, DEAD
+
+
+class PostgresWorkQueue(BaseWorkQueue):
+    """
+    Work queue stored in a Postgres table.
+
+    Leases use SELECT ... FOR UPDATE SKIP LOCKED, so workers on any number
+    of machines can pull from the same run without blocking each other.
+    """
+
+    def __init__(self, dsn: str, run_id: str, lease_seconds: int = None, max_attempts: int = None):
+        """
+        Initialize the Postgres work queue.
+
+        Args:
+            dsn: Postgres connection string
+            run_id: Identifier of the run the jobs belong to
+            lease_seconds: Visibility timeout for leased jobs
+            max_attempts: Leases allowed before a job is marked dead
+        """
+        super().__init__(run_id, lease_seconds, max_attempts)
+        self._lock = threading.Lock()
+        self._conn = psycopg.connect(dsn, autocommit=True)
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create the jobs table if it does not exist."""
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS work_queue_jobs (
+                    id BIGSERIAL PRIMARY KEY,
+                    run_id TEXT NOT NULL,
+                    topic TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    payload JSONB NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease_token TEXT,
+                    leased_until DOUBLE PRECISION,
+                    UNIQUE (run_id, topic, key)
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS work_queue_jobs_visible "
+                "ON work_queue_jobs (run_id, topic, status, id)"
+            )
+
+    def put(self, topic: str, key: str, payload: dict) -> bool:
+        """Add a job to the queue unless its key already exists in this run."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO work_queue_jobs (run_id, topic, key, payload, status) "
+                "VALUES (%s, %s, %s, %s, %s) ON CONFLICT (run_id, topic, key) DO NOTHING",
+                (self.run_id, topic, key, Jsonb(payload), PENDING),
+            )
+            return cursor.rowcount > 0
+
+    def requeue(self, topic: str, key: str, payload: dict) -> bool:
+        """Add a job to the queue, queuing a key again if its job is done or dead."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO work_queue_jobs AS jobs (run_id, topic, key, payload, status) "
+                "VALUES (%s, %s, %s, %s, %s) ON CONFLICT (run_id, topic, key) DO UPDATE "
+                "SET payload = EXCLUDED.payload, status = EXCLUDED.status, attempts = 0, "
+                "lease_token = NULL, leased_until = NULL WHERE jobs.status IN (%s, %s)",
+                (self.run_id, topic, key, Jsonb(payload), PENDING, DONE, DEAD),
+            )
+            return cursor.rowcount > 0
+
+    def lease(self, topic: str) -> Job | None:
+        """Lease the next visible job from a topic."""
+        now = time.time()
+        token = self._new_lease_token()
+
+        with self._lock:
+            with self._conn.transaction():
+                # Expired leases that used up their attempts are not retried
+                self._conn.execute(
+                    "UPDATE work_queue_jobs SET status = %s, lease_token = NULL "
+                    "WHERE run_id = %s AND topic = %s AND status = %s AND leased_until < %s AND attempts >= %s",
+                    (DEAD, self.run_id, topic, LEASED, now, self.max_attempts),
+                )
+
+                row = self._conn.execute(
+                    """
+                    UPDATE work_queue_jobs
+                    SET status = %s, attempts = attempts + 1, lease_token = %s, leased_until = %s
+                    WHERE id = (
+                        SELECT id FROM work_queue_jobs
+                        WHERE run_id = %s AND topic = %s
+                          AND (status = %s OR (status = %s AND leased_until < %s))
+                        ORDER BY id
+                        LIMIT 1
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, key, payload, attempts
+                    """,
+                    (LEASED, token, now + self.lease_seconds, self.run_id, topic, PENDING, LEASED, now),
+                ).fetchone()
+
+        if row is None:
+            return None
+
+        job_id, key, payload, attempts = row
+        return Job(
+            id=job_id,
+            topic=topic,
+            key=key,
+            payload=payload,
+            attempts=attempts,
+            lease_token=token,
+        )
+
+    def extend(self, job: Job) -> bool:
+        """Extend the lease of a job by another lease period."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE work_queue_jobs SET leased_until = %s WHERE id = %s AND status = %s AND lease_token = %s",
+                (time.time() + self.lease_seconds, job.id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount > 0
+
+    def complete(self, job: Job) -> bool:
+        """Mark a leased job as done."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE work_queue_jobs SET status = %s, lease_token = NULL, leased_until = NULL "
+                "WHERE id = %s AND status = %s AND lease_token = %s",
+                (DONE, job.id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount > 0
+
+    def release(self, job: Job, count_attempt: bool = True) -> bool:
+        """Give up a leased job after a failure so it can be retried."""
+        status = DEAD if count_attempt and job.attempts >= self.max_attempts else PENDING
+        attempts = job.attempts if count_attempt else job.attempts - 1
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE work_queue_jobs SET status = %s, attempts = %s, lease_token = NULL, leased_until = NULL "
+                "WHERE id = %s AND status = %s AND lease_token = %s",
+                (status, attempts, job.id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount > 0
+
+    def counts(self, topic: str) -> dict[str, int]:
+        """Count the jobs of a topic in this run by status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM work_queue_jobs WHERE run_id = %s AND topic = %s GROUP BY status",
+                (self.run_id, topic),
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def keys(self, topic: str) -> set[str]:
+        """Get the keys of every job of a topic in this run."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM work_queue_jobs WHERE run_id = %s AND topic = %s",
+                (self.run_id, topic),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def prune(self, topic: str) -> int:
+        """Delete the finished jobs of a topic in this run."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM work_queue_jobs WHERE run_id = %s AND topic = %s "
+                "AND (status IN (%s, %s) OR (status = %s AND leased_until < %s AND attempts >= %s))",
+                (self.run_id, topic, DONE, DEAD, LEASED, time.time(), self.max_attempts),
+            )
+            return cursor.rowcount
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
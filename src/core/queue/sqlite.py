@@ -0,0 +1,187 @@
+"""
+SQLite-backed work queue for workers sharing a local file.
+"""
+import json
+import sqlite3
+import threading
+import time
+from src.core.queue.base import BaseWorkQueue, Job, PENDING, LEASED, DONE, DEAD
+
+
+class SQLiteWorkQueue(BaseWorkQueue):
+    """
+    Work queue stored in a SQLite database file.
+
+    Leases are taken inside an immediate transaction, so any number of
+    processes on the same machine can share one database file.
+    """
+
+    def __init__(self, path: str, run_id: str, lease_seconds: int = None, max_attempts: int = None):
+        """
+        Initialize the SQLite work queue.
+
+        Args:
+            path: Path of the SQLite database file
+            run_id: Identifier of the run the jobs belong to
+            lease_seconds: Visibility timeout for leased jobs
+            max_attempts: Leases allowed before a job is marked dead
+        """
+        super().__init__(run_id, lease_seconds, max_attempts)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create the jobs table if it does not exist."""
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT NOT NULL,
+                    topic TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease_token TEXT,
+                    leased_until REAL,
+                    UNIQUE (run_id, topic, key)
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_visible ON jobs (run_id, topic, status, id)"
+            )
+
+    def put(self, topic: str, key: str, payload: dict) -> bool:
+        """Add a job to the queue unless its key already exists in this run."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (run_id, topic, key, payload, status) VALUES (?, ?, ?, ?, ?)",
+                (self.run_id, topic, key, json.dumps(payload), PENDING),
+            )
+            return cursor.rowcount > 0
+
+    def requeue(self, topic: str, key: str, payload: dict) -> bool:
+        """Add a job to the queue, queuing a key again if its job is done or dead."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (run_id, topic, key, payload, status) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (run_id, topic, key) DO UPDATE SET payload = excluded.payload, status = excluded.status, "
+                "attempts = 0, lease_token = NULL, leased_until = NULL WHERE status IN (?, ?)",
+                (self.run_id, topic, key, json.dumps(payload), PENDING, DONE, DEAD),
+            )
+            return cursor.rowcount > 0
+
+    def lease(self, topic: str) -> Job | None:
+        """Lease the next visible job from a topic."""
+        now = time.time()
+        token = self._new_lease_token()
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Expired leases that used up their attempts are not retried
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, lease_token = NULL "
+                    "WHERE run_id = ? AND topic = ? AND status = ? AND leased_until < ? AND attempts >= ?",
+                    (DEAD, self.run_id, topic, LEASED, now, self.max_attempts),
+                )
+
+                row = self._conn.execute(
+                    "SELECT id, key, payload, attempts FROM jobs "
+                    "WHERE run_id = ? AND topic = ? AND (status = ? OR (status = ? AND leased_until < ?)) "
+                    "ORDER BY id LIMIT 1",
+                    (self.run_id, topic, PENDING, LEASED, now),
+                ).fetchone()
+
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                job_id, key, payload, attempts = row
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = ?, lease_token = ?, leased_until = ? WHERE id = ?",
+                    (LEASED, attempts + 1, token, now + self.lease_seconds, job_id),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return Job(
+            id=job_id,
+            topic=topic,
+            key=key,
+            payload=json.loads(payload),
+            attempts=attempts + 1,
+            lease_token=token,
+        )
+
+    def extend(self, job: Job) -> bool:
+        """Extend the lease of a job by another lease period."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET leased_until = ? WHERE id = ? AND status = ? AND lease_token = ?",
+                (time.time() + self.lease_seconds, job.id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount > 0
+
+    def complete(self, job: Job) -> bool:
+        """Mark a leased job as done."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, lease_token = NULL, leased_until = NULL "
+                "WHERE id = ? AND status = ? AND lease_token = ?",
+                (DONE, job.id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount > 0
+
+    def release(self, job: Job, count_attempt: bool = True) -> bool:
+        """Give up a leased job after a failure so it can be retried."""
+        status = DEAD if count_attempt and job.attempts >= self.max_attempts else PENDING
+        attempts = job.attempts if count_attempt else job.attempts - 1
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = ?, lease_token = NULL, leased_until = NULL "
+                "WHERE id = ? AND status = ? AND lease_token = ?",
+                (status, attempts, job.id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount > 0
+
+    def counts(self, topic: str) -> dict[str, int]:
+        """Count the jobs of a topic in this run by status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs WHERE run_id = ? AND topic = ? GROUP BY status",
+                (self.run_id, topic),
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def keys(self, topic: str) -> set[str]:
+        """Get the keys of every job of a topic in this run."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM jobs WHERE run_id = ? AND topic = ?",
+                (self.run_id, topic),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def prune(self, topic: str) -> int:
+        """Delete the finished jobs of a topic in this run."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE run_id = ? AND topic = ? "
+                "AND (status IN (?, ?) OR (status = ? AND leased_until < ? AND attempts >= ?))",
+                (self.run_id, topic, DONE, DEAD, LEASED, time.time(), self.max_attempts),
+            )
+            return cursor.rowcount
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,4 +1,19 @@
-from .company import CompanyRepository
-from .posting import PostingRepository
+from typing import TYPE_CHECKING
+from src.utils.lazy import lazy_exports
 
-__all__ = ["CompanyRepository", "PostingRepository"]
+if TYPE_CHECKING:
+    from src.core.repository.company import CompanyRepository
+    from src.core.repository.company_catalog import CompanyCatalog
+    from src.core.repository.posting import PostingRepository
+    from src.core.repository.posting_mirror import PostingMirror
+
+_EXPORTS = {
+    'CompanyRepository': 'src.core.repository.company',
+    'CompanyCatalog': 'src.core.repository.company_catalog',
+    'PostingRepository': 'src.core.repository.posting',
+    'PostingMirror': 'src.core.repository.posting_mirror',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
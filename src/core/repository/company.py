@@ -1,17 +1,19 @@
-from supabase import create_client, Client
+import uuid
+from supabase import Client
 from src.models import Company
 from src.utils.config import Config
 
+# Metadata row bumped whenever the Companies table is changed through sync()
+CATALOG_VERSION_KEY = "companies_version"
+
 
 class CompanyRepository:
     """Repository for managing companies in Supabase."""
 
     def __init__(self):
-        if not Config.SUPABASE_URL or not Config.SUPABASE_KEY:
-            raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
-
-        self.client: Client = create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+        self.client: Client = Config.get_supabase_client()
         self.table_name = "Companies"
+        self.metadata_table_name = "Metadata"
 
     def get_all(self) -> list[Company]:
         """Get all companies from Supabase."""
@@ -37,15 +39,124 @@ class CompanyRepository:
 
     def create(self, company: Company) -> Company:
         """Create a new company in Supabase."""
-        company_dict = {
+        response = self.client.table(self.table_name).insert(self._to_row(company)).execute()
+
+        if response.data and len(response.data) > 0:
+            return Company(**response.data[0])
+        return company
+
+    def _to_row(self, company: Company) -> dict:
+        return {
             "name": company.name,
             "url": company.url,
             "paged": company.paged,
             "page_query_param": company.page_query_param,
         }
 
-        response = self.client.table(self.table_name).insert(company_dict).execute()
+    def bulk_create(self, companies: list[Company], batch_size: int = 1000) -> list[Company]:
+        """Create multiple companies in batches."""
+        created = []
+
+        for i in range(0, len(companies), batch_size):
+            rows = [self._to_row(company) for company in companies[i:i + batch_size]]
+            response = self.client.table(self.table_name).insert(rows).execute()
+            created.extend(Company(**company_dict) for company_dict in response.data)
+
+        return created
+
+    def bulk_update(self, companies: list[Company], batch_size: int = 1000) -> int:
+        """Update multiple existing companies by ID in batches."""
+        total_updated = 0
+
+        for i in range(0, len(companies), batch_size):
+            rows = [{"id": company.id, **self._to_row(company)} for company in companies[i:i + batch_size]]
+            response = self.client.table(self.table_name).upsert(rows, on_conflict="id").execute()
+            total_updated += len(response.data)
+
+        return total_updated
+
+    def bulk_delete(self, company_ids: list[str], batch_size: int = 1000) -> int:
+        """Delete multiple companies by IDs in batches."""
+        total_deleted = 0
+
+        for i in range(0, len(company_ids), batch_size):
+            batch = company_ids[i:i + batch_size]
+            response = self.client.table(self.table_name).delete().in_("id", batch).execute()
+            total_deleted += len(response.data)
+
+        return total_deleted
+
+    def get_version(self) -> str | None:
+        """
+        Get the version stamp of the Companies table.
+
+        Returns:
+            Version stamp, or None if no stamp has been recorded
+            (or the Metadata table does not exist)
+        """
+        try:
+            response = (
+                self.client.table(self.metadata_table_name)
+                .select("value")
+                .eq("key", CATALOG_VERSION_KEY)
+                .execute()
+            )
+        except Exception as e:
+            print(f"Could not read company catalog version: {e}")
+            return None
 
         if response.data and len(response.data) > 0:
-            return Company(**response.data[0])
-        return company
+            return response.data[0]["value"]
+        return None
+
+    def bump_version(self) -> str:
+        """Record a new version stamp for the Companies table."""
+        version = uuid.uuid4().hex
+        self.client.table(self.metadata_table_name).upsert(
+            {"key": CATALOG_VERSION_KEY, "value": version}, on_conflict="key"
+        ).execute()
+        return version
+
+    def sync(self, companies: list[Company], delete: bool = True, dry_run: bool = False) -> dict:
+        """
+        Make the Companies table match a list of companies, matched by name.
+
+        New companies are inserted and changed ones updated in bulk, companies
+        missing from the list are deleted in bulk, and the version stamp is
+        bumped if anything changed so cached catalogs refresh.
+
+        Args:
+            companies: Desired companies
+            delete: Delete companies that are not in the list
+            dry_run: Only compute the changes without applying them
+
+        Returns:
+            Dict with the "created", "updated" and "deleted" companies
+        """
+        existing_by_name = {company.name: company for company in self.get_all()}
+        desired_names = {company.name for company in companies}
+
+        to_create = [company for company in companies if company.name not in existing_by_name]
+        to_update = [
+            Company(**{**self._to_row(company), "id": existing_by_name[company.name].id})
+            for company in companies
+            if company.name in existing_by_name
+            and self._to_row(company) != self._to_row(existing_by_name[company.name])
+        ]
+        to_delete = [
+            company for name, company in existing_by_name.items() if name not in desired_names
+        ] if delete else []
+
+        changes = {"created": to_create, "updated": to_update, "deleted": to_delete}
+        if dry_run or not any(changes.values()):
+            return changes
+
+        if to_create:
+            self.bulk_create(to_create)
+        if to_update:
+            self.bulk_update(to_update)
+        if to_delete:
+            self.bulk_delete([company.id for company in to_delete])
+        self.bump_version()
+
+        return changes
@@ -0,0 +1,74 @@
+import json
+import os
+import time
+from pathlib import Path
+from src.models import Company
+from src.utils.config import Config
+from .company import CompanyRepository
+
+
+class CompanyCatalog:
+    """
+    Locally cached copy of the Companies table.
+
+    The cache is keyed by the version stamp that CompanyRepository.sync()
+    bumps on every change, so a run only reads the stamp and reuses the
+    cached companies while it is unchanged. The whole table is read again
+    when the stamp changes, when no stamp exists, or once
+    Config.COMPANY_CATALOG_REFRESH_HOURS have passed, which picks up edits
+    made to the table directly.
+    """
+
+    def __init__(self, repository: CompanyRepository = None, path: str = None):
+        """
+        Initialize the company catalog.
+
+        Args:
+            repository: Repository to read companies from (created if not provided)
+            path: Path of the JSON cache file (defaults to Config.COMPANY_CATALOG_PATH)
+        """
+        self.repository = repository or CompanyRepository()
+        self.path = path or Config.COMPANY_CATALOG_PATH
+
+    def _load(self) -> dict | None:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _save(self, version: str | None, companies: list[Company]):
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({
+                "version": version,
+                "fetched_at": time.time(),
+                "companies": [
+                    {
+                        "name": company.name,
+                        "url": company.url,
+                        "paged": company.paged,
+                        "page_query_param": company.page_query_param,
+                        "id": company.id,
+                    }
+                    for company in companies
+                ],
+            }, f)
+        os.replace(temp_path, self.path)
+
+    def get_all(self) -> list[Company]:
+        """Get all companies, from the local cache when its version is current."""
+        version = self.repository.get_version()
+        cache = self._load()
+
+        if cache is not None and version is not None and cache["version"] == version:
+            age_hours = (time.time() - cache["fetched_at"]) / 3600
+            if age_hours < Config.COMPANY_CATALOG_REFRESH_HOURS:
+                print(f"Company catalog: using cached version {version}")
+                return [Company(**company_dict) for company_dict in cache["companies"]]
+
+        companies = self.repository.get_all()
+        self._save(version, companies)
+        print(f"Company catalog: loaded {len(companies)} companies (version {version})")
+        return companies
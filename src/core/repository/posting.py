@@ -1,5 +1,5 @@
 from datetime import datetime
-from supabase import create_client, Client
+from supabase import Client
 from src.models import Posting
 from src.utils.config import Config
 
@@ -8,10 +8,7 @@ class PostingRepository:
     """Repository for managing postings in Supabase."""
 
     def __init__(self):
-        if not Config.SUPABASE_URL or not Config.SUPABASE_KEY:
-            raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
-
-        self.client: Client = create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+        self.client: Client = Config.get_supabase_client()
         self.table_name = "Postings"
 
     def _normalize_posting_data(self, data: dict) -> dict:
@@ -31,12 +28,76 @@ class PostingRepository:
 
         return normalized
 
-    def get_all(self) -> list[Posting]:
-        
-        """Get all postings from Supabase."""
-        response = self.client.table(self.table_name).select("*").execute()
+    def get_all(self, batch_size: int = 1000) -> list[Posting]:
+        """Get all postings from Supabase, paging past the API row limit."""
+        postings = []
+        offset = 0
+
+        while True:
+            response = (
+                self.client.table(self.table_name)
+                .select("*")
+                .order("id")
+                .range(offset, offset + batch_size - 1)
+                .execute()
+            )
+            postings.extend(Posting(**self._normalize_posting_data(posting_dict)) for posting_dict in response.data)
+
+            if len(response.data) < batch_size:
+                return postings
+            offset += batch_size
+
+    def get_since(self, timestamp: int, batch_size: int = 1000) -> list[Posting]:
+        """Get postings dated at or after a Unix timestamp, oldest first."""
+        since_iso = datetime.fromtimestamp(timestamp).isoformat()
+        postings = []
+        offset = 0
+
+        while True:
+            response = (
+                self.client.table(self.table_name)
+                .select("*")
+                .gte("date", since_iso)
+                .order("date")
+                .order("id")
+                .range(offset, offset + batch_size - 1)
+                .execute()
+            )
+            postings.extend(Posting(**self._normalize_posting_data(posting_dict)) for posting_dict in response.data)
+
+            if len(response.data) < batch_size:
+                return postings
+            offset += batch_size
+
+    def get_ids(self, batch_size: int = 1000) -> set[str]:
+        """Get the IDs of all postings in Supabase, paging past the API row limit."""
+        posting_ids = set()
+        offset = 0
+
+        while True:
+            response = (
+                self.client.table(self.table_name)
+                .select("id")
+                .order("id")
+                .range(offset, offset + batch_size - 1)
+                .execute()
+            )
+            posting_ids.update(row["id"] for row in response.data)
+
+            if len(response.data) < batch_size:
+                return posting_ids
+            offset += batch_size
+
+    def get_by_ids(self, posting_ids: list[str], batch_size: int = 500) -> list[Posting]:
+        """Get the postings with the given IDs from Supabase, in batches."""
+        postings = []
+
+        for i in range(0, len(posting_ids), batch_size):
+            batch = posting_ids[i:i + batch_size]
+            response = self.client.table(self.table_name).select("*").in_("id", batch).execute()
+            postings.extend(Posting(**self._normalize_posting_data(posting_dict)) for posting_dict in response.data)
 
-        return [Posting(**self._normalize_posting_data(posting_dict)) for posting_dict in response.data]
+        return postings
 
     def get_by_id(self, posting_id: str) -> Posting | None:
         """Get a posting by ID from Supabase."""
@@ -46,14 +107,14 @@ class PostingRepository:
             return Posting(**self._normalize_posting_data(response.data[0]))
         return None
 
-    def create(self, posting: Posting) -> Posting:
-        """Create a new posting in Supabase."""
+    def _to_row(self, posting: Posting) -> dict:
+        """Convert a posting to a Supabase row."""
         # Convert Unix timestamp to ISO format for Supabase
         date_iso = None
         if posting.date > 0:
             date_iso = datetime.fromtimestamp(posting.date).isoformat()
 
-        posting_dict = {
+        return {
             "id": posting.id,
             "title": posting.title,
             "location": posting.location,
@@ -67,12 +128,22 @@ class PostingRepository:
             "date": date_iso,
         }
 
-        response = self.client.table(self.table_name).insert(posting_dict).execute()
+    def create(self, posting: Posting) -> Posting:
+        """Create a new posting in Supabase."""
+        response = self.client.table(self.table_name).insert(self._to_row(posting)).execute()
 
         if response.data and len(response.data) > 0:
             return Posting(**self._normalize_posting_data(response.data[0]))
         return posting
 
+    def update(self, posting: Posting) -> Posting | None:
+        """Replace the fields of an existing posting in Supabase, returning None if it no longer exists."""
+        response = self.client.table(self.table_name).update(self._to_row(posting)).eq("id", posting.id).execute()
+
+        if response.data and len(response.data) > 0:
+            return Posting(**self._normalize_posting_data(response.data[0]))
+        return None
+
     def bulk_delete(self, posting_ids: list[str], batch_size: int = 1000) -> int:
         """Delete multiple postings by IDs in batches."""
         total_deleted = 0
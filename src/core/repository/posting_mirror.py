@@ -0,0 +1,288 @@
+"""
+Local SQLite mirror of the Postings table, kept in sync with Supabase.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from src.core.index.query import PostingIndex, Q, QueryResult
+from src.models import Posting
+from src.utils.config import Config
+from .posting import PostingRepository
+
+
+class PostingMirror:
+    """
+    Local SQLite replica of the Postings table.
+
+    The first sync loads the whole table. Later syncs compare the mirror's
+    IDs with Supabase's, pulling postings other writers created and dropping
+    ones they deleted, and pull postings dated at or after the stored
+    watermark for changes to existing rows. Dates are set when a listing is
+    parsed rather than when its row is inserted, so the watermark alone
+    would miss rows written late by other workers. A full reload runs again
+    once Config.POSTING_MIRROR_FULL_SYNC_HOURS have passed. Creates and
+    deletes made through the mirror are written to Supabase first and then
+    to the local copy.
+
+    Exposes the same read and write methods as PostingRepository, so the
+    worker can use either one. query() filters the mirrored postings through
+    a PostingIndex that syncs, creates and deletes keep up to date.
+    """
+
+    def __init__(self, repository: PostingRepository = None, path: str = None):
+        """
+        Initialize the posting mirror.
+
+        Args:
+            repository: Repository to mirror (created if not provided)
+            path: Path of the SQLite file (defaults to Config.POSTING_MIRROR_PATH)
+        """
+        self.repository = repository or PostingRepository()
+        self.path = path or Config.POSTING_MIRROR_PATH
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Query index over the mirrored postings, built on the first query()
+        self._index = None
+        self._index_lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create the mirror tables and indexes if they do not exist."""
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS postings (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    work_arrangement TEXT NOT NULL,
+                    salary INTEGER NOT NULL,
+                    salary_type TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    term TEXT NOT NULL,
+                    categories TEXT NOT NULL,
+                    company TEXT NOT NULL,
+                    date INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS postings_company ON postings (company);
+                CREATE INDEX IF NOT EXISTS postings_date ON postings (date, id);
+                CREATE TABLE IF NOT EXISTS posting_terms (
+                    posting_id TEXT NOT NULL,
+                    term TEXT NOT NULL,
+                    PRIMARY KEY (term, posting_id)
+                );
+                CREATE INDEX IF NOT EXISTS posting_terms_posting ON posting_terms (posting_id);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    key TEXT PRIMARY KEY,
+                    value REAL NOT NULL
+                );
+                """
+            )
+
+    def _get_state(self, key: str) -> float | None:
+        row = self._conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: float):
+        self._conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+    def _upsert_rows(self, postings: list[Posting]):
+        """Insert or replace postings and their term index entries (caller holds the lock)."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO postings "
+            "(id, title, location, work_arrangement, salary, salary_type, url, term, categories, company, date) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    posting.id,
+                    posting.title,
+                    json.dumps(posting.location),
+                    posting.work_arrangement or "",
+                    posting.salary or 0,
+                    posting.salary_type or "",
+                    posting.url or "",
+                    json.dumps(posting.term),
+                    json.dumps(posting.categories),
+                    posting.company,
+                    posting.date or 0,
+                )
+                for posting in postings
+            ],
+        )
+        self._conn.executemany(
+            "DELETE FROM posting_terms WHERE posting_id = ?",
+            [(posting.id,) for posting in postings],
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO posting_terms (posting_id, term) VALUES (?, ?)",
+            [(posting.id, term) for posting in postings for term in (posting.term or [])],
+        )
+
+    def _row_to_posting(self, row) -> Posting:
+        return Posting(
+            id=row[0],
+            title=row[1],
+            location=json.loads(row[2]),
+            work_arrangement=row[3],
+            salary=row[4],
+            salary_type=row[5],
+            url=row[6],
+            term=json.loads(row[7]),
+            categories=json.loads(row[8]),
+            company=row[9],
+            date=row[10],
+        )
+
+    def _select(self, where: str = "", params: tuple = ()) -> list[Posting]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, title, location, work_arrangement, salary, salary_type, url, term, categories, company, date "
+                f"FROM postings {where}",
+                params,
+            ).fetchall()
+        return [self._row_to_posting(row) for row in rows]
+
+    def sync(self, full: bool = False) -> int:
+        """
+        Bring the mirror up to date with Supabase.
+
+        Args:
+            full: Force a full reload instead of an incremental pull
+
+        Returns:
+            Number of postings pulled from Supabase
+        """
+        with self._lock:
+            watermark = self._get_state("watermark")
+            last_full_sync = self._get_state("last_full_sync") or 0
+
+        full_sync_due = time.time() - last_full_sync > Config.POSTING_MIRROR_FULL_SYNC_HOURS * 3600
+        if full or watermark is None or full_sync_due:
+            postings = self.repository.get_all()
+            with self._lock:
+                self._conn.execute("BEGIN")
+                self._conn.execute("DELETE FROM postings")
+                self._conn.execute("DELETE FROM posting_terms")
+                self._upsert_rows(postings)
+                self._set_state("watermark", max((posting.date for posting in postings), default=0))
+                self._set_state("last_full_sync", time.time())
+                self._conn.execute("COMMIT")
+            self._reset_index()
+            print(f"Posting mirror: full load of {len(postings)} postings")
+            return len(postings)
+
+        # Reconcile IDs first, rows of other writers may be dated before the watermark
+        remote_ids = self.repository.get_ids()
+        local_ids = self.get_ids()
+        deleted_ids = [(posting_id,) for posting_id in local_ids - remote_ids]
+        postings = self.repository.get_by_ids(sorted(remote_ids - local_ids))
+        updated = [posting for posting in self.repository.get_since(int(watermark)) if posting.id in remote_ids]
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("DELETE FROM postings WHERE id = ?", deleted_ids)
+            self._conn.executemany("DELETE FROM posting_terms WHERE posting_id = ?", deleted_ids)
+            self._upsert_rows(postings + updated)
+            self._set_state("watermark", max([watermark] + [posting.date for posting in postings + updated]))
+            self._conn.execute("COMMIT")
+        self._update_index(postings + updated, [posting_id for posting_id, in deleted_ids])
+        print(f"Posting mirror: pulled {len(postings)} new and {len(updated)} recent postings, "
+              f"dropped {len(deleted_ids)} deleted ones")
+        return len(postings) + len(updated)
+
+    def _reset_index(self):
+        """Drop the query index, it is rebuilt from the mirror on the next query()."""
+        with self._index_lock:
+            self._index = None
+
+    def _update_index(self, postings: list[Posting] = (), deleted_ids: list[str] = ()):
+        """Apply created, updated and deleted postings to the query index if it is built."""
+        with self._index_lock:
+            if self._index is None:
+                return
+            for posting in postings:
+                self._index.add(posting)
+            for posting_id in deleted_ids:
+                self._index.remove(posting_id)
+
+    def query(self, query: Q = None, offset: int = 0, limit: int = 50, newest_first: bool = False) -> QueryResult:
+        """
+        Find mirrored postings matching a filter, see PostingIndex.query().
+
+        Args:
+            query: Filter to apply (all postings when omitted)
+            offset: Number of matching postings to skip
+            limit: Maximum number of postings to return
+            newest_first: Page from the most recently added postings
+
+        Returns:
+            QueryResult with the total number of matches and the requested page
+        """
+        with self._index_lock:
+            if self._index is None:
+                self._index = PostingIndex(self.get_all())
+            return self._index.query(query, offset, limit, newest_first)
+
+    def get_all(self) -> list[Posting]:
+        """Get all postings from the mirror."""
+        return self._select()
+
+    def get_by_id(self, posting_id: str) -> Posting | None:
+        """Get a posting by ID from the mirror."""
+        postings = self._select("WHERE id = ?", (posting_id,))
+        return postings[0] if postings else None
+
+    def get_ids(self) -> set[str]:
+        """Get the IDs of all postings in the mirror."""
+        with self._lock:
+            rows = self._conn.execute("SELECT id FROM postings").fetchall()
+        return {row[0] for row in rows}
+
+    def exists(self, posting_id: str) -> bool:
+        """Check whether a posting ID is in the mirror."""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM postings WHERE id = ?", (posting_id,)).fetchone()
+        return row is not None
+
+    def get_by_company(self, company: str) -> list[Posting]:
+        """Get all postings of a company from the mirror."""
+        return self._select("WHERE company = ?", (company,))
+
+    def get_by_term(self, term: str) -> list[Posting]:
+        """Get all postings for a term from the mirror."""
+        return self._select("WHERE id IN (SELECT posting_id FROM posting_terms WHERE term = ?)", (term,))
+
+    def create(self, posting: Posting) -> Posting:
+        """Create a posting in Supabase and write it through to the mirror."""
+        created = self.repository.create(posting)
+        with self._lock:
+            self._upsert_rows([created])
+        self._update_index([created])
+        return created
+
+    def update(self, posting: Posting) -> Posting | None:
+        """Update a posting in Supabase and write it through to the mirror."""
+        updated = self.repository.update(posting)
+        if updated is not None:
+            with self._lock:
+                self._upsert_rows([updated])
+            self._update_index([updated])
+        return updated
+
+    def bulk_delete(self, posting_ids: list[str], batch_size: int = 1000) -> int:
+        """Delete postings in Supabase and write the deletion through to the mirror."""
+        deleted_count = self.repository.bulk_delete(posting_ids, batch_size)
+        with self._lock:
+            self._conn.executemany("DELETE FROM postings WHERE id = ?", [(posting_id,) for posting_id in posting_ids])
+            self._conn.executemany("DELETE FROM posting_terms WHERE posting_id = ?", [(posting_id,) for posting_id in posting_ids])
+        self._update_index(deleted_ids=posting_ids)
+        return deleted_count
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
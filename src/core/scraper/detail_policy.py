@@ -0,0 +1,79 @@
+"""
+Policy deciding whether a listing's posting page is worth scraping for details.
+"""
+from src.models.company import Company
+from src.models.listing import Listing
+from src.utils.config import Config
+
+# Scrape the posting page before publishing the posting
+SCRAPE_NOW = "now"
+# Publish the posting from listing data and scrape its page in the background
+SCRAPE_LATER = "later"
+# Publish the posting from listing data only
+SKIP = "skip"
+
+
+class DetailScrapePolicy:
+    """
+    Decides per listing whether to scrape its posting page now, later or never.
+
+    Listings already carry everything a posting needs except salary and
+    categories. In "auto" mode a listing with a title, locations, terms and
+    a work arrangement is published straight away and enriched later,
+    while listings missing any of these are scraped before publishing.
+    "always" scrapes every listing first (the previous behaviour) and
+    "never" publishes every listing without scraping its page. Companies
+    can be pinned to always or never scraping regardless of the mode.
+    """
+
+    def __init__(self, mode: str = None, always_companies: list[str] = None, never_companies: list[str] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            mode: "auto", "always" or "never" (defaults to Config.DETAIL_SCRAPE_MODE)
+            always_companies: Companies whose postings are always scraped first
+                              (defaults to Config.DETAIL_SCRAPE_ALWAYS_COMPANIES)
+            never_companies: Companies whose postings are never scraped
+                             (defaults to Config.DETAIL_SCRAPE_NEVER_COMPANIES)
+        """
+        self.mode = mode or Config.DETAIL_SCRAPE_MODE
+        if self.mode not in ("auto", "always", "never"):
+            raise ValueError(f"Unknown detail scrape mode: {self.mode}")
+
+        always = always_companies if always_companies is not None else Config.DETAIL_SCRAPE_ALWAYS_COMPANIES
+        never = never_companies if never_companies is not None else Config.DETAIL_SCRAPE_NEVER_COMPANIES
+        self.always_companies = {name.lower() for name in always}
+        self.never_companies = {name.lower() for name in never}
+
+    def is_sufficient(self, listing: Listing) -> bool:
+        """
+        Check whether a listing has every posting field a listing can provide.
+
+        Args:
+            listing: Listing to check
+
+        Returns:
+            True if the listing has a title, locations, terms and a work arrangement
+        """
+        return bool(listing.title and listing.location and listing.term and listing.work_arrangement)
+
+    def decide(self, company: Company, listing: Listing) -> str:
+        """
+        Decide when to scrape a listing's posting page.
+
+        Args:
+            company: Company the listing belongs to
+            listing: Listing about to be published
+
+        Returns:
+            SCRAPE_NOW, SCRAPE_LATER or SKIP
+        """
+        name = company.name.lower()
+        if name in self.never_companies:
+            return SKIP
+        if name in self.always_companies or self.mode == "always":
+            return SCRAPE_NOW
+        if self.mode == "never":
+            return SKIP
+        return SCRAPE_LATER if self.is_sufficient(listing) else SCRAPE_NOW
@@ -0,0 +1,83 @@
+"""
+Incremental parsing of a JSON array of objects as a model writes it.
+"""
+import json
+
+
+class JSONArrayStream:
+    """
+    Parser fed with chunks of a JSON array, returning each object once it closes.
+
+    Text before the opening bracket (such as a markdown fence) is skipped,
+    and so is anything after the closing bracket. Values in the array that
+    are not objects are ignored, and objects that are not valid JSON are
+    counted in errors and skipped.
+    """
+
+    def __init__(self):
+        """Initialize an empty parser."""
+        self.started = False
+        self.finished = False
+        self.errors = 0
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._current = []
+
+    def feed(self, text: str) -> list[dict]:
+        """
+        Parse the next chunk of the array.
+
+        Args:
+            text: Next chunk of the model's reply
+
+        Returns:
+            Objects completed by the chunk, in order
+        """
+        items = []
+        for char in text:
+            if self.finished:
+                break
+            if not self.started:
+                if char == "[":
+                    self.started = True
+                    self._depth = 1
+                continue
+
+            # Only the characters of objects and arrays in the array are kept
+            if self._depth >= 2 or (char in "[{" and not self._in_string):
+                self._current.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            elif char in "]}":
+                self._depth -= 1
+                if self._depth == 1 and self._current:
+                    items.extend(self._close_item())
+                elif self._depth == 0:
+                    self.finished = True
+
+        return items
+
+    def _close_item(self) -> list[dict]:
+        """Decode the object that just closed."""
+        text = "".join(self._current)
+        self._current = []
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError:
+            self.errors += 1
+            return []
+        return [item] if isinstance(item, dict) else []
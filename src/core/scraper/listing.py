@@ -1,12 +1,20 @@
 """
 Job parser for extracting job information from parsed data.
 """
-import json
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from difflib import SequenceMatcher
+from src.core.fetch.page import FetchedPage
+from src.core.fetch.regions import get_listing_region_cache
 from src.models.listing import Listing
 from src.models.company import Company
 from src.utils.config import Config
+from src.utils.cpu_pool import run_with_shared_text
+from src.utils.tokens import LISTING_STAGE, TokenBudgetExceeded
+from src.core.scraper.llm import ModelRouter
+from src.core.scraper.validation import validate_listings
+from src.core.scraper.structured import compact_job_data, is_internship_item, map_job_data_item
 
 
 class ListingScraper:
@@ -23,7 +31,12 @@ class ListingScraper:
                      Required if using scrape_all_pages method.
         """
         self.client = Config.get_openai_client()
+        self.router = ModelRouter()
         self.fetcher = fetcher
+        # Learned job list regions, None sends whole pages to the model
+        self.regions = get_listing_region_cache() if Config.LISTING_REGION_DETECTION else None
+        # Set when the last scrape_all_pages() stopped early because of the token budget
+        self.budget_exhausted = False
 
     def parse(self, cleaned_text: str, company_name: str) -> list[Listing]:
         """
@@ -36,6 +49,22 @@ class ListingScraper:
         Returns:
             List of Listing objects
         """
+        return list(self.iter_parse(cleaned_text, company_name))
+
+    def iter_parse(self, cleaned_text: str, company_name: str) -> Iterator[Listing]:
+        """
+        Parse cleaned HTML text using OpenAI, yielding each job listing as soon as the model has written it.
+
+        With Config.LLM_STREAMING off, the listings are yielded once the
+        whole reply has arrived.
+
+        Args:
+            cleaned_text: Cleaned text content from the page
+            company_name: Name of the company for the listings
+
+        Yields:
+            Listing objects
+        """
         # Get path to system prompt in src/shared/
         project_root = Path(__file__).parent.parent.parent
         prompt_path = project_root / "shared" / "listing_scraper_prompt.txt"
@@ -44,43 +73,135 @@ class ListingScraper:
         with open(prompt_path, 'r') as f:
             system_prompt = f.read()
 
-        # Create a chat completion using the OpenAI API
-        chat_completion = self.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": system_prompt,
-                },
-                {
-                    "role": "user",
-                    "content": "CAREERS PAGE:\n" + cleaned_text
-                }
-            ],
-            model=Config.OPENAI_MODEL,
-            temperature=0
+        content = "CAREERS PAGE:\n" + cleaned_text
+        if Config.LLM_STREAMING:
+            # Stream the reply, handing on each listing as its object closes
+            job_dicts = self.router.stream_json_array(self.client, system_prompt, content,
+                                                      LISTING_STAGE, company_name, validate_listings)
+        else:
+            # Create a chat completion with the cheapest model that returns valid listings
+            job_dicts = self.router.complete_json(self.client, system_prompt, content,
+                                                  LISTING_STAGE, company_name, validate_listings)
+
+        # Convert to Listing objects
+        for job_dict in job_dicts:
+            yield self.to_listing(job_dict, company_name)
+
+    @staticmethod
+    def to_listing(job_dict: dict, company_name: str) -> Listing:
+        """
+        Convert a job dict in the listing prompt's output shape to a Listing.
+
+        Args:
+            job_dict: Job fields
+            company_name: Name of the company for the listing
+
+        Returns:
+            Listing object
+        """
+        return Listing(
+            title=job_dict.get("title", ""),
+            location=job_dict.get("location", []),
+            term=job_dict.get("term", []),
+            department=job_dict.get("department", ""),
+            work_arrangement=job_dict.get("work_arrangement", ""),
+            href=job_dict.get("href", ""),
+            href_is_url=job_dict.get("href_is_url", True),
+            company=company_name,
         )
 
-        # Parse JSON response and convert to Listing objects
-        job_dicts = json.loads(chat_completion.choices[0].message.content)
-        listings = []
-        for job_dict in job_dicts:
-            listing = Listing(
-                title=job_dict.get("title", ""),
-                location=job_dict.get("location", []),
-                term=job_dict.get("term", []),
-                department=job_dict.get("department", ""),
-                work_arrangement=job_dict.get("work_arrangement", ""),
-                href=job_dict.get("href", ""),
-                href_is_url=job_dict.get("href_is_url", True),
-                company=company_name,
-            )
-            listings.append(listing)
-
-        return listings
+    def parse_job_data(self, fetched_page: FetchedPage, company: Company) -> Iterator[Listing] | None:
+        """
+        Extract listings from the job list a careers page loaded from its JSON API.
+
+        Internship and co-op jobs, by title or employment type, are mapped
+        directly when every one of them can be (see map_job_data_item()).
+        Otherwise their compacted JSON is sent to the model instead of the
+        page text.
+
+        Args:
+            fetched_page: Fetched page with captured job data
+            company: Company the page belongs to
+
+        Returns:
+            Listing objects, or None if the job data holds no internships
+            and the page text should be parsed instead
+        """
+        items = [item for item in fetched_page.job_data if is_internship_item(item)]
+        if not items:
+            return None
+
+        job_dicts = [map_job_data_item(item) for item in items]
+        if None not in job_dicts and not validate_listings(job_dicts):
+            print(f"{company.name}: Mapped {len(job_dicts)} jobs from {fetched_page.job_data_url}")
+            return iter([self.to_listing(job_dict, company.name) for job_dict in job_dicts])
+
+        print(f"{company.name}: Parsing {len(items)} jobs from {fetched_page.job_data_url}")
+        return self.iter_parse(compact_job_data(items), company.name)
+
+    def parse_page(self, fetched_page: FetchedPage, company: Company, page: int = 1) -> list[Listing]:
+        """
+        Parse a fetched careers page, using only its job list region when it has one.
+
+        Internships found in job data captured from the page's JSON API are
+        used before any page text.
+
+        If the first page's region holds no jobs, the whole page is parsed
+        and the company's learned region is dropped. Later pages without
+        jobs in the region are taken as the end of the listings.
+
+        Args:
+            fetched_page: Fetched page, with its job list region if one was found
+            company: Company the page belongs to
+            page: Page number, starting at 1
+
+        Returns:
+            List of Listing objects
+        """
+        return list(self.iter_parse_page(fetched_page, company, page))
+
+    def iter_parse_page(self, fetched_page: FetchedPage, company: Company, page: int = 1) -> Iterator[Listing]:
+        """
+        Parse a fetched careers page like parse_page(), yielding each listing as soon as it is parsed.
+
+        Args:
+            fetched_page: Fetched page, with its job list region if one was found
+            company: Company the page belongs to
+            page: Page number, starting at 1
+
+        Yields:
+            Listing objects
+        """
+        if fetched_page.job_data:
+            listings = self.parse_job_data(fetched_page, company)
+            if listings is not None:
+                yield from listings
+                return
+
+        if self.regions is None or not fetched_page.region_text:
+            yield from self.iter_parse(fetched_page.text, company.name)
+            return
+
+        print(f"{company.name}: Parsing job list region {fetched_page.region_selector} "
+              f"({len(fetched_page.region_text)} of {len(fetched_page.text)} chars)")
+        found = False
+        for listing in self.iter_parse(fetched_page.region_text, company.name):
+            if not found:
+                found = True
+                self.regions.set(company.name, fetched_page.region_selector)
+            yield listing
+        if found or page > 1:
+            return
+
+        # The region missed the jobs, parse the whole page and relearn the region next time
+        print(f"{company.name}: No jobs in job list region, parsing whole page")
+        self.regions.forget(company.name)
+        yield from self.iter_parse(fetched_page.text, company.name)
 
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate similarity ratio between two texts.
+        Runs in the CPU process pool when Config.CPU_POOL_SIZE is set.
 
         Args:
             text1: First text
@@ -89,15 +210,53 @@ class ListingScraper:
         Returns:
             Similarity ratio between 0.0 and 1.0
         """
-        return SequenceMatcher(None, text1, text2).ratio()
+        return run_with_shared_text(calculate_similarity, text1, text2)
+
+    def page_url(self, company: Company, page: int) -> str:
+        """
+        Construct the URL of a page of a company's listings.
+
+        Args:
+            company: Company object containing URL and pagination settings
+            page: Page number, starting at 1
+
+        Returns:
+            URL of the page
+        """
+        if not company.paged or not company.page_query_param:
+            return company.url
+        return f"{company.url}&{company.page_query_param}={page}"
 
-    def scrape_all_pages(self, company: Company, max_pages: int = None) -> list[Listing]:
+    def scrape_all_pages(self, company: Company, max_pages: int = None, prefetch: int = None,
+                         on_listing: Callable[[Listing], None] = None,
+                         heartbeat: Callable[[], None] = None) -> list[Listing]:
         """
         Scrape all pages with pagination until no more jobs or duplicate pages found.
 
+        With prefetch enabled, the next pages are fetched while the current
+        page is being parsed by the LLM. Pages fetched past the point where
+        scraping stops are discarded: those not started are cancelled and
+        those being fetched are waited for before returning.
+
+        With region detection enabled, only the page's job list region is
+        parsed. Its selector is learned for the company once it yields jobs,
+        and the whole page is parsed instead when the region yields none.
+        Pages prefetched before the selector was learned or dropped are
+        fetched again with the current one.
+
+        With on_listing, each listing is handed on as soon as it is parsed
+        rather than when the scrape ends. A listing whose title was already
+        seen on an earlier page is held back until its page turns out not
+        to be a duplicate. Listings handed on before an error are kept in
+        the result.
+
         Args:
             company: Company object containing URL and pagination settings
             max_pages: Maximum pages to scrape (defaults to Config.MAX_PAGES_PER_COMPANY)
+            prefetch: Number of pages to fetch ahead (defaults to Config.PAGE_PREFETCH_DEPTH)
+            on_listing: Optional function called with each listing as it is found
+            heartbeat: Optional function called before every page after the first,
+                       e.g. to extend the lease of the company being scraped
 
         Returns:
             List of Listing objects
@@ -107,67 +266,144 @@ class ListingScraper:
 
         if max_pages is None:
             max_pages = Config.MAX_PAGES_PER_COMPANY
+        if prefetch is None:
+            prefetch = Config.PAGE_PREFETCH_DEPTH
         if not company.paged:
             max_pages = 1
+        if not company.page_query_param:
+            # Every page has the same URL, there is nothing to fetch ahead
+            prefetch = 0
 
         all_jobs = []
+        # Listings of the current page already handed to on_listing
+        emitted = []
         seen_job_titles = set()
         i = 1
-
-        while i <= max_pages:
-            try:
-                # Construct the URL for the current page
-                if not company.paged or not company.page_query_param:
-                    formatted_url = company.url
-                else:
-                    formatted_url = f"{company.url}&{company.page_query_param}={i}"
-                print(f"{company.name}: Scraping page {i}: {formatted_url}\n")
-
-                # Fetch the cleaned text content of the page
-                cleaned_text = self.fetcher.fetch(formatted_url)
-
-                # If the fetched text is empty or indicates no results, stop.
-                if not cleaned_text:
-                    print(f"{company.name}: No more content found. Stopping.")
-                    break
-
-                # Parse the text to get a list of Listing objects
-                jobs_on_page = self.parse(cleaned_text, company.name)
-
-                # If parsing returns an empty list, it means no more jobs were found
-                if not jobs_on_page:
-                    print(f"{company.name}: Page {i} returned no jobs. Stopping.")
-                    break
-
-                # Check for similarity with the last page's content to detect duplicate pages
-                if i > 1 and self.calculate_similarity(cleaned_text, last_cleaned_text) > 0.98:
-                    print(f"{company.name}: Page {i} is too similar to the previous page. Stopping.")
+        self.budget_exhausted = False
+
+        # Speculative page fetches with the region hint they were fetched with, by page number
+        prefetched_pages = {}
+        prefetch_executor = ThreadPoolExecutor(max_workers=prefetch) if prefetch > 0 and max_pages > 1 else None
+
+        def fetch_page(page: int) -> FetchedPage:
+            region = listing_region()
+            if page in prefetched_pages:
+                future, prefetched_region = prefetched_pages.pop(page)
+                # Pages fetched before an earlier page learned or dropped the region are fetched again
+                if prefetched_region == region:
+                    return future.result()
+                future.cancel()
+            return self.fetcher.fetch_page(self.page_url(company, page), region)
+
+        def listing_region() -> str | None:
+            return self.regions.get(company.name) if self.regions is not None else None
+
+        try:
+            while i <= max_pages:
+                try:
+                    if heartbeat is not None and i > 1:
+                        heartbeat()
+
+                    formatted_url = self.page_url(company, i)
+                    print(f"{company.name}: Scraping page {i}: {formatted_url}\n")
+
+                    # Fetch the cleaned text content of the page
+                    fetched_page = fetch_page(i)
+                    cleaned_text = fetched_page.text
+
+                    # Start fetching the next pages while this one is parsed
+                    if prefetch_executor is not None:
+                        for page in range(i + 1, min(i + prefetch, max_pages) + 1):
+                            if page not in prefetched_pages:
+                                region = listing_region()
+                                prefetched_pages[page] = (prefetch_executor.submit(
+                                    self.fetcher.fetch_page, self.page_url(company, page), region
+                                ), region)
+
+                    # If the fetched text is empty or indicates no results, stop.
+                    if not cleaned_text:
+                        print(f"{company.name}: No more content found. Stopping.")
+                        break
+
+                    # Check for similarity with the last page's content to detect duplicate pages.
+                    # Done before parsing so a duplicate page costs no LLM call.
+                    if i > 1 and self.calculate_similarity(cleaned_text, last_cleaned_text) > 0.98:
+                        print(f"{company.name}: Page {i} is too similar to the previous page. Stopping.")
+                        break
+                    last_cleaned_text = cleaned_text
+
+                    # Parse the text to get a list of Listing objects, handing on new ones as they arrive
+                    jobs_on_page = []
+                    emitted = []
+                    for job in self.iter_parse_page(fetched_page, company, i):
+                        jobs_on_page.append(job)
+                        if on_listing is not None and (i == 1 or normalize_title(job.title) not in seen_job_titles):
+                            on_listing(job)
+                            emitted.append(job)
+
+                    # If parsing returns an empty list, it means no more jobs were found
+                    if not jobs_on_page:
+                        print(f"{company.name}: Page {i} returned no jobs. Stopping.")
+                        break
+
+                    # Normalize and collect job titles from the current page
+                    current_page_titles = {normalize_title(job.title) for job in jobs_on_page}
+
+                    # If all jobs on the current page have been seen before, stop
+                    if current_page_titles.issubset(seen_job_titles):
+                        print(f"{company.name}: Page {i} contains only duplicate jobs. Stopping.")
+                        break
+
+                    # Hand on the jobs held back as possible duplicates
+                    if on_listing is not None:
+                        emitted_ids = {id(job) for job in emitted}
+                        for job in jobs_on_page:
+                            if id(job) not in emitted_ids:
+                                on_listing(job)
+
+                    # Add the found jobs to the aggregate list and update seen titles
+                    emitted = []
+                    all_jobs.extend(jobs_on_page)
+                    seen_job_titles.update(current_page_titles)
+
+                    print(f"{company.name}: Found {len(jobs_on_page)} jobs on page {i}.\n")
+
+                    i += 1
+
+                except TokenBudgetExceeded as e:
+                    # Later pages may still hold jobs, so the scrape is incomplete
+                    print(f"{company.name}: {e}. Stopping.")
+                    self.budget_exhausted = True
                     break
-                last_cleaned_text = cleaned_text
-
-                # Normalize and collect job titles from the current page
-                current_page_titles = {
-                    job.title.lower().replace(' ', '')
-                    for job in jobs_on_page
-                }
 
-                # If all jobs on the current page have been seen before, stop
-                if current_page_titles.issubset(seen_job_titles):
-                    print(f"{company.name}: Page {i} contains only duplicate jobs. Stopping.")
+                except Exception as e:
+                    # If any error occurs (e.g., network error, page not found), stop.
+                    print(f"{company.name}: An error occurred on page {i}: {e}. Stopping.")
                     break
+        finally:
+            # Listings already handed on stay part of the result
+            all_jobs.extend(emitted)
 
-                # Add the found jobs to the aggregate list and update seen titles
-                all_jobs.extend(jobs_on_page)
-                seen_job_titles.update(current_page_titles)
+            # Discard speculative pages past the stopping point, waiting for those already
+            # being fetched so they no longer hold the fetch lock and browser on return
+            if prefetch_executor is not None:
+                prefetch_executor.shutdown(wait=True, cancel_futures=True)
 
-                print(f"{company.name}: Found {len(jobs_on_page)} jobs on page {i}.\n")
+        return all_jobs
 
-                i += 1
+def normalize_title(title: str) -> str:
+    """Normalize a job title for duplicate page detection."""
+    return title.lower().replace(' ', '')
 
-            except Exception as e:
-                # If any error occurs (e.g., network error, page not found), stop.
-                print(f"{company.name}: An error occurred on page {i}: {e}. Stopping.")
-                break
+def calculate_similarity(text1: str, text2: str) -> float:
+    """
+    Calculate similarity ratio between two texts.
 
-        return all_jobs
+    Args:
+        text1: First text
+        text2: Second text
 
+    Returns:
+        Similarity ratio between 0.0 and 1.0
+    """
+    return SequenceMatcher(None, text1, text2).ratio()
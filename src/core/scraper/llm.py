@@ -0,0 +1,305 @@
+"""
+Chat completion calls shared by the scrapers, with token accounting and model routing.
+"""
+import json
+import threading
+from collections.abc import Iterator
+from src.core.scraper.json_stream import JSONArrayStream
+from src.utils.config import Config
+from src.utils.tokens import CHARS_PER_TOKEN, LISTING_STAGE, POSTING_STAGE, estimate_tokens
+
+
+def _messages(system_prompt: str, content: str) -> list[dict]:
+    """Build the chat messages of a scraper call."""
+    return [
+        {
+            "role": "system",
+            "content": system_prompt,
+        },
+        {
+            "role": "user",
+            "content": content
+        }
+    ]
+
+
+def complete_chat(client, system_prompt: str, content: str, stage: str, company: str,
+                  model: str = None) -> str:
+    """
+    Send a system prompt and page content to the model and return its reply.
+
+    The estimated prompt tokens are reserved in the run's token ledger
+    before the call, and the usage reported by the API is recorded after it.
+
+    Args:
+        client: OpenAI client
+        system_prompt: System prompt of the scraper
+        content: User message with the page content
+        stage: Ledger stage of the call (LISTING_STAGE or POSTING_STAGE)
+        company: Company the call is for
+        model: Model to use (defaults to Config.OPENAI_MODEL)
+
+    Returns:
+        Content of the model's reply
+
+    Raises:
+        TokenBudgetExceeded: If the call would exceed the token budget
+    """
+    model = model or Config.OPENAI_MODEL
+    ledger = Config.get_token_ledger()
+    estimated_tokens = estimate_tokens(system_prompt, content)
+    ledger.reserve(stage, company, estimated_tokens)
+
+    prompt_tokens = completion_tokens = 0
+    try:
+        chat_completion = client.chat.completions.create(
+            messages=_messages(system_prompt, content),
+            model=model,
+            temperature=0
+        )
+        if chat_completion.usage is not None:
+            prompt_tokens = chat_completion.usage.prompt_tokens
+            completion_tokens = chat_completion.usage.completion_tokens
+    finally:
+        ledger.settle(stage, company, estimated_tokens, prompt_tokens, completion_tokens, model)
+
+    return chat_completion.choices[0].message.content
+
+
+def stream_chat(client, system_prompt: str, content: str, stage: str, company: str,
+                model: str = None) -> Iterator[str]:
+    """
+    Send a system prompt and page content to the model and yield its reply as it is written.
+
+    Tokens are reserved and settled in the run's token ledger like
+    complete_chat(). The usage reported at the end of the stream is
+    recorded. A stream closed before that (escalation, a budget abort or a
+    failure mid-reply) is charged the estimated prompt tokens plus the
+    estimated tokens of the reply received so far.
+
+    Args:
+        client: OpenAI client
+        system_prompt: System prompt of the scraper
+        content: User message with the page content
+        stage: Ledger stage of the call (LISTING_STAGE or POSTING_STAGE)
+        company: Company the call is for
+        model: Model to use (defaults to Config.OPENAI_MODEL)
+
+    Yields:
+        Chunks of the model's reply
+
+    Raises:
+        TokenBudgetExceeded: If the call would exceed the token budget
+    """
+    model = model or Config.OPENAI_MODEL
+    ledger = Config.get_token_ledger()
+    estimated_tokens = estimate_tokens(system_prompt, content)
+    ledger.reserve(stage, company, estimated_tokens)
+
+    prompt_tokens = completion_tokens = 0
+    received_chars = 0
+    stream = None
+    try:
+        stream = client.chat.completions.create(
+            messages=_messages(system_prompt, content),
+            model=model,
+            temperature=0,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        for chunk in stream:
+            if chunk.usage is not None:
+                prompt_tokens = chunk.usage.prompt_tokens
+                completion_tokens = chunk.usage.completion_tokens
+            if chunk.choices and chunk.choices[0].delta.content:
+                received_chars += len(chunk.choices[0].delta.content)
+                yield chunk.choices[0].delta.content
+    finally:
+        if stream is not None:
+            stream.close()
+            if not prompt_tokens:
+                # The prompt was sent and the reply partly generated without usage being reported
+                prompt_tokens = estimated_tokens
+                completion_tokens = received_chars // CHARS_PER_TOKEN
+        ledger.settle(stage, company, estimated_tokens, prompt_tokens, completion_tokens, model)
+
+
+class ModelRouter:
+    """
+    Picks the cheapest model for an extraction and escalates when its output is invalid.
+
+    Inputs small enough for their stage go to Config.OPENAI_FAST_MODEL first,
+    larger ones start at Config.OPENAI_MODEL. A reply that is not valid JSON
+    or fails the schema validator is retried with the next stronger model.
+    The strongest model's reply is used even if it fails validation, as long
+    as it is valid JSON.
+
+    Listing calls stick to the model whose reply was last used for the
+    company, so once a careers page needed the stronger model its other
+    pages skip the fast model instead of failing on it first.
+    """
+
+    def __init__(self, fast_model: str = None, model: str = None):
+        """
+        Initialize the model router.
+
+        Args:
+            fast_model: Cheap, fast model for small inputs
+                        (defaults to Config.OPENAI_FAST_MODEL, empty disables routing)
+            model: Model for large inputs and escalations (defaults to Config.OPENAI_MODEL)
+        """
+        self.fast_model = fast_model if fast_model is not None else Config.OPENAI_FAST_MODEL
+        self.model = model or Config.OPENAI_MODEL
+        self.fast_max_tokens = {
+            LISTING_STAGE: Config.FAST_MODEL_MAX_LISTING_TOKENS,
+            POSTING_STAGE: Config.FAST_MODEL_MAX_POSTING_TOKENS,
+        }
+        self._listing_models = {}
+        self._lock = threading.Lock()
+
+    def models_for(self, stage: str, estimated_tokens: int, company: str = None) -> list[str]:
+        """
+        Get the models to try for a call, cheapest first.
+
+        Args:
+            stage: LISTING_STAGE or POSTING_STAGE
+            estimated_tokens: Estimated prompt tokens of the call
+            company: Company the call is for, to reuse the model its listings last needed
+
+        Returns:
+            Models in escalation order
+        """
+        if stage == LISTING_STAGE and company is not None:
+            with self._lock:
+                if self._listing_models.get(company) == self.model:
+                    return [self.model]
+
+        if self.fast_model and self.fast_model != self.model \
+                and estimated_tokens <= self.fast_max_tokens.get(stage, 0):
+            return [self.fast_model, self.model]
+        return [self.model]
+
+    def _record_model(self, stage: str, company: str, model: str):
+        """Remember the model whose reply was used for a company's listings."""
+        if stage == LISTING_STAGE:
+            with self._lock:
+                self._listing_models[company] = model
+
+    def complete_json(self, client, system_prompt: str, content: str, stage: str, company: str, validate):
+        """
+        Get a validated JSON reply from the cheapest model that produces one.
+
+        Args:
+            client: OpenAI client
+            system_prompt: System prompt of the scraper
+            content: User message with the page content
+            stage: LISTING_STAGE or POSTING_STAGE
+            company: Company the call is for
+            validate: Function returning the list of schema problems of decoded output
+
+        Returns:
+            Decoded JSON reply
+
+        Raises:
+            json.JSONDecodeError: If the strongest model's reply is not valid JSON
+            TokenBudgetExceeded: If a call would exceed the token budget
+        """
+        models = self.models_for(stage, estimate_tokens(system_prompt, content), company)
+
+        for attempt, model in enumerate(models, start=1):
+            reply = complete_chat(client, system_prompt, content, stage, company, model)
+            try:
+                data = json.loads(reply)
+            except json.JSONDecodeError as e:
+                if attempt == len(models):
+                    raise
+                print(f"{company}: {model} returned invalid JSON ({e}), escalating")
+                continue
+
+            errors = validate(data)
+            if not errors:
+                self._record_model(stage, company, model)
+                return data
+            if attempt == len(models):
+                print(f"{company}: {model} output has schema problems: {'; '.join(errors[:3])}")
+                self._record_model(stage, company, model)
+                return data
+            print(f"{company}: {model} output failed validation ({'; '.join(errors[:3])}), escalating")
+
+    def stream_json_array(self, client, system_prompt: str, content: str, stage: str, company: str,
+                          validate) -> Iterator[dict]:
+        """
+        Stream a JSON array reply from the cheapest model that produces one, yielding each valid object as it closes.
+
+        A model is escalated from only while none of its objects have been
+        yielded: when its first object fails validation or its reply holds
+        no array. After that, invalid objects are skipped, except on the
+        strongest model, whose objects are yielded as-is like complete_json(). A reply cut off
+        mid-array, by the stream ending or failing, keeps the objects that
+        were completed.
+
+        Args:
+            client: OpenAI client
+            system_prompt: System prompt of the scraper
+            content: User message with the page content
+            stage: LISTING_STAGE or POSTING_STAGE
+            company: Company the call is for
+            validate: Function returning the list of schema problems of a decoded array
+
+        Yields:
+            Decoded objects of the array
+
+        Raises:
+            ValueError: If the strongest model's reply holds no JSON array
+            TokenBudgetExceeded: If a call would exceed the token budget
+        """
+        models = self.models_for(stage, estimate_tokens(system_prompt, content), company)
+
+        for attempt, model in enumerate(models, start=1):
+            last_model = attempt == len(models)
+            parser = JSONArrayStream()
+            yielded = 0
+            problem = None
+
+            chunks = stream_chat(client, system_prompt, content, stage, company, model)
+            try:
+                for chunk in chunks:
+                    for item in parser.feed(chunk):
+                        errors = validate([item])
+                        if not errors or last_model:
+                            # The strongest model's output is accepted as-is, like complete_json()
+                            if errors:
+                                print(f"{company}: {model} output has schema problems: {'; '.join(errors[:3])}")
+                            if not yielded:
+                                self._record_model(stage, company, model)
+                            yielded += 1
+                            yield item
+                        elif yielded:
+                            print(f"{company}: {model} output has schema problems, skipping: {'; '.join(errors[:3])}")
+                        else:
+                            problem = f"output failed validation ({'; '.join(errors[:3])})"
+                            break
+                    # Once the array is closed the rest is drained for the usage reported at the end
+                    if problem:
+                        break
+            except Exception as e:
+                if not yielded and not parser.finished:
+                    raise
+                print(f"{company}: {model} stream failed ({e}), keeping {yielded} items")
+                return
+            finally:
+                chunks.close()
+
+            if problem is None:
+                if parser.finished:
+                    if not yielded:
+                        self._record_model(stage, company, model)
+                    return
+                if yielded:
+                    print(f"{company}: {model} stream ended mid-array, keeping {yielded} items")
+                    return
+                problem = "returned no JSON array"
+
+            if last_model:
+                raise ValueError(f"{company}: {model} {problem}")
+            print(f"{company}: {model} {problem}, escalating")
@@ -1,13 +1,19 @@
 """
 Posting parser for processing job postings.
 """
-import json
 import time
+from dataclasses import replace
 from pathlib import Path
+from src.core.fetch.health import CircuitOpenError
 from src.models.company import Company
 from src.models.posting import Posting
 from src.models.listing import Listing
 from src.utils.config import Config
+from src.utils.tokens import POSTING_STAGE
+from src.core.scraper.llm import ModelRouter
+from src.core.scraper.single_flight import get_posting_flight
+from src.core.scraper.validation import validate_posting
+from src.core.scraper.structured import POSTING_FIELDS, find_job_posting, job_posting_text, map_job_posting
 
 
 class PostingScraper:
@@ -24,46 +30,51 @@ class PostingScraper:
                      Required if using scrape method.
         """
         self.client = Config.get_openai_client()
+        self.router = ModelRouter()
         self.fetcher = fetcher
+        # Posting pages fetched and parsed in this run, shared by all posting scrapers
+        self.flight = get_posting_flight()
 
-    def parse(self, cleaned_text: str, company_name: str, url: str = "") -> Posting:
+    def parse(self, cleaned_text: str, company_name: str, url: str = "",
+              structured_data: list[dict] = None) -> Posting:
         """
         Parse cleaned HTML text using OpenAI to extract posting information.
 
+        When the page embeds a schema.org JobPosting, the fields it settles
+        are taken from it directly. OpenAI is only called if fields are
+        still missing, on the JobPosting's description when it has one, and
+        the structured values take precedence over the model's.
+
         Args:
             cleaned_text: Cleaned text content from the posting page
             company_name: Name of the company (fallback if not extracted from page)
             url: URL of the posting (optional)
+            structured_data: JSON-LD objects of the posting page (optional)
 
         Returns:
             Posting object
         """
-        # Get path to system prompt in src/shared/
-        project_root = Path(__file__).parent.parent.parent
-        prompt_path = project_root / "shared" / "posting_scraper_prompt.txt"
-
-        # Read the system prompt from the file
-        with open(prompt_path, 'r') as f:
-            system_prompt = f.read()
-
-        # Create a chat completion using the OpenAI API
-        chat_completion = self.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": system_prompt,
-                },
-                {
-                    "role": "user",
-                    "content": "JOB POSTING:\n" + cleaned_text
-                }
-            ],
-            model=Config.OPENAI_MODEL,
-            temperature=0
-        )
+        job_posting = find_job_posting(structured_data or [])
+        posting_dict = map_job_posting(job_posting) if job_posting else {}
+        missing_fields = [field for field in POSTING_FIELDS if field not in posting_dict]
+
+        if not missing_fields:
+            print(f"{company_name}: Posting fully described by JSON-LD, skipping LLM: {url}")
+        else:
+            # Get path to system prompt in src/shared/
+            project_root = Path(__file__).parent.parent.parent
+            prompt_path = project_root / "shared" / "posting_scraper_prompt.txt"
+
+            # Read the system prompt from the file
+            with open(prompt_path, 'r') as f:
+                system_prompt = f.read()
+
+            content = (job_posting_text(job_posting) if job_posting else "") or cleaned_text
 
-        # Parse JSON response and convert to Posting object
-        posting_dict = json.loads(chat_completion.choices[0].message.content)
+            # Create a chat completion with the cheapest model that returns a valid posting
+            extracted_dict = self.router.complete_json(self.client, system_prompt, "JOB POSTING:\n" + content,
+                                                       POSTING_STAGE, company_name, validate_posting)
+            posting_dict = {**extracted_dict, **posting_dict}
 
         # Handle salary which is now a nested dict with type and amount
         salary_info = posting_dict.get("salary", {"type": "none", "amount": 0})
@@ -102,43 +113,107 @@ class PostingScraper:
         Returns:
             Posting object
         """
+        # Skip the detail scrape when the token budget is running out
+        if Config.get_token_ledger().should_shed(POSTING_STAGE, listing.company):
+            print(f"{listing.company}: Token budget low, using listing data for {listing.title}")
+            return self.from_listing(listing)
+
+        # If no URL or scraping failed, construct Posting from Listing data
+        return self.scrape_details(listing, company) or self.from_listing(listing)
+
+    def scrape_details(self, listing: Listing, company: Company) -> Posting | None:
+        """
+        Scrape a Listing's URL for a detailed Posting object.
+
+        Each URL is fetched and parsed once per run. Listings of the same
+        posting (e.g. one per location) share the result under their own IDs.
+
+        Args:
+            listing: Listing object containing the job URL to scrape
+            company: Company the listing belongs to
+
+        Returns:
+            Posting object, or None if the listing has no URL or scraping failed
+        """
         if self.fetcher is None:
             raise ValueError("Fetcher instance is required to scrape")
 
+        url = self.posting_url(listing, company)
+        if not url:
+            return None
+
+        posting = self.flight.do(url, lambda: self.scrape_url(url, listing.company))
+        return replace(posting, id=listing.hash()) if posting is not None else None
+
+    @staticmethod
+    def posting_url(listing: Listing, company: Company) -> str:
+        """
+        Resolve the URL of a Listing's posting page.
+
+        Args:
+            listing: Listing object containing the job URL
+            company: Company the listing belongs to
+
+        Returns:
+            Absolute URL of the posting, or "" if the listing has none
+        """
         # Get the URL from the listing's href
         if listing.href_is_url:
-            url = listing.href
-        else:
-            # Extract base URL from company.url (scheme + host)
-            from urllib.parse import urlparse
-            parsed = urlparse(company.url)
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
-            url = base_url + listing.href
-
-        # If there's a URL, try to scrape it for detailed information
-        if url:
-            # Fetch the cleaned text content
-            cleaned_text = self.fetcher.fetch(url)
-
-            if cleaned_text:
-                # Parse the text to get a detailed Posting object
-                try:
-                    posting = self.parse(cleaned_text, listing.company, url)
-                    posting.id = listing.hash()
-                    return posting
-                except Exception as e:
-                    print(f"Error parsing posting from {url}: {e}")
-                    # Fall through to create Posting from Listing data
+            return listing.href
 
-        # If no URL or scraping failed, construct Posting from Listing data
+        # Extract base URL from company.url (scheme + host)
+        from urllib.parse import urlparse
+        parsed = urlparse(company.url)
+        base_url = f"{parsed.scheme}://{parsed.netloc}"
+        return base_url + listing.href
+
+    def scrape_url(self, url: str, company_name: str) -> Posting | None:
+        """
+        Fetch and parse a posting page.
+
+        Args:
+            url: URL of the posting page
+            company_name: Name of the company the posting belongs to
+
+        Returns:
+            Posting object without an ID, or None if scraping failed
+        """
+        # Fetch the cleaned text content and structured data, skipping sites that are not responding
+        try:
+            page = self.fetcher.fetch_page(url)
+        except CircuitOpenError as e:
+            print(e)
+            return None
+
+        if not page.text:
+            return None
+
+        # Parse the page to get a detailed Posting object
+        try:
+            return self.parse(page.text, company_name, url, page.structured_data)
+        except Exception as e:
+            print(f"Error parsing posting from {url}: {e}")
+            return None
+
+    @staticmethod
+    def from_listing(listing: Listing) -> Posting:
+        """
+        Construct a Posting from Listing data alone, without scraping the posting page.
+
+        Args:
+            listing: Listing to convert
+
+        Returns:
+            Posting object
+        """
         return Posting(
             title=listing.title,
-            location=", ".join(listing.location) if listing.location else "",
+            location=list(listing.location),
             work_arrangement=listing.work_arrangement,
             salary=0,  # No salary info available from listing
             salary_type="none",  # No salary info available from listing
             url=listing.href or "",
-            term=listing.term,
+            term=list(listing.term),
             categories=[],  # No categories available from listing
             company=listing.company,
             id=listing.hash(),
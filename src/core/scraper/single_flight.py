@@ -0,0 +1,99 @@
+"""
+Single-flight deduplication of work keyed by posting URL.
+"""
+import threading
+from collections.abc import Callable
+
+
+class _Call:
+    """A call in flight or finished, with its result or error."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs a function once per key, sharing its result with every caller.
+
+    Callers asking for a key that is already being computed wait for that
+    call instead of starting their own, and later callers get the stored
+    result. Results are kept until clear() is called. A call that raises
+    or returns None is not kept: its waiters get the same exception or
+    None and the next caller tries again. Thread-safe for concurrent use.
+    """
+
+    def __init__(self):
+        """Initialize with no calls."""
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def do(self, key: str, fn: Callable[[], object]):
+        """
+        Get the result of fn for a key, calling it only if no other caller has.
+
+        Args:
+            key: Key the result is shared under
+            fn: Function computing the result
+
+        Returns:
+            The result of the single call of fn for the key
+
+        Raises:
+            Exception: Whatever the call of fn for the key raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.hits += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            # A missing result, e.g. a page that failed to load, is tried again by the next caller
+            if call.result is None:
+                with self._lock:
+                    del self._calls[key]
+        except Exception as e:
+            call.error = e
+            with self._lock:
+                del self._calls[key]
+            raise
+        finally:
+            call.done.set()
+        return call.result
+
+    def clear(self):
+        """Forget all finished results."""
+        with self._lock:
+            self._calls = {key: call for key, call in self._calls.items() if not call.done.is_set()}
+
+
+# Posting details shared by the run's posting scrapers, created on first use
+_posting_flight = None
+_flight_lock = threading.Lock()
+
+
+def get_posting_flight() -> SingleFlight:
+    """
+    Get or create the shared single-flight of posting detail scrapes (lazy singleton).
+
+    Returns:
+        SingleFlight instance shared by all posting scrapers
+    """
+    global _posting_flight
+    with _flight_lock:
+        if _posting_flight is None:
+            _posting_flight = SingleFlight()
+    return _posting_flight
@@ -0,0 +1,425 @@
+"""
+Deterministic mapping of structured job data to posting and listing fields.
+
+Covers schema.org JobPosting JSON-LD on posting pages and job lists
+captured from the JSON APIs of careers pages.
+"""
+import json
+import re
+from src.core.fetch.base import clean_html
+from src.core.fetch.job_data import (
+    DEPARTMENT_KEYS, EMPLOYMENT_TYPE_KEYS, LOCATION_KEYS, TITLE_KEYS, URL_KEYS, WORK_ARRANGEMENT_KEYS, field_value,
+)
+from src.core.scraper.validation import DEPARTMENTS
+
+# Posting fields extracted by the posting scraper prompt
+POSTING_FIELDS = ("title", "location", "work_arrangement", "salary", "term", "categories")
+
+# baseSalary unitText values and the salary types they map to
+SALARY_UNITS = {
+    "HOUR": "hourly",
+    "YEAR": "annually",
+    "MONTH": "monthly",
+    "WEEK": "weekly",
+    "DAY": "other",
+}
+
+# Start months of each term, see the posting scraper prompt
+TERM_MONTHS = {
+    "winter": (1, 2, 3, 4),
+    "spring": (5, 6, 7, 8),
+    "fall": (9, 10, 11, 12),
+}
+
+# Words in a title naming a term ("summer" internships start in the spring term)
+TERM_WORDS = {
+    "spring": ("spring", "summer"),
+    "fall": ("fall", "autumn"),
+    "winter": ("winter",),
+}
+
+# Words in a title that settle a category on their own
+CATEGORY_WORDS = {
+    "software": ("software", "developer", "backend", "back-end", "frontend", "front-end", "full stack",
+                 "full-stack", "devops", "site reliability", "mobile", "ios", "android", "web"),
+    "hardware": ("hardware", "electrical", "firmware", "embedded", "asic", "fpga", "silicon"),
+    "data": ("data", "machine learning", "analytics", "ml", "ai"),
+    "ui": ("ui", "ux", "designer", "user experience", "user interface"),
+    "product management": ("product manager", "product management"),
+    "business": ("business", "finance", "marketing", "sales", "operations", "strategy", "accounting"),
+}
+
+# Titles of internship and co-op roles, see the listing scraper prompt
+INTERNSHIP_TITLE = re.compile(r"\b(intern|interns|internships?|co-?ops?|students?)\b", re.IGNORECASE)
+
+# A location the listing prompt would write as "CITY, REGION", with an optional trailing country
+LOCATION_PATTERN = re.compile(r"^([A-Za-z][A-Za-z .'-]*), ([A-Za-z][A-Za-z .'-]*?)(?:, ([A-Za-z][A-Za-z .'-]*))?$")
+
+# Longest value kept when job data is sent to the model
+MAX_COMPACT_VALUE = 300
+
+# State and province names and their abbreviations
+REGION_ABBREVIATIONS = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
+    "colorado": "CO", "connecticut": "CT", "delaware": "DE", "district of columbia": "DC",
+    "florida": "FL", "georgia": "GA", "hawaii": "HI", "idaho": "ID", "illinois": "IL",
+    "indiana": "IN", "iowa": "IA", "kansas": "KS", "kentucky": "KY", "louisiana": "LA",
+    "maine": "ME", "maryland": "MD", "massachusetts": "MA", "michigan": "MI", "minnesota": "MN",
+    "mississippi": "MS", "missouri": "MO", "montana": "MT", "nebraska": "NE", "nevada": "NV",
+    "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM", "new york": "NY",
+    "north carolina": "NC", "north dakota": "ND", "ohio": "OH", "oklahoma": "OK", "oregon": "OR",
+    "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC", "south dakota": "SD",
+    "tennessee": "TN", "texas": "TX", "utah": "UT", "vermont": "VT", "virginia": "VA",
+    "washington": "WA", "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY",
+    "alberta": "AB", "british columbia": "BC", "manitoba": "MB", "new brunswick": "NB",
+    "newfoundland and labrador": "NL", "nova scotia": "NS", "ontario": "ON",
+    "prince edward island": "PE", "quebec": "QC", "saskatchewan": "SK",
+}
+REGION_CODES = set(REGION_ABBREVIATIONS.values())
+
+
+def _is_type(item: dict, type_name: str) -> bool:
+    """Check whether a JSON-LD object has a type, with or without a schema prefix."""
+    types = item.get("@type", [])
+    if not isinstance(types, list):
+        types = [types]
+    return any(isinstance(value, str) and value.rsplit("/", 1)[-1].rsplit(":", 1)[-1] == type_name
+               for value in types)
+
+
+def _as_list(value) -> list:
+    """Wrap a single JSON-LD value in a list."""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def find_job_posting(structured_data: list[dict]) -> dict | None:
+    """
+    Find the JobPosting among a page's JSON-LD objects.
+
+    Args:
+        structured_data: JSON-LD objects of the page
+
+    Returns:
+        The first JobPosting object, or None if the page has none
+    """
+    for item in structured_data:
+        if isinstance(item, dict) and _is_type(item, "JobPosting"):
+            return item
+    return None
+
+
+def _map_location(job: dict) -> list[str]:
+    """Format the physical job locations as "CITY, REGION"."""
+    locations = []
+    for place in _as_list(job.get("jobLocation")):
+        address = place.get("address") if isinstance(place, dict) else None
+        if isinstance(address, str):
+            location = address.strip()
+        elif isinstance(address, dict) and isinstance(address.get("addressLocality"), str):
+            city = address["addressLocality"].strip()
+            region = address.get("addressRegion") or address.get("addressCountry")
+            if isinstance(region, dict):
+                region = region.get("name")
+            region = region.strip() if isinstance(region, str) else ""
+            region = REGION_ABBREVIATIONS.get(region.lower(), region)
+            location = f"{city}, {region}" if region else city
+        else:
+            continue
+
+        if location and location not in locations:
+            locations.append(location)
+    return locations
+
+
+def _map_salary(job: dict) -> dict | None:
+    """Map baseSalary to a salary type and integer amount."""
+    base_salary = job.get("baseSalary")
+    if not isinstance(base_salary, dict):
+        return None
+
+    value = base_salary.get("value")
+    unit = base_salary.get("unitText")
+    if isinstance(value, dict):
+        unit = value.get("unitText", unit)
+        value = value.get("value", value.get("minValue"))
+
+    try:
+        amount = int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+    salary_type = SALARY_UNITS.get(str(unit).upper(), "other") if unit else "other"
+    return {"type": salary_type, "amount": amount}
+
+
+def _map_term(job: dict, title: str) -> list[str]:
+    """Derive terms from the start date, or from term words in the title."""
+    start_date = job.get("jobStartDate")
+    if isinstance(start_date, str):
+        match = re.match(r"\d{4}-(\d{2})", start_date)
+        if match:
+            month = int(match.group(1))
+            return [term for term, months in TERM_MONTHS.items() if month in months]
+
+    return title_terms(title)
+
+
+def title_terms(title: str) -> list[str]:
+    """
+    Get the terms named in a job title.
+
+    Args:
+        title: Job title
+
+    Returns:
+        Terms in TERM_WORDS order
+    """
+    words = re.findall(r"[a-z]+", title.lower())
+    return [term for term, term_words in TERM_WORDS.items() if any(word in words for word in term_words)]
+
+
+def _map_categories(title: str) -> list[str]:
+    """Derive categories from words in the title."""
+    lowered = f" {re.sub(r'[^a-z-]+', ' ', title.lower())} "
+    return [category for category, words in CATEGORY_WORDS.items()
+            if any(f" {word} " in lowered for word in words)]
+
+
+def map_job_posting(job: dict) -> dict:
+    """
+    Map a JobPosting to posting fields in the shape returned by the posting scraper prompt.
+
+    Only fields the structured data settles are returned. Fields that
+    would need judgement (a hybrid arrangement, categories not named in
+    the title) are left out for the model to extract.
+
+    Args:
+        job: JobPosting JSON-LD object
+
+    Returns:
+        Dict with a subset of POSTING_FIELDS
+    """
+    fields = {}
+
+    title = job.get("title") or job.get("name")
+    title = title.strip() if isinstance(title, str) else ""
+    if title:
+        fields["title"] = title
+
+    location = _map_location(job)
+    if location:
+        fields["location"] = location
+    elif "TELECOMMUTE" in _as_list(job.get("jobLocationType")):
+        # Fully remote jobs are TELECOMMUTE without an office location
+        fields["location"] = []
+        fields["work_arrangement"] = "remote"
+
+    salary = _map_salary(job)
+    if salary is not None:
+        fields["salary"] = salary
+
+    term = _map_term(job, title)
+    if term:
+        fields["term"] = term
+
+    categories = _map_categories(title)
+    if categories:
+        fields["categories"] = categories
+
+    return fields
+
+
+def job_posting_text(job: dict) -> str:
+    """
+    Get the text of a JobPosting's title and description.
+
+    Args:
+        job: JobPosting JSON-LD object
+
+    Returns:
+        Cleaned text, empty if the posting has no description
+    """
+    description = job.get("description")
+    if not isinstance(description, str) or not description.strip():
+        return ""
+
+    title = job.get("title") or job.get("name") or ""
+    return f"{title}\n{clean_html(description)}".strip()
+
+
+def is_internship(title: str) -> bool:
+    """
+    Check whether a job title names an internship or co-op role.
+
+    Args:
+        title: Job title
+
+    Returns:
+        True for intern, internship, co-op and student roles
+    """
+    return INTERNSHIP_TITLE.search(re.sub("[\u2010\u2011]", "-", title)) is not None
+
+
+def is_internship_item(item: dict) -> bool:
+    """
+    Check whether a job object from a careers page's JSON API is an internship or co-op role.
+
+    Args:
+        item: Job object from a JSON response
+
+    Returns:
+        True if its title or employment type names an internship or co-op
+    """
+    title = field_value(item, TITLE_KEYS)
+    if not isinstance(title, str):
+        return False
+    if is_internship(title):
+        return True
+
+    # Co-ops are often marked only by their type, e.g. {"employmentType": "Co-op"}
+    employment_type = field_value(item, EMPLOYMENT_TYPE_KEYS)
+    for value in _as_list(employment_type):
+        if isinstance(value, dict):
+            value = field_value(value, ("name", "label", "text"))
+        if isinstance(value, str) and is_internship(value):
+            return True
+    return False
+
+
+def normalize_location(name: str) -> str | None:
+    """
+    Normalize a job board location the way the listing prompt writes it.
+
+    Args:
+        name: Location text, e.g. "Toronto, Ontario, Canada"
+
+    Returns:
+        "CITY, REGION" with the state or province abbreviated, or None if
+        the text is not a single city in a US state or Canadian province
+        (e.g. "2 Locations")
+    """
+    match = LOCATION_PATTERN.match(name.strip())
+    if match is None:
+        return None
+    city, region, _ = (part.strip() if part else part for part in match.groups())
+    # Only known states and provinces, the model's spelling of anything else can't be predicted
+    abbreviation = REGION_ABBREVIATIONS.get(region.lower())
+    if abbreviation is None and region.upper() in REGION_CODES:
+        abbreviation = region.upper()
+    if abbreviation is None:
+        return None
+    return f"{city}, {abbreviation}"
+
+
+def _location_names(value) -> list[str]:
+    """Flatten a job board location value into location names."""
+    if isinstance(value, str):
+        return [value.strip()] if value.strip() else []
+    if isinstance(value, list):
+        return [name for item in value for name in _location_names(item)]
+    if isinstance(value, dict):
+        city = field_value(value, ("city", "addresslocality"))
+        region = field_value(value, ("state", "region", "addressregion", "country"))
+        if isinstance(city, str):
+            return [f"{city}, {region}" if isinstance(region, str) else city]
+        return _location_names(field_value(value, ("name", "locationname", "text", "label")))
+    return []
+
+
+def _work_arrangement(item: dict, locations: list[str]) -> str:
+    """Map a job board workplace value to a work arrangement."""
+    value = field_value(item, WORK_ARRANGEMENT_KEYS)
+    if value is True:
+        return "remote"
+    if isinstance(value, str):
+        lowered = value.lower()
+        for keyword, arrangement in (("remote", "remote"), ("hybrid", "hybrid"), ("on-site", "onsite"),
+                                     ("onsite", "onsite"), ("office", "onsite")):
+            if keyword in lowered:
+                return arrangement
+    if locations and all(location.lower() == "remote" for location in locations):
+        return "remote"
+    return ""
+
+
+def _department(item: dict) -> str:
+    """Map a job board department value to a listing department."""
+    value = field_value(item, DEPARTMENT_KEYS)
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = field_value(value, ("name", "label", "text"))
+    if not isinstance(value, str):
+        return ""
+    return next((department for department in DEPARTMENTS if department.lower() == value.strip().lower()), "")
+
+
+def map_job_data_item(item: dict) -> dict | None:
+    """
+    Map a job object from a careers page's JSON API to listing fields.
+
+    The fields match the listing scraper prompt's output. Only jobs whose
+    fields can be mapped the way the model would write them are mapped:
+    jobs without a title, a URL or path, or a "CITY, REGION" location for
+    each of their locations are left to the model.
+
+    Args:
+        item: Job object from a JSON response
+
+    Returns:
+        Dict of listing fields, or None if the job should be sent to the model
+    """
+    title = field_value(item, TITLE_KEYS)
+    title = title.strip() if isinstance(title, str) else ""
+
+    names = _location_names(field_value(item, LOCATION_KEYS))
+    location = [normalize_location(name) for name in names]
+
+    href = field_value(item, URL_KEYS)
+    if not isinstance(href, str) or not href.startswith(("http://", "https://", "/")):
+        href = ""
+
+    if not title or not href or not location or None in location:
+        return None
+
+    return {
+        "title": title,
+        "location": list(dict.fromkeys(location)),
+        "term": title_terms(title),
+        "department": _department(item),
+        "work_arrangement": _work_arrangement(item, location),
+        "href": href,
+        "href_is_url": href.startswith(("http://", "https://")),
+    }
+
+
+def compact_job_data(items: list[dict]) -> str:
+    """
+    Serialize job objects compactly for the model.
+
+    Long values such as descriptions and values nested more than three
+    levels deep are left out.
+
+    Args:
+        items: Job objects from a JSON response
+
+    Returns:
+        JSON array text
+    """
+    def compact(value, depth: int = 0):
+        if isinstance(value, str):
+            return value if len(value) <= MAX_COMPACT_VALUE else None
+        if isinstance(value, (int, float, bool)) or value is None:
+            return value
+        if depth >= 3:
+            return None
+        if isinstance(value, list):
+            return [item for item in (compact(item, depth + 1) for item in value) if item is not None]
+        if isinstance(value, dict):
+            return {key: item for key, item in ((key, compact(item, depth + 1)) for key, item in value.items())
+                    if item not in (None, "", [], {})}
+        return None
+
+    return json.dumps([compact(item) for item in items], separators=(",", ":"))
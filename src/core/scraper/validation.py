@@ -0,0 +1,96 @@
+"""
+Validation of model output against the Listing and Posting schemas in the scraper prompts.
+"""
+
+TERMS = ("spring", "winter", "fall")
+WORK_ARRANGEMENTS = ("remote", "hybrid", "onsite")
+DEPARTMENTS = ("Engineering", "Product Management", "Design", "Research", "Business/Operations", "Marketing")
+CATEGORIES = ("software", "hardware", "business", "data", "ui", "product management")
+SALARY_TYPES = ("hourly", "annually", "monthly", "weekly", "bi-weekly", "other", "none")
+
+
+def _validate_common(item: dict, prefix: str) -> list[str]:
+    """Validate the fields shared by listings and postings."""
+    errors = []
+
+    if not isinstance(item.get("title"), str) or not item["title"].strip():
+        errors.append(f"{prefix}title is missing")
+
+    location = item.get("location", [])
+    if not isinstance(location, list) or not all(isinstance(value, str) for value in location):
+        errors.append(f"{prefix}location is not a list of strings")
+
+    term = item.get("term", [])
+    if not isinstance(term, list) or any(value not in TERMS for value in term):
+        errors.append(f"{prefix}term {term!r} is not a list of {', '.join(TERMS)}")
+
+    work_arrangement = item.get("work_arrangement", "")
+    if work_arrangement and work_arrangement not in WORK_ARRANGEMENTS:
+        errors.append(f"{prefix}work_arrangement {work_arrangement!r} is not one of {', '.join(WORK_ARRANGEMENTS)}")
+
+    return errors
+
+
+def validate_listings(data) -> list[str]:
+    """
+    Validate the job listings returned for a careers page.
+
+    Args:
+        data: Decoded JSON returned by the model
+
+    Returns:
+        List of problems found (empty if the output is valid)
+    """
+    if not isinstance(data, list):
+        return ["output is not a JSON array"]
+
+    errors = []
+    for index, item in enumerate(data):
+        prefix = f"listing {index}: "
+        if not isinstance(item, dict):
+            errors.append(f"{prefix}is not an object")
+            continue
+
+        errors.extend(_validate_common(item, prefix))
+
+        department = item.get("department", "")
+        if department and department not in DEPARTMENTS:
+            errors.append(f"{prefix}department {department!r} is not one of {', '.join(DEPARTMENTS)}")
+        if not isinstance(item.get("href", ""), str):
+            errors.append(f"{prefix}href is not a string")
+        if not isinstance(item.get("href_is_url", True), bool):
+            errors.append(f"{prefix}href_is_url is not a boolean")
+
+    return errors
+
+
+def validate_posting(data) -> list[str]:
+    """
+    Validate the posting details returned for a job posting page.
+
+    Args:
+        data: Decoded JSON returned by the model
+
+    Returns:
+        List of problems found (empty if the output is valid)
+    """
+    if not isinstance(data, dict):
+        return ["output is not a JSON object"]
+
+    errors = _validate_common(data, "")
+
+    salary = data.get("salary", {"type": "none", "amount": 0})
+    if not isinstance(salary, dict):
+        errors.append("salary is not an object")
+    else:
+        if salary.get("type", "none") not in SALARY_TYPES:
+            errors.append(f"salary type {salary.get('type')!r} is not one of {', '.join(SALARY_TYPES)}")
+        amount = salary.get("amount", 0)
+        if not isinstance(amount, int) or isinstance(amount, bool) or amount < 0:
+            errors.append(f"salary amount {amount!r} is not a non-negative integer")
+
+    categories = data.get("categories", [])
+    if not isinstance(categories, list) or any(value not in CATEGORIES for value in categories):
+        errors.append(f"categories {categories!r} is not a list of {', '.join(CATEGORIES)}")
+
+    return errors
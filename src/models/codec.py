@@ -0,0 +1,103 @@
+"""
+Compact serialization of models for queues, checkpoints and caches.
+
+Models are encoded as orjson arrays of their field values in declaration
+order, prefixed with a one-letter type tag, e.g.
+["L", title, location, term, department, work_arrangement, href, href_is_url, company, hash].
+Listings carry their hash so the decoded copy does not recompute it; the
+hash is the exact Listing.hash() value of the encoded listing.
+"""
+from dataclasses import fields
+import orjson
+from src.models.company import Company
+from src.models.listing import Listing
+from src.models.posting import Posting
+
+_TAGS = {Company: "C", Listing: "L", Posting: "P"}
+_MODELS = {tag: model for model, tag in _TAGS.items()}
+_FIELDS = {
+    model: tuple(f.name for f in fields(model) if f.init)
+    for model in _TAGS
+}
+
+
+def to_dict(model) -> dict:
+    """
+    Convert a model to a plain dictionary of its constructor fields.
+
+    Args:
+        model: Company, Listing or Posting
+
+    Returns:
+        Dictionary that can be passed back to the model's constructor
+    """
+    return {name: _plain(getattr(model, name)) for name in _FIELDS[type(model)]}
+
+
+def from_dict(model_type: type, data: dict):
+    """
+    Build a model from a dictionary produced by to_dict().
+
+    Args:
+        model_type: Company, Listing or Posting
+        data: Dictionary of constructor fields
+
+    Returns:
+        Model instance
+    """
+    return model_type(**{name: data[name] for name in _FIELDS[model_type] if name in data})
+
+
+def encode(value) -> bytes:
+    """
+    Encode a model, or a list of models, to bytes.
+
+    Args:
+        value: Company, Listing or Posting, or a list of them
+
+    Returns:
+        Encoded bytes
+    """
+    if isinstance(value, list):
+        return orjson.dumps([_to_array(model) for model in value])
+    return orjson.dumps(_to_array(value))
+
+
+def decode(data: bytes | str):
+    """
+    Decode bytes produced by encode().
+
+    Args:
+        data: Encoded model or list of models
+
+    Returns:
+        Model instance, or list of model instances
+    """
+    array = orjson.loads(data)
+    if array and isinstance(array[0], list):
+        return [_from_array(item) for item in array]
+    if not array:
+        return []
+    return _from_array(array)
+
+
+def _plain(value):
+    return list(value) if isinstance(value, tuple) else value
+
+
+def _to_array(model) -> list:
+    model_type = type(model)
+    array = [_TAGS[model_type]]
+    array.extend(_plain(getattr(model, name)) for name in _FIELDS[model_type])
+    if model_type is Listing:
+        array.append(model.hash())
+    return array
+
+
+def _from_array(array: list):
+    model_type = _MODELS[array[0]]
+    names = _FIELDS[model_type]
+    model = model_type(*array[1:len(names) + 1])
+    if model_type is Listing:
+        object.__setattr__(model, "_hash", array[len(names) + 1])
+    return model
@@ -1,17 +1,23 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import hashlib
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Listing:
     title: str
-    location: list[str]
-    term: list[str]
+    location: tuple[str, ...]
+    term: tuple[str, ...]
     department: str
     work_arrangement: str
     href: str
     href_is_url: bool
     company: str
+    _hash: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Store lists as tuples so the cached hash can never go stale
+        object.__setattr__(self, "location", tuple(self.location))
+        object.__setattr__(self, "term", tuple(self.term))
 
     def __str__(self) -> str:
         locations_str = ", ".join(self.location)
@@ -19,6 +25,11 @@ class Listing:
         return f"{self.company} - {self.title} ({self.department}) - {locations_str} - {term_str} - {self.work_arrangement}"
 
     def hash(self) -> str:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", self._compute_hash())
+        return self._hash
+
+    def _compute_hash(self) -> str:
         title_part = self.title.lower().replace(" ", "")
         location_part = ",".join(sorted([loc.lower().replace(" ", "") for loc in self.location]))
         term_part = ",".join(sorted([term.lower().replace(" ", "") for term in self.term]))
@@ -3,7 +3,7 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Posting:
     title: str
     location: list[str]
@@ -1,8 +1,16 @@
 """
 Utility functions and helpers.
 """
-from src.utils.config import Config
+from typing import TYPE_CHECKING
+from src.utils.lazy import lazy_exports
 
-__all__ = [
-    'Config',
-]
\ No newline at end of file
+if TYPE_CHECKING:
+    from src.utils.config import Config
+
+_EXPORTS = {
+    'Config': 'src.utils.config',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -2,8 +2,14 @@
 Configuration management for InternDrop.
 """
 import os
+import threading
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
-from openai import OpenAI
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+    from supabase import Client
+    from src.utils.tokens import TokenLedger
 
 # Load environment variables from .env file
 load_dotenv()
@@ -14,6 +20,17 @@ class Config:
     # OpenAI API
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+    # Cheaper model tried first for small pages, escalating to OPENAI_MODEL on invalid output (empty disables)
+    OPENAI_FAST_MODEL = os.getenv('OPENAI_FAST_MODEL', 'gpt-4.1-nano')
+    FAST_MODEL_MAX_LISTING_TOKENS = int(os.getenv('FAST_MODEL_MAX_LISTING_TOKENS', 4000))
+    FAST_MODEL_MAX_POSTING_TOKENS = int(os.getenv('FAST_MODEL_MAX_POSTING_TOKENS', 8000))
+    # Stream listing replies, handing on each listing as soon as the model has written it
+    LLM_STREAMING = os.getenv('LLM_STREAMING', 'true').lower() == 'true'
+    # Token budgets per run and per company (0 for no limit)
+    LLM_RUN_TOKEN_BUDGET = int(os.getenv('LLM_RUN_TOKEN_BUDGET', 0))
+    LLM_COMPANY_TOKEN_BUDGET = int(os.getenv('LLM_COMPANY_TOKEN_BUDGET', 0))
+    # Share of the run budget after which posting detail parses fall back to listing data
+    LLM_SHED_RATIO = float(os.getenv('LLM_SHED_RATIO', 0.8))
 
     # Supabase
     SUPABASE_URL = os.getenv('SUPABASE_URL')
@@ -21,18 +38,104 @@ class Config:
 
     # Scraping Configuration
     MAX_PAGES_PER_COMPANY = int(os.getenv('MAX_PAGES_PER_COMPANY', 20))
+    # Pages fetched ahead while the current page is parsed (0 fetches strictly in turn)
+    PAGE_PREFETCH_DEPTH = int(os.getenv('PAGE_PREFETCH_DEPTH', 1))
     PAGE_SIMILARITY_THRESHOLD = float(os.getenv('PAGE_SIMILARITY_THRESHOLD', 0.8))
+    # Minimum title similarity for a new listing to reuse an existing posting with its terms and locations (above 1 disables)
+    LISTING_MATCH_THRESHOLD = float(os.getenv('LISTING_MATCH_THRESHOLD', 0.8))
+    # Send only the repeated job card region of careers pages to the model (whole page if none is found)
+    LISTING_REGION_DETECTION = os.getenv('LISTING_REGION_DETECTION', 'true').lower() == 'true'
+    # Sibling elements sharing a tag and classes needed to count as a job list
+    LISTING_REGION_MIN_REPEATS = int(os.getenv('LISTING_REGION_MIN_REPEATS', 3))
+    # Record JSON API responses while pages render and use job lists found in them
+    JOB_DATA_CAPTURE = os.getenv('JOB_DATA_CAPTURE', 'true').lower() == 'true'
+    JOB_DATA_MAX_RESPONSES = int(os.getenv('JOB_DATA_MAX_RESPONSES', 20))
+    JOB_DATA_MAX_BYTES = int(os.getenv('JOB_DATA_MAX_BYTES', 5 * 1024 * 1024))
     FETCH_TIMEOUT_MS = int(os.getenv('FETCH_TIMEOUT_MS', 20000))
     MIN_CRAWL_DELAY = int(os.getenv('MIN_CRAWL_DELAY', 5))
+    # When to scrape posting pages: "auto" publishes complete listings first and scrapes their pages
+    # in the background, "always" scrapes before publishing, "never" publishes listing data only
+    DETAIL_SCRAPE_MODE = os.getenv('DETAIL_SCRAPE_MODE', 'auto')
+    DETAIL_SCRAPE_ALWAYS_COMPANIES = [name.strip() for name in os.getenv('DETAIL_SCRAPE_ALWAYS_COMPANIES', '').split(',') if name.strip()]
+    DETAIL_SCRAPE_NEVER_COMPANIES = [name.strip() for name in os.getenv('DETAIL_SCRAPE_NEVER_COMPANIES', '').split(',') if name.strip()]
+    # Per-domain timeouts follow the recent p95 latency times this factor, within these bounds
+    FETCH_MIN_TIMEOUT_MS = int(os.getenv('FETCH_MIN_TIMEOUT_MS', 5000))
+    FETCH_TIMEOUT_MULTIPLIER = float(os.getenv('FETCH_TIMEOUT_MULTIPLIER', 2.0))
+    FETCH_LATENCY_WINDOW = int(os.getenv('FETCH_LATENCY_WINDOW', 20))
+    # Consecutive failed fetches before a domain is skipped for the rest of the run
+    CIRCUIT_BREAKER_FAILURES = int(os.getenv('CIRCUIT_BREAKER_FAILURES', 3))
+    # Seconds before an open circuit lets one trial fetch through (0 keeps it open for the run)
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS = float(os.getenv('CIRCUIT_BREAKER_COOLDOWN_SECONDS', 0))
+    # Headless results with fewer links than this share of the last good fetch are degraded
+    FETCH_DEGRADED_LINK_RATIO = float(os.getenv('FETCH_DEGRADED_LINK_RATIO', 0.5))
+    FETCH_MODE_RETRY_DAYS = float(os.getenv('FETCH_MODE_RETRY_DAYS', 7))
+    # Reuse a persistent browser profile per domain (disk cache, cookies, local storage) across fetches and runs
+    BROWSER_PROFILES = os.getenv('BROWSER_PROFILES', 'true').lower() == 'true'
+    # Disk cache cap of each profile, total size cap of all profiles, and days before an unused profile is deleted
+    BROWSER_PROFILE_CACHE_MB = int(os.getenv('BROWSER_PROFILE_CACHE_MB', 50))
+    BROWSER_PROFILE_MAX_MB = int(os.getenv('BROWSER_PROFILE_MAX_MB', 1024))
+    BROWSER_PROFILE_MAX_AGE_DAYS = float(os.getenv('BROWSER_PROFILE_MAX_AGE_DAYS', 30))
 
     # VM Configuration
     THREAD_POOL_SIZE = int(os.getenv('THREAD_POOL_SIZE', 10))
+    # Processes for HTML cleaning and page similarity (0 runs them in the calling thread)
+    CPU_POOL_SIZE = int(os.getenv('CPU_POOL_SIZE', 0))
+    # Listings waiting to be parsed, the scrape stage is throttled beyond these
+    LISTING_QUEUE_CAPACITY = int(os.getenv('LISTING_QUEUE_CAPACITY', 500))
+    LISTING_QUEUE_MEMORY_MB = int(os.getenv('LISTING_QUEUE_MEMORY_MB', 32))
+
+    # Shared HTTP transport for Supabase and OpenAI, pooled per host
+    HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', THREAD_POOL_SIZE * 2))
+    HTTP_KEEPALIVE_SECONDS = float(os.getenv('HTTP_KEEPALIVE_SECONDS', 60))
+    HTTP_TIMEOUT_SECONDS = float(os.getenv('HTTP_TIMEOUT_SECONDS', 120))
+    HTTP2 = os.getenv('HTTP2', 'true').lower() == 'true'
+
+    # Work Queue Configuration (sqlite:///path/to/queue.db or postgresql://...)
+    WORK_QUEUE_URL = os.getenv('WORK_QUEUE_URL')
+    WORK_QUEUE_LEASE_SECONDS = int(os.getenv('WORK_QUEUE_LEASE_SECONDS', 900))
+    WORK_QUEUE_MAX_ATTEMPTS = int(os.getenv('WORK_QUEUE_MAX_ATTEMPTS', 3))
+    WORK_QUEUE_POLL_SECONDS = float(os.getenv('WORK_QUEUE_POLL_SECONDS', 5))
+
+    # Local state (checkpoints, caches) kept between runs on the VM
+    STATE_DIR = os.getenv('STATE_DIR', '.interndrop')
+    CHECKPOINT_PATH = os.getenv('CHECKPOINT_PATH', os.path.join(STATE_DIR, 'checkpoint.db'))
+    FETCH_MODE_PATH = os.getenv('FETCH_MODE_PATH', os.path.join(STATE_DIR, 'fetch_modes.json'))
+    # Persistent browser profiles, one directory per domain
+    BROWSER_PROFILE_DIR = os.getenv('BROWSER_PROFILE_DIR', os.path.join(STATE_DIR, 'browser_profiles'))
+    # Job list region selectors learned per company
+    LISTING_REGION_PATH = os.getenv('LISTING_REGION_PATH', os.path.join(STATE_DIR, 'listing_regions.json'))
+    # Postings published from listing data and waiting for their page to be scraped
+    ENRICHMENT_QUEUE_PATH = os.getenv('ENRICHMENT_QUEUE_PATH', os.path.join(STATE_DIR, 'enrichment.db'))
+
+    # Posting events, appended to a local JSONL log as postings are created, updated and deleted
+    EVENT_LOG_ENABLED = os.getenv('EVENT_LOG_ENABLED', 'true').lower() == 'true'
+    EVENT_LOG_PATH = os.getenv('EVENT_LOG_PATH', os.path.join(STATE_DIR, 'events.jsonl'))
+    # Optional webhook the events are posted to in batches, resuming from a saved offset
+    EVENT_WEBHOOK_URL = os.getenv('EVENT_WEBHOOK_URL')
+    EVENT_WEBHOOK_CURSOR_PATH = os.getenv('EVENT_WEBHOOK_CURSOR_PATH', os.path.join(STATE_DIR, 'events_webhook.json'))
+    EVENT_WEBHOOK_BATCH_SIZE = int(os.getenv('EVENT_WEBHOOK_BATCH_SIZE', 100))
+    # Optional local server streaming the events as server-sent events at /events
+    EVENT_SERVER_ENABLED = os.getenv('EVENT_SERVER_ENABLED', 'false').lower() == 'true'
+    EVENT_SERVER_HOST = os.getenv('EVENT_SERVER_HOST', '127.0.0.1')
+    EVENT_SERVER_PORT = int(os.getenv('EVENT_SERVER_PORT', 8765))
+
+    # Local cache of the Companies table, refreshed when its version stamp changes
+    COMPANY_CATALOG_PATH = os.getenv('COMPANY_CATALOG_PATH', os.path.join(STATE_DIR, 'companies.json'))
+    COMPANY_CATALOG_REFRESH_HOURS = float(os.getenv('COMPANY_CATALOG_REFRESH_HOURS', 24))
 
-    # OpenAI client singleton
+    # Local mirror of the Postings table
+    USE_POSTING_MIRROR = os.getenv('USE_POSTING_MIRROR', 'true').lower() == 'true'
+    POSTING_MIRROR_PATH = os.getenv('POSTING_MIRROR_PATH', os.path.join(STATE_DIR, 'postings.db'))
+    POSTING_MIRROR_FULL_SYNC_HOURS = float(os.getenv('POSTING_MIRROR_FULL_SYNC_HOURS', 24))
+
+    # Client and ledger singletons, created on first use
     _openai_client = None
+    _supabase_client = None
+    _token_ledger = None
+    _client_lock = threading.Lock()
 
     @classmethod
-    def get_openai_client(cls) -> OpenAI:
+    def get_openai_client(cls) -> "OpenAI":
         """
         Get or create OpenAI client (lazy singleton).
         Reuses the same client instance across the application.
@@ -43,12 +146,59 @@ class Config:
         Raises:
             ValueError: If OPENAI_API_KEY is not set
         """
-        if cls._openai_client is None:
-            if not cls.OPENAI_API_KEY:
-                raise ValueError("OPENAI_API_KEY environment variable is required")
-            cls._openai_client = OpenAI(api_key=cls.OPENAI_API_KEY)
+        with cls._client_lock:
+            if cls._openai_client is None:
+                if not cls.OPENAI_API_KEY:
+                    raise ValueError("OPENAI_API_KEY environment variable is required")
+                from openai import OpenAI
+                from src.utils.transport import get_http_client
+                cls._openai_client = OpenAI(api_key=cls.OPENAI_API_KEY, http_client=get_http_client())
         return cls._openai_client
 
+    @classmethod
+    def get_supabase_client(cls) -> "Client":
+        """
+        Get or create Supabase client (lazy singleton).
+        Shared by all repositories instead of one client per repository,
+        with requests sent over the shared HTTP transport.
+
+        Returns:
+            Supabase client instance
+
+        Raises:
+            ValueError: If SUPABASE_URL or SUPABASE_KEY is not set
+        """
+        with cls._client_lock:
+            if cls._supabase_client is None:
+                if not cls.SUPABASE_URL or not cls.SUPABASE_KEY:
+                    raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
+                from supabase import ClientOptions, create_client
+                from src.utils.transport import get_http_client
+                cls._supabase_client = create_client(
+                    cls.SUPABASE_URL,
+                    cls.SUPABASE_KEY,
+                    options=ClientOptions(httpx_client=get_http_client()),
+                )
+        return cls._supabase_client
+
+    @classmethod
+    def get_token_ledger(cls) -> "TokenLedger":
+        """
+        Get or create the token ledger of the run (lazy singleton).
+
+        Returns:
+            TokenLedger with the configured budgets
+        """
+        with cls._client_lock:
+            if cls._token_ledger is None:
+                from src.utils.tokens import TokenLedger
+                cls._token_ledger = TokenLedger(
+                    run_budget=cls.LLM_RUN_TOKEN_BUDGET,
+                    company_budget=cls.LLM_COMPANY_TOKEN_BUDGET,
+                    shed_ratio=cls.LLM_SHED_RATIO,
+                )
+        return cls._token_ledger
+
     @classmethod
     def validate(cls):
         """Validate required configuration is present."""
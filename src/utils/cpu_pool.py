@@ -0,0 +1,97 @@
+"""
+Process pool for CPU-bound page processing.
+
+HTML cleaning and page similarity are pure-Python work. Run inside the
+worker's scraping threads they hold the GIL and stall the fetch and LLM
+threads, so they can be sent to a pool of worker processes instead. Page
+text is handed over through shared memory blocks rather than pickled
+through the executor's pipe.
+"""
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from src.utils.config import Config
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_cpu_pool() -> ProcessPoolExecutor | None:
+    """
+    Get or create the shared process pool (lazy singleton).
+
+    Returns:
+        The process pool, or None if Config.CPU_POOL_SIZE is 0
+    """
+    global _executor
+
+    if Config.CPU_POOL_SIZE <= 0:
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            # Spawn rather than fork, the parent process runs browser and I/O threads
+            _executor = ProcessPoolExecutor(
+                max_workers=Config.CPU_POOL_SIZE,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_executor.shutdown)
+        return _executor
+
+
+def run_with_shared_text(func, *texts: str):
+    """
+    Call a module-level function on one or more texts in the process pool.
+
+    Each text is written into its own shared memory block, and the pool
+    process rebuilds the texts from the blocks before calling the function.
+    Runs the function inline when the pool is disabled.
+
+    Args:
+        func: Picklable (module-level) function taking the texts as arguments
+        texts: Texts to pass to the function
+
+    Returns:
+        The function's return value
+    """
+    pool = get_cpu_pool()
+    if pool is None:
+        return func(*texts)
+
+    blocks = []
+    try:
+        for text in texts:
+            data = text.encode()
+            block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+            block.buf[:len(data)] = data
+            blocks.append((block, len(data)))
+
+        block_specs = [(block.name, size) for block, size in blocks]
+        return pool.submit(_call_with_shared_text, func, block_specs).result()
+    finally:
+        for block, _ in blocks:
+            block.close()
+            block.unlink()
+
+
+def _call_with_shared_text(func, block_specs: list[tuple[str, int]]):
+    """
+    Pool-side half of run_with_shared_text.
+
+    Args:
+        func: Function to call
+        block_specs: (shared memory name, byte length) per text argument
+
+    Returns:
+        The function's return value
+    """
+    texts = []
+    for name, size in block_specs:
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            texts.append(bytes(block.buf[:size]).decode())
+        finally:
+            block.close()
+    return func(*texts)
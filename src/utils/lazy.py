@@ -0,0 +1,34 @@
+"""
+Lazy package exports, so importing a package only loads the modules that are used.
+"""
+import importlib
+
+
+def lazy_exports(package: str, exports: dict[str, str]):
+    """
+    Build module-level __getattr__ and __dir__ functions (PEP 562) for a package.
+
+    Each exported name is imported from its module on first access and then
+    cached in the package namespace.
+
+    Args:
+        package: Name of the package (its __name__)
+        exports: Mapping of exported name to the module defining it
+
+    Returns:
+        Tuple of (__getattr__, __dir__) functions to assign in the package
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # __import__ rather than importlib.import_module so -X importtime reports the import
+        value = getattr(__import__(exports[name], fromlist=[name]), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
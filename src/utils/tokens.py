@@ -0,0 +1,174 @@
+"""
+Token accounting and budgets for LLM calls.
+"""
+import threading
+
+# Stages of a run, in decreasing priority. Listing parses decide which postings
+# exist, posting parses only add detail and are shed first.
+LISTING_STAGE = "listing"
+POSTING_STAGE = "posting"
+
+# Rough characters per token for English text and HTML-derived text
+CHARS_PER_TOKEN = 4
+
+# Tokens added per chat message by the chat format
+TOKENS_PER_MESSAGE = 4
+
+
+class TokenBudgetExceeded(Exception):
+    """Raised when an LLM call would exceed the run or company token budget."""
+    pass
+
+
+def estimate_tokens(*texts: str) -> int:
+    """
+    Estimate the prompt tokens of chat messages before sending them.
+
+    Args:
+        *texts: Content of each message
+
+    Returns:
+        Estimated number of tokens
+    """
+    return sum(len(text) // CHARS_PER_TOKEN + TOKENS_PER_MESSAGE for text in texts)
+
+
+class TokenLedger:
+    """
+    Per-run token usage, aggregated per stage, per company and per model.
+
+    Calls reserve their estimated prompt tokens before they are sent and
+    settle with the usage reported by the API afterwards, so concurrent
+    calls cannot all pass the budget check at once. Budgets of 0 are
+    unlimited. Posting parses are shed once the run reaches
+    shed_ratio of its budget, keeping the rest for listing parses.
+    Thread-safe for concurrent use.
+    """
+
+    def __init__(self, run_budget: int = 0, company_budget: int = 0, shed_ratio: float = 1.0):
+        """
+        Initialize the ledger.
+
+        Args:
+            run_budget: Maximum tokens for the whole run (0 for no limit)
+            company_budget: Maximum tokens per company (0 for no limit)
+            shed_ratio: Share of the run budget after which posting parses are shed
+        """
+        self.run_budget = run_budget
+        self.company_budget = company_budget
+        self.shed_ratio = shed_ratio
+
+        self._lock = threading.Lock()
+        self._reserved = 0
+        self._company_reserved = {}
+        self._run = self._empty_usage()
+        self._stages = {}
+        self._companies = {}
+        self._models = {}
+
+    def _empty_usage(self) -> dict:
+        return {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "estimated_tokens": 0, "shed": 0}
+
+    def _total(self, usage: dict) -> int:
+        return usage["prompt_tokens"] + usage["completion_tokens"]
+
+    def _exceeds_budget(self, stage: str, company: str, tokens: int) -> bool:
+        """Check whether more tokens would exceed a budget (caller holds the lock)."""
+        run_used = self._total(self._run) + self._reserved + tokens
+        if self.run_budget:
+            limit = self.run_budget * self.shed_ratio if stage == POSTING_STAGE else self.run_budget
+            if run_used > limit:
+                return True
+
+        if self.company_budget:
+            company_usage = self._companies.get(company, self._empty_usage())
+            company_used = self._total(company_usage) + self._company_reserved.get(company, 0) + tokens
+            if company_used > self.company_budget:
+                return True
+
+        return False
+
+    def _record_shed(self, stage: str, company: str):
+        """Count a call skipped for budget reasons (caller holds the lock)."""
+        for usage in (self._run, self._stages.setdefault(stage, self._empty_usage()),
+                      self._companies.setdefault(company, self._empty_usage())):
+            usage["shed"] += 1
+
+    def should_shed(self, stage: str, company: str) -> bool:
+        """
+        Check whether work of a stage should be skipped before doing any of it.
+
+        Args:
+            stage: LISTING_STAGE or POSTING_STAGE
+            company: Company the work is for
+
+        Returns:
+            True if the stage's budget for the company or the run is used up
+        """
+        with self._lock:
+            if self._exceeds_budget(stage, company, 0):
+                self._record_shed(stage, company)
+                return True
+            return False
+
+    def reserve(self, stage: str, company: str, estimated_tokens: int):
+        """
+        Reserve estimated tokens for a call about to be sent.
+
+        Args:
+            stage: LISTING_STAGE or POSTING_STAGE
+            company: Company the call is for
+            estimated_tokens: Estimated prompt tokens of the call
+
+        Raises:
+            TokenBudgetExceeded: If the call would exceed a budget
+        """
+        with self._lock:
+            if self._exceeds_budget(stage, company, estimated_tokens):
+                self._record_shed(stage, company)
+                raise TokenBudgetExceeded(f"{company}: {stage} call of ~{estimated_tokens} tokens exceeds the token budget")
+            self._reserved += estimated_tokens
+            self._company_reserved[company] = self._company_reserved.get(company, 0) + estimated_tokens
+
+    def settle(self, stage: str, company: str, estimated_tokens: int, prompt_tokens: int = 0,
+               completion_tokens: int = 0, model: str = None):
+        """
+        Replace a reservation with the usage reported by the API.
+
+        Args:
+            stage: Stage passed to reserve()
+            company: Company passed to reserve()
+            estimated_tokens: Tokens passed to reserve()
+            prompt_tokens: Prompt tokens used (0 if the call failed)
+            completion_tokens: Completion tokens used (0 if the call failed)
+            model: Model the call was sent to
+        """
+        with self._lock:
+            self._reserved -= estimated_tokens
+            self._company_reserved[company] -= estimated_tokens
+
+            usages = [self._run, self._stages.setdefault(stage, self._empty_usage()),
+                      self._companies.setdefault(company, self._empty_usage())]
+            if model is not None:
+                usages.append(self._models.setdefault(model, self._empty_usage()))
+            for usage in usages:
+                usage["calls"] += 1
+                usage["prompt_tokens"] += prompt_tokens
+                usage["completion_tokens"] += completion_tokens
+                usage["estimated_tokens"] += estimated_tokens
+
+    def usage(self) -> dict:
+        """
+        Get token usage so far.
+
+        Returns:
+            Dict with "run" usage and usage per stage in "stages", per company
+            in "companies" and per model in "models"
+        """
+        with self._lock:
+            return {
+                "run": dict(self._run),
+                "stages": {stage: dict(usage) for stage, usage in self._stages.items()},
+                "companies": {company: dict(usage) for company, usage in self._companies.items()},
+                "models": {model: dict(usage) for model, usage in self._models.items()},
+            }
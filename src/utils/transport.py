@@ -0,0 +1,149 @@
+"""
+Shared pooled HTTP transport for the Supabase and OpenAI clients.
+"""
+import importlib.util
+import threading
+import time
+from dataclasses import dataclass
+from src.utils.config import Config
+
+
+@dataclass
+class EndpointStats:
+    """Connection and request counters for one host."""
+    requests: int = 0
+    errors: int = 0
+    connections: int = 0
+    connect_ms: float = 0.0
+    tls_ms: float = 0.0
+    response_ms: float = 0.0
+
+
+class TransportMetrics:
+    """
+    Per-host connection metrics collected from httpx event hooks.
+
+    Each request gets an httpcore trace callback that times TCP connects,
+    TLS handshakes and the wait for response headers, so the metrics show
+    how many requests reused a pooled connection and what new ones cost.
+    Thread-safe for concurrent use.
+    """
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def _stats(self, host: str) -> EndpointStats:
+        """Get the counters of a host (caller holds the lock)."""
+        return self._endpoints.setdefault(host, EndpointStats())
+
+    def on_request(self, request):
+        """httpx request hook attaching a trace callback to the request."""
+        host = request.url.host
+        started = {}
+
+        def trace(event: str, info: dict):
+            step, _, phase = event.rpartition(".")
+            if phase == "started":
+                started[step] = time.perf_counter()
+                return
+
+            kind = step.rpartition(".")[2]
+            if phase != "complete" or kind not in ("connect_tcp", "start_tls", "receive_response_headers"):
+                return
+            if kind == "receive_response_headers":
+                # Time to first byte is measured from sending the request headers
+                step = step.replace(kind, "send_request_headers")
+            if step in started:
+                self._record(host, kind, (time.perf_counter() - started[step]) * 1000)
+
+        request.extensions["trace"] = trace
+
+    def _record(self, host: str, kind: str, elapsed_ms: float):
+        """Add a timed connection or response step to a host's counters."""
+        with self._lock:
+            stats = self._stats(host)
+            if kind == "connect_tcp":
+                stats.connections += 1
+                stats.connect_ms += elapsed_ms
+            elif kind == "start_tls":
+                stats.tls_ms += elapsed_ms
+            else:
+                stats.response_ms += elapsed_ms
+
+    def on_response(self, response):
+        """httpx response hook counting requests and error responses."""
+        with self._lock:
+            stats = self._stats(response.request.url.host)
+            stats.requests += 1
+            if response.status_code >= 400:
+                stats.errors += 1
+
+    def snapshot(self) -> dict:
+        """
+        Get the metrics of every host contacted.
+
+        Returns:
+            Mapping of host to request, connection and average latency figures
+        """
+        with self._lock:
+            endpoints = {host: EndpointStats(**vars(stats)) for host, stats in self._endpoints.items()}
+
+        return {
+            host: {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "connections": stats.connections,
+                "reused": max(stats.requests - stats.connections, 0),
+                "avg_connect_ms": round(stats.connect_ms / stats.connections, 1) if stats.connections else None,
+                "avg_tls_ms": round(stats.tls_ms / stats.connections, 1) if stats.connections else None,
+                "avg_response_ms": round(stats.response_ms / stats.requests, 1) if stats.requests else None,
+            }
+            for host, stats in sorted(endpoints.items())
+        }
+
+
+# Shared client and its metrics, created on first use
+_http_client = None
+_metrics = TransportMetrics()
+_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """
+    Get or create the shared httpx client (lazy singleton).
+
+    Keep-alive pools are sized by Config.HTTP_MAX_CONNECTIONS and HTTP/2 is
+    used when Config.HTTP2 is set and the h2 package is installed.
+
+    Returns:
+        httpx.Client instance shared by all API clients
+    """
+    global _http_client
+    with _client_lock:
+        if _http_client is None:
+            import httpx
+
+            _http_client = httpx.Client(
+                http2=Config.HTTP2 and importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=Config.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=Config.HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=Config.HTTP_KEEPALIVE_SECONDS,
+                ),
+                timeout=httpx.Timeout(Config.HTTP_TIMEOUT_SECONDS, connect=10.0),
+                follow_redirects=True,
+                event_hooks={"request": [_metrics.on_request], "response": [_metrics.on_response]},
+            )
+    return _http_client
+
+
+def get_transport_metrics() -> dict:
+    """
+    Get per-host connection metrics of the shared client.
+
+    Returns:
+        Mapping of host to request, connection and average latency figures
+    """
+    return _metrics.snapshot()
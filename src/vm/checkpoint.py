@@ -0,0 +1,199 @@
+"""
+Local checkpoint store so interrupted worker runs can be resumed.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from src.models import Company, Listing, codec
+
+
+class CheckpointStore:
+    """
+    Records worker progress in a local SQLite file.
+
+    Per company, the scraped listings are stored once the company finishes.
+    Per listing, a marker is stored once its posting has been parsed. The
+    postings to delete are stored before the final deletion. A resumed run
+    replays stored listings instead of re-fetching and re-parsing companies,
+    and skips listings that were already parsed.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            path: Path of the SQLite checkpoint file
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.run_id = None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create the checkpoint tables if they do not exist."""
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    started_at REAL NOT NULL,
+                    finished_at REAL
+                );
+                CREATE TABLE IF NOT EXISTS companies (
+                    run_id TEXT NOT NULL,
+                    company_key TEXT NOT NULL,
+                    listings BLOB NOT NULL,
+                    PRIMARY KEY (run_id, company_key)
+                );
+                CREATE TABLE IF NOT EXISTS parsed_listings (
+                    run_id TEXT NOT NULL,
+                    posting_id TEXT NOT NULL,
+                    PRIMARY KEY (run_id, posting_id)
+                );
+                CREATE TABLE IF NOT EXISTS pending_deletions (
+                    run_id TEXT PRIMARY KEY,
+                    posting_ids TEXT NOT NULL
+                );
+                """
+            )
+
+    def _company_key(self, company: Company) -> str:
+        return company.id or company.name
+
+    def start_run(self) -> str:
+        """
+        Start a new run, discarding checkpoints of earlier runs.
+
+        Returns:
+            ID of the new run
+        """
+        run_id = time.strftime("%Y%m%dT%H%M%S")
+        with self._lock:
+            for table in ("runs", "companies", "parsed_listings", "pending_deletions"):
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.execute(
+                "INSERT INTO runs (run_id, started_at) VALUES (?, ?)",
+                (run_id, time.time()),
+            )
+        self.run_id = run_id
+        return run_id
+
+    def resume_run(self) -> str:
+        """
+        Continue the most recent unfinished run, or start a new one if there is none.
+
+        Returns:
+            ID of the resumed or new run
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id FROM runs WHERE finished_at IS NULL ORDER BY started_at DESC LIMIT 1"
+            ).fetchone()
+
+        if row is None:
+            print("No unfinished run to resume, starting a new run")
+            return self.start_run()
+
+        self.run_id = row[0]
+        print(f"Resuming run {self.run_id}")
+        return self.run_id
+
+    def finish_run(self):
+        """Mark the current run as finished so it is not resumed again."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET finished_at = ? WHERE run_id = ?",
+                (time.time(), self.run_id),
+            )
+
+    def get_company_listings(self, company: Company) -> list[Listing] | None:
+        """
+        Get the listings stored for a company in the current run.
+
+        Args:
+            company: Company to look up
+
+        Returns:
+            Stored listings, or None if the company has no checkpoint yet
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT listings FROM companies WHERE run_id = ? AND company_key = ?",
+                (self.run_id, self._company_key(company)),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return codec.decode(row[0])
+
+    def save_company_listings(self, company: Company, listings: list[Listing]):
+        """
+        Store the listings scraped for a company in the current run.
+
+        Args:
+            company: Company the listings belong to
+            listings: Listings scraped from the company
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO companies (run_id, company_key, listings) VALUES (?, ?, ?)",
+                (self.run_id, self._company_key(company), codec.encode(listings)),
+            )
+
+    def get_parsed_listing_ids(self) -> set[str]:
+        """Get the IDs of listings already parsed in the current run."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT posting_id FROM parsed_listings WHERE run_id = ?",
+                (self.run_id,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_listing_parsed(self, posting_id: str):
+        """
+        Record that a listing has been parsed in the current run.
+
+        Args:
+            posting_id: ID of the listing's posting
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO parsed_listings (run_id, posting_id) VALUES (?, ?)",
+                (self.run_id, posting_id),
+            )
+
+    def get_pending_deletions(self) -> list[str] | None:
+        """
+        Get the posting IDs scheduled for deletion in the current run.
+
+        Returns:
+            Posting IDs, or None if the run has not reached the deletion step
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT posting_ids FROM pending_deletions WHERE run_id = ?",
+                (self.run_id,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_pending_deletions(self, posting_ids: list[str]):
+        """
+        Store the posting IDs to delete at the end of the current run.
+
+        Args:
+            posting_ids: IDs of postings that are no longer listed
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pending_deletions (run_id, posting_ids) VALUES (?, ?)",
+                (self.run_id, json.dumps(posting_ids)),
+            )
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
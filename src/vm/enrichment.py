@@ -0,0 +1,142 @@
+"""
+Background enrichment of postings published from listing data.
+"""
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+from src.core.events import EventSink
+from src.core.fetch.base import BaseFetcher
+from src.core.queue import BaseWorkQueue, SQLiteWorkQueue
+from src.core.repository import PostingRepository
+from src.core.scraper.posting import PostingScraper
+from src.models import Company, Listing, Posting, codec
+from src.utils.config import Config
+from src.utils.tokens import POSTING_STAGE
+
+ENRICHMENT_TOPIC = "enrichment"
+
+# Enrichment jobs carry over between runs, so they all belong to one run
+ENRICHMENT_RUN_ID = "enrichment"
+
+
+def create_enrichment_queue(path: str = None) -> SQLiteWorkQueue:
+    """
+    Open the local queue of postings waiting to be enriched.
+
+    The queue is shared by every run, so the jobs finished in earlier runs
+    are pruned when it is opened. Postings waiting to be enriched are kept.
+
+    Args:
+        path: Path of the SQLite database file (defaults to Config.ENRICHMENT_QUEUE_PATH)
+
+    Returns:
+        Work queue instance
+    """
+    path = path or Config.ENRICHMENT_QUEUE_PATH
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    enrichment_queue = SQLiteWorkQueue(path, ENRICHMENT_RUN_ID)
+
+    num_pruned = enrichment_queue.prune(ENRICHMENT_TOPIC)
+    if num_pruned:
+        print(f"Enrichment: pruned {num_pruned} finished jobs from earlier runs")
+    return enrichment_queue
+
+
+def queue_enrichment(enrichment_queue: BaseWorkQueue, company: Company, listing: Listing, posting: Posting):
+    """
+    Queue a posting published from listing data for a detail scrape.
+
+    Args:
+        enrichment_queue: Queue of postings waiting to be enriched
+        company: Company the listing belongs to
+        listing: Listing the posting was built from
+        posting: Posting that was published
+    """
+    # Postings enriched or given up on in an earlier run are queued again when they are republished
+    enrichment_queue.requeue(ENRICHMENT_TOPIC, posting.id, {
+        "company": codec.to_dict(company),
+        "listing": codec.to_dict(listing),
+        "date": posting.date,
+    })
+
+
+def enrich_postings(enrichment_queue: BaseWorkQueue, fetcher: BaseFetcher, posting_repo: PostingRepository,
+                    is_busy=None, stop_event: threading.Event = None, events: EventSink = None):
+    """
+    Scrape the pages of queued postings and update the postings with their details.
+
+    Runs at low priority: no job is started while is_busy() returns True.
+    Without a stop event, returns once the queue is empty. With one, keeps
+    waiting for new jobs until the event is set and the queue is empty.
+    Stops early when the token budget no longer allows posting parses,
+    leaving the remaining jobs for the next run. Jobs of companies whose
+    own budget is used up are held until the loop ends and then returned
+    to the queue without using up an attempt.
+
+    Args:
+        enrichment_queue: Queue of postings waiting to be enriched
+        fetcher: Shared fetcher instance
+        posting_repo: Repository the postings are updated in
+        is_busy: Optional callable returning True while higher priority work is pending
+        stop_event: Optional event set once no more jobs will be queued
+        events: Optional sink receiving an event for each enriched posting
+    """
+    posting_scraper = PostingScraper(fetcher=fetcher)
+    ledger = Config.get_token_ledger()
+    num_enriched = 0
+    # Leased jobs of companies over their budget, with the time their lease was last renewed
+    postponed = []
+
+    while True:
+        # Keep postponed jobs leased so they are not handed out again in this run
+        now = time.time()
+        for index, (postponed_job, renewed_at) in enumerate(postponed):
+            if now - renewed_at > enrichment_queue.lease_seconds / 2:
+                enrichment_queue.extend(postponed_job)
+                postponed[index] = (postponed_job, now)
+
+        if is_busy is not None and is_busy() and not (stop_event is not None and stop_event.is_set()):
+            time.sleep(1)
+            continue
+
+        if ledger.should_shed(POSTING_STAGE, ""):
+            print("Enrichment: token budget low, leaving remaining postings for the next run")
+            break
+
+        job = enrichment_queue.lease(ENRICHMENT_TOPIC)
+        if job is None:
+            if stop_event is None or stop_event.is_set():
+                break
+            stop_event.wait(Config.WORK_QUEUE_POLL_SECONDS)
+            continue
+
+        company = codec.from_dict(Company, job.payload["company"])
+        listing = codec.from_dict(Listing, job.payload["listing"])
+
+        if ledger.should_shed(POSTING_STAGE, company.name):
+            postponed.append((job, time.time()))
+            continue
+
+        try:
+            posting = posting_scraper.scrape_details(listing, company)
+            if posting is not None:
+                # Keep the date the posting was first published
+                updated = posting_repo.update(replace(posting, date=job.payload["date"]))
+                if updated is not None:
+                    num_enriched += 1
+                    print(f"{company.name}: ✓ Enriched posting: {posting.id}")
+                    if events:
+                        events.posting_updated(updated)
+            enrichment_queue.complete(job)
+
+        except Exception as e:
+            print(f"{company.name}: ✗ Error enriching {listing.title}: {e}")
+            enrichment_queue.release(job)
+
+    for postponed_job, _ in postponed:
+        enrichment_queue.release(postponed_job, count_attempt=False)
+    if postponed:
+        print(f"Enrichment: token budget low for some companies, left {len(postponed)} postings for the next run")
+
+    print(f"Enrichment: updated {num_enriched} postings, {enrichment_queue.counts(ENRICHMENT_TOPIC)}")
@@ -0,0 +1,293 @@
+"""
+Bounded listing queue with backpressure between the scrape and parse stages.
+"""
+import queue
+import sys
+import threading
+import time
+from src.utils.config import Config
+
+
+class MemoryBudget:
+    """
+    Accountant for the estimated bytes held between pipeline stages.
+
+    Producers reserve bytes before handing work over and consumers release
+    them once the work is taken, and producers block while the budget is
+    exhausted. Bytes held by producers themselves, like the text of the
+    pages being scraped, count towards the budget without blocking. A
+    reservation never blocks when no reserved bytes are waiting for a
+    consumer, so neither held bytes nor a single oversized item can
+    deadlock the pipeline.
+    """
+
+    def __init__(self, limit_bytes: int):
+        """
+        Initialize the memory budget.
+
+        Args:
+            limit_bytes: Maximum number of bytes that may be reserved at once
+        """
+        self.limit_bytes = limit_bytes
+        self.used_bytes = 0
+        # Part of used_bytes held by producers rather than waiting for a consumer
+        self.held_bytes = 0
+        self._condition = threading.Condition()
+
+    def reserve(self, nbytes: int) -> float:
+        """
+        Reserve bytes, waiting until they fit in the budget.
+
+        Args:
+            nbytes: Number of bytes to reserve
+
+        Returns:
+            Seconds spent waiting for the reservation
+        """
+        start = time.time()
+        with self._condition:
+            while self.used_bytes > self.held_bytes and self.used_bytes + nbytes > self.limit_bytes:
+                self._condition.wait()
+            self.used_bytes += nbytes
+        return time.time() - start
+
+    def release(self, nbytes: int):
+        """
+        Release previously reserved bytes.
+
+        Args:
+            nbytes: Number of bytes to release
+        """
+        with self._condition:
+            self.used_bytes = max(0, self.used_bytes - nbytes)
+            self._condition.notify_all()
+
+    def hold(self, nbytes: int):
+        """
+        Count bytes held by a producer, without waiting.
+
+        Args:
+            nbytes: Number of bytes held
+        """
+        with self._condition:
+            self.used_bytes += nbytes
+            self.held_bytes += nbytes
+
+    def release_held(self, nbytes: int):
+        """
+        Stop counting bytes previously passed to hold().
+
+        Args:
+            nbytes: Number of bytes no longer held
+        """
+        with self._condition:
+            self.held_bytes = max(0, self.held_bytes - nbytes)
+            self.used_bytes = max(0, self.used_bytes - nbytes)
+            self._condition.notify_all()
+
+    def wait_until_available(self) -> float:
+        """
+        Wait until the budget is no longer exhausted.
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.time()
+        with self._condition:
+            while self.used_bytes > self.held_bytes and self.used_bytes >= self.limit_bytes:
+                self._condition.wait()
+        return time.time() - start
+
+
+def estimate_item_size(item) -> int:
+    """
+    Estimate the memory held by a queued (Company, Listing) item.
+
+    Args:
+        item: (Company, Listing) tuple, (Company, None) for a company whose
+              site was unavailable, or None for the completion signal
+
+    Returns:
+        Estimated size in bytes
+    """
+    if item is None or item[1] is None:
+        return 0
+
+    # The Company object is shared by all of its listings, so only the listing counts
+    _, listing = item
+    size = sys.getsizeof(listing)
+    for value in (listing.title, listing.department, listing.work_arrangement, listing.href, listing.company):
+        size += sys.getsizeof(value)
+    for value in (*listing.location, *listing.term):
+        size += sys.getsizeof(value)
+    return size
+
+
+def estimate_page_size(fetched_page) -> int:
+    """
+    Estimate the memory held by the text of a fetched page.
+
+    Args:
+        fetched_page: FetchedPage returned by a fetcher
+
+    Returns:
+        Estimated size in bytes
+    """
+    return sys.getsizeof(fetched_page.text) + sys.getsizeof(fetched_page.region_text)
+
+
+class BudgetedFetcher:
+    """
+    Fetcher wrapper charging the text of the pages it fetches to a memory budget.
+
+    A company's pages are counted from when they are fetched, prefetched
+    ones included, until release() is called once its scrape is over.
+    Everything other than fetch_page() is delegated to the wrapped fetcher.
+    """
+
+    def __init__(self, fetcher, budget: MemoryBudget):
+        """
+        Initialize the budgeted fetcher.
+
+        Args:
+            fetcher: Fetcher to wrap
+            budget: Memory budget to charge page text to
+        """
+        self.fetcher = fetcher
+        self.budget = budget
+        self.held_bytes = 0
+        self.released = False
+        self._lock = threading.Lock()
+
+    def fetch_page(self, url: str, listing_region: str = None):
+        """Fetch a page with the wrapped fetcher and count its text as held."""
+        fetched_page = self.fetcher.fetch_page(url, listing_region)
+        size = estimate_page_size(fetched_page)
+        with self._lock:
+            # Prefetches finishing after the scrape are discarded, not held
+            if not self.released:
+                self.budget.hold(size)
+                self.held_bytes += size
+        return fetched_page
+
+    def release(self):
+        """Stop counting the text of every page fetched so far, and of any fetched later."""
+        with self._lock:
+            self.released = True
+            size, self.held_bytes = self.held_bytes, 0
+        self.budget.release_held(size)
+
+    def __getattr__(self, name):
+        return getattr(self.fetcher, name)
+
+
+class BoundedListingQueue(queue.Queue):
+    """
+    Listing queue with a fixed capacity and a memory budget.
+
+    put() blocks when the queue is full or the memory budget is used up,
+    which slows the scrape stage down to the pace of the parse stage. The
+    budget covers the queued listings and the text of the pages being
+    scraped for them (see fetch_pages_with()).
+    Queue depth and time spent waiting are tracked for reporting.
+    """
+
+    def __init__(self, maxsize: int = None, memory_budget_bytes: int = None):
+        """
+        Initialize the bounded listing queue.
+
+        Args:
+            maxsize: Maximum number of queued items
+                     (defaults to Config.LISTING_QUEUE_CAPACITY)
+            memory_budget_bytes: Maximum estimated bytes held by queued items
+                                 (defaults to Config.LISTING_QUEUE_MEMORY_MB)
+        """
+        if maxsize is None:
+            maxsize = Config.LISTING_QUEUE_CAPACITY
+        if memory_budget_bytes is None:
+            memory_budget_bytes = Config.LISTING_QUEUE_MEMORY_MB * 1024 * 1024
+
+        super().__init__(maxsize=maxsize)
+        self.budget = MemoryBudget(memory_budget_bytes)
+        self._stats_lock = threading.Lock()
+        self._sizes = {}
+        self.max_depth = 0
+        self.put_wait_seconds = 0.0
+        self.throttle_wait_seconds = 0.0
+
+    def put(self, item, block=True, timeout=None):
+        """Put an item, waiting for queue capacity and memory budget."""
+        size = estimate_item_size(item)
+        budget_wait = self.budget.reserve(size)
+
+        # Record the size first, the consumer may take the item as soon as it is queued
+        with self._stats_lock:
+            self._sizes[id(item)] = size
+
+        start = time.time()
+        try:
+            super().put(item, block, timeout)
+        except queue.Full:
+            with self._stats_lock:
+                self._sizes.pop(id(item), None)
+            self.budget.release(size)
+            raise
+
+        with self._stats_lock:
+            self.put_wait_seconds += budget_wait + (time.time() - start)
+            self.max_depth = max(self.max_depth, self.qsize())
+
+    def get(self, block=True, timeout=None):
+        """Get an item and release its share of the memory budget."""
+        item = super().get(block, timeout)
+        with self._stats_lock:
+            size = self._sizes.pop(id(item), 0)
+        self.budget.release(size)
+        return item
+
+    def fetch_pages_with(self, fetcher) -> BudgetedFetcher:
+        """
+        Wrap a fetcher so the text of the pages it fetches counts towards the memory budget.
+
+        Args:
+            fetcher: Fetcher used to scrape a company
+
+        Returns:
+            BudgetedFetcher whose release() must be called once the company is scraped
+        """
+        return BudgetedFetcher(fetcher, self.budget)
+
+    def wait_for_capacity(self):
+        """
+        Block a producer until the parse stage has caught up.
+
+        Called before scraping a company, so no new pages are fetched and
+        held in memory while the queue is full or the budget is used up.
+        """
+        start = time.time()
+        with self.not_full:
+            while self.maxsize > 0 and self._qsize() >= self.maxsize:
+                self.not_full.wait()
+        self.budget.wait_until_available()
+
+        with self._stats_lock:
+            self.throttle_wait_seconds += time.time() - start
+
+    def stats(self) -> dict:
+        """
+        Get queue depth and wait time statistics.
+
+        Returns:
+            Dictionary with current and max depth, memory use and wait times
+        """
+        with self._stats_lock:
+            return {
+                "depth": self.qsize(),
+                "max_depth": self.max_depth,
+                "capacity": self.maxsize,
+                "memory_used_bytes": self.budget.used_bytes,
+                "page_text_bytes": self.budget.held_bytes,
+                "memory_budget_bytes": self.budget.limit_bytes,
+                "put_wait_seconds": round(self.put_wait_seconds, 2),
+                "throttle_wait_seconds": round(self.throttle_wait_seconds, 2),
+            }
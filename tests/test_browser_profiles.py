@@ -0,0 +1,55 @@
+"""
+Test script to verify placement and cleanup of persistent browser profiles.
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.fetch.profiles import STORAGE_STATE_FILE, USER_DATA_DIR, BrowserProfiles
+
+
+def make_profile(root: str, name: str, cache_bytes: int, days_ago: float) -> Path:
+    """Create a profile directory with cached data, last used some days ago."""
+    profile = Path(root) / name
+    (profile / USER_DATA_DIR / "Cache").mkdir(parents=True)
+    (profile / USER_DATA_DIR / "Cache" / "data_0").write_bytes(b"x" * cache_bytes)
+    (profile / STORAGE_STATE_FILE).write_text('{"cookies": [], "origins": []}')
+    last_used = time.time() - days_ago * 86400
+    os.utime(profile, (last_used, last_used))
+    return profile
+
+
+def test_profile_per_domain():
+    """
+    Test that every URL of a domain maps to the same profile.
+    """
+    with tempfile.TemporaryDirectory() as root:
+        profiles = BrowserProfiles(root)
+
+        assert profiles.profile_dir("https://jobs.lever.co/acme/123") == profiles.profile_dir("https://JOBS.lever.co/other")
+        assert profiles.profile_dir("https://jobs.lever.co/acme") != profiles.profile_dir("https://boards.greenhouse.io/acme")
+        assert profiles.profile_dir("http://localhost:8080/jobs").name == "localhost_8080"
+
+
+def test_cleanup_evicts_least_recently_used():
+    """
+    Test that old profiles are deleted and the least recently used ones lose their user data past the size cap.
+    """
+    with tempfile.TemporaryDirectory() as root:
+        expired = make_profile(root, "expired.example.com", 1024, days_ago=60)
+        oldest = make_profile(root, "oldest.example.com", 700 * 1024, days_ago=3)
+        newest = make_profile(root, "newest.example.com", 700 * 1024, days_ago=1)
+
+        BrowserProfiles(root, max_mb=1, max_age_days=30)
+
+        assert not expired.exists()
+        # Over the cap, the oldest profile's user data goes but its storage state stays
+        assert not (oldest / USER_DATA_DIR).exists()
+        assert (oldest / STORAGE_STATE_FILE).exists()
+        assert (newest / USER_DATA_DIR / "Cache" / "data_0").exists()
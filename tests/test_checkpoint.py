@@ -0,0 +1,98 @@
+"""
+Test script to verify that interrupted runs resume from their checkpoint.
+"""
+import queue
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.vm.worker as worker
+from src.models import Listing
+from src.models.company import Company
+from src.vm.checkpoint import CheckpointStore
+
+COMPANY = Company(name="Acme", url="https://acme.example.com/careers", paged=False, page_query_param="")
+
+
+def make_listing(title: str) -> Listing:
+    """Build a listing of the test company."""
+    return Listing(title=title, location=["Toronto, ON"], term=["Summer"], department="Engineering",
+                   work_arrangement="", href=f"/jobs/{title}", href_is_url=False, company=COMPANY.name)
+
+
+def test_company_listings_and_deletions_round_trip(tmp_path):
+    """
+    Test that stored listings and pending deletions belong to the run that stored them.
+    """
+    checkpoint = CheckpointStore(str(tmp_path / "checkpoint.db"))
+    checkpoint.start_run()
+    listings = [make_listing("Software Intern"), make_listing("Data Intern")]
+
+    assert checkpoint.get_company_listings(COMPANY) is None
+    checkpoint.save_company_listings(COMPANY, listings)
+    assert checkpoint.get_company_listings(COMPANY) == listings
+
+    assert checkpoint.get_pending_deletions() is None
+    checkpoint.save_pending_deletions(["old"])
+    assert checkpoint.get_pending_deletions() == ["old"]
+
+    # A new run discards the checkpoints of the last one
+    checkpoint.start_run()
+    assert checkpoint.get_company_listings(COMPANY) is None
+    assert checkpoint.get_pending_deletions() is None
+    checkpoint.close()
+
+
+def test_resume_retries_failed_parses(tmp_path, monkeypatch):
+    """
+    Test that a listing whose parse failed is parsed again when the run is resumed, and parsed ones are not.
+    """
+    created, failing = make_listing("Software Intern"), make_listing("Data Intern")
+
+    class PostingRepo:
+        def get_all(self):
+            return []
+
+    def start_enrichment(*args, **kwargs):
+        thread = threading.Thread(target=lambda: None)
+        thread.start()
+        return None, threading.Event(), thread
+
+    parsed = []
+
+    def parse_listing(company, listing, *args):
+        parsed.append(listing)
+        return listing != failing
+
+    monkeypatch.setattr(worker, "create_posting_repository", lambda: PostingRepo())
+    monkeypatch.setattr(worker, "start_enrichment", start_enrichment)
+    monkeypatch.setattr(worker, "parse_listing", parse_listing)
+    # The run is interrupted before its deletion step
+    monkeypatch.setattr(worker, "delete_stale_postings", lambda *args, **kwargs: None)
+
+    def run(checkpoint: CheckpointStore):
+        listings = queue.Queue()
+        for listing in (created, failing):
+            listings.put((COMPANY, listing))
+        listings.put(None)
+        worker.parse_all_listings(listings, fetcher=None, checkpoint=checkpoint)
+
+    path = str(tmp_path / "checkpoint.db")
+    checkpoint = CheckpointStore(path)
+    checkpoint.start_run()
+    run(checkpoint)
+    assert parsed == [created, failing]
+    assert checkpoint.get_parsed_listing_ids() == {created.hash()}
+    checkpoint.close()
+
+    parsed.clear()
+    resumed = CheckpointStore(path)
+    resumed.resume_run()
+    assert resumed.run_id == checkpoint.run_id
+    run(resumed)
+    assert parsed == [failing]
+    resumed.close()
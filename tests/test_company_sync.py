@@ -0,0 +1,160 @@
+"""
+Test script to verify syncing the Companies table and the cached company catalog.
+"""
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.repository import CompanyCatalog, CompanyRepository
+from src.models import Company
+from src.utils.config import Config
+
+
+class FakeQuery:
+    """Chained Supabase query over an in-memory table."""
+
+    def __init__(self, client, table: str):
+        self.client = client
+        self.rows = client.tables.setdefault(table, [])
+        self.action = "select"
+        self.payload = None
+        self.filters = []
+
+    def select(self, columns: str):
+        return self
+
+    def insert(self, rows):
+        self.action, self.payload = "insert", rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows, on_conflict: str):
+        self.action, self.payload, self.conflict = "upsert", rows if isinstance(rows, list) else [rows], on_conflict
+        return self
+
+    def delete(self):
+        self.action = "delete"
+        return self
+
+    def eq(self, column: str, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column: str, values):
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def execute(self):
+        self.client.calls.append(self.action)
+        matching = [row for row in self.rows if all(check(row) for check in self.filters)]
+        if self.action == "select":
+            return SimpleNamespace(data=[dict(row) for row in matching])
+        if self.action == "delete":
+            self.rows[:] = [row for row in self.rows if row not in matching]
+            return SimpleNamespace(data=matching)
+
+        written = []
+        for row in self.payload:
+            key = getattr(self, "conflict", None)
+            existing = next((current for current in self.rows if key and current.get(key) == row[key]), None)
+            if existing is not None:
+                existing.update(row)
+                written.append(dict(existing))
+            else:
+                row = {"id": uuid.uuid4().hex, **row} if "key" not in row else dict(row)
+                self.rows.append(row)
+                written.append(dict(row))
+        return SimpleNamespace(data=written)
+
+
+class FakeClient:
+    """In-memory stand-in for the Supabase client."""
+
+    def __init__(self):
+        self.tables = {}
+        self.calls = []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+
+def make_company(name: str, url: str = None) -> Company:
+    return Company(name=name, url=url or f"https://{name.lower()}.example.com/careers", paged=False,
+                   page_query_param=None)
+
+
+def test_sync_creates_updates_and_deletes(monkeypatch):
+    """
+    Test that sync() inserts new companies, updates changed ones, deletes missing ones and bumps the version once.
+    """
+    client = FakeClient()
+    monkeypatch.setattr(Config, "get_supabase_client", lambda: client)
+    repository = CompanyRepository()
+    repository.sync([make_company("Acme"), make_company("Globex"), make_company("Initech")])
+    first_version = repository.get_version()
+    assert first_version is not None
+
+    changes = repository.sync([make_company("Acme"), make_company("Globex", "https://globex.example.com/jobs"),
+                               make_company("Hooli")])
+
+    assert [company.name for company in changes["created"]] == ["Hooli"]
+    assert [company.name for company in changes["updated"]] == ["Globex"]
+    assert [company.name for company in changes["deleted"]] == ["Initech"]
+    companies = {company.name: company for company in repository.get_all()}
+    assert set(companies) == {"Acme", "Globex", "Hooli"}
+    assert companies["Globex"].url == "https://globex.example.com/jobs"
+    assert repository.get_version() != first_version
+
+    # Nothing to change, nothing written and the version is kept
+    client.calls.clear()
+    version = repository.get_version()
+    assert not any(repository.sync([make_company("Acme"), make_company("Globex", "https://globex.example.com/jobs"),
+                                    make_company("Hooli")]).values())
+    assert repository.get_version() == version
+    assert set(client.calls) == {"select"}
+
+
+def test_sync_keep_missing_and_dry_run(monkeypatch):
+    """
+    Test that delete=False keeps companies missing from the list and a dry run applies nothing.
+    """
+    client = FakeClient()
+    monkeypatch.setattr(Config, "get_supabase_client", lambda: client)
+    repository = CompanyRepository()
+    repository.sync([make_company("Acme"), make_company("Globex")])
+
+    changes = repository.sync([make_company("Acme"), make_company("Hooli")], delete=False)
+    assert changes["deleted"] == []
+    assert {company.name for company in repository.get_all()} == {"Acme", "Globex", "Hooli"}
+
+    version = repository.get_version()
+    changes = repository.sync([make_company("Initech")], dry_run=True)
+    assert [company.name for company in changes["created"]] == ["Initech"]
+    assert len(changes["deleted"]) == 3
+    assert {company.name for company in repository.get_all()} == {"Acme", "Globex", "Hooli"}
+    assert repository.get_version() == version
+
+
+def test_catalog_refreshes_when_version_changes(tmp_path, monkeypatch):
+    """
+    Test that the cached catalog is reused until a sync bumps the version.
+    """
+    client = FakeClient()
+    monkeypatch.setattr(Config, "get_supabase_client", lambda: client)
+    repository = CompanyRepository()
+    repository.sync([make_company("Acme")])
+
+    catalog = CompanyCatalog(repository, str(tmp_path / "companies.json"))
+    assert [company.name for company in catalog.get_all()] == ["Acme"]
+
+    # Edits made outside sync() are not seen while the version is unchanged
+    client.tables["Companies"].append({"id": "x", "name": "Globex", "url": "https://globex.example.com",
+                                       "paged": False, "page_query_param": None})
+    assert [company.name for company in catalog.get_all()] == ["Acme"]
+
+    repository.sync([make_company("Acme"), make_company("Hooli")], delete=False)
+    assert {company.name for company in catalog.get_all()} == {"Acme", "Globex", "Hooli"}
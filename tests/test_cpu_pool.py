@@ -0,0 +1,50 @@
+"""
+Test script to verify that page cleaning and similarity give the same results in the CPU process pool.
+"""
+import sys
+from functools import partial
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.fetch.base import clean_html, parse_html
+from src.core.scraper.listing import calculate_similarity
+from src.utils import cpu_pool
+from src.utils.config import Config
+
+PAGE = (
+    "<html><head><script type=\"application/ld+json\">{\"@type\": \"JobPosting\", \"title\": \"Intern\"}</script>"
+    "<style>body {}</style></head><body><nav><a href=\"/about\">About</a></nav>"
+    "<main id=\"openings\">"
+    + "".join(f"<div class=\"job\"><a href=\"/jobs/{i}\">Software Intern {i} – Café</a><span>Toronto, ON</span></div>"
+              for i in range(5))
+    + "</main></body></html>"
+)
+
+
+def test_pool_results_match_inline(monkeypatch):
+    """
+    Test that cleaning and similarity run through the process pool match the in-process functions.
+    """
+    monkeypatch.setattr(Config, "CPU_POOL_SIZE", 0)
+    inline_text = cpu_pool.run_with_shared_text(clean_html, PAGE)
+    inline_page = cpu_pool.run_with_shared_text(partial(parse_html, listing_region=""), PAGE)
+    other_text = inline_text.replace("Intern 4", "Intern 9")
+    inline_similarity = cpu_pool.run_with_shared_text(calculate_similarity, inline_text, other_text)
+
+    monkeypatch.setattr(Config, "CPU_POOL_SIZE", 1)
+    monkeypatch.setattr(cpu_pool, "_executor", None)
+    try:
+        assert cpu_pool.get_cpu_pool() is not None
+        assert cpu_pool.run_with_shared_text(clean_html, PAGE) == inline_text == clean_html(PAGE)
+        assert cpu_pool.run_with_shared_text(partial(parse_html, listing_region=""), PAGE) == inline_page
+        assert cpu_pool.run_with_shared_text(calculate_similarity, inline_text, other_text) == inline_similarity
+        # Empty texts still get a shared memory block
+        assert cpu_pool.run_with_shared_text(calculate_similarity, "", "") == calculate_similarity("", "")
+    finally:
+        cpu_pool._executor.shutdown()
+
+    assert "Café" in inline_text
+    assert inline_page.region_selector == "main#openings"
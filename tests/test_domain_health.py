@@ -0,0 +1,101 @@
+"""
+Test script to verify adaptive fetch timeouts and the per-domain circuit breaker.
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.fetch.health import DomainHealth
+from src.utils.config import Config
+
+URL = "https://careers.acme.example.com/jobs"
+OTHER_URL = "https://jobs.other.example.com/"
+
+
+def test_timeout_follows_domain_latency(monkeypatch):
+    """
+    Test that timeouts follow each domain's p95 latency once there are enough samples, within the bounds.
+    """
+    monkeypatch.setattr(Config, "FETCH_TIMEOUT_MS", 20000)
+    monkeypatch.setattr(Config, "FETCH_MIN_TIMEOUT_MS", 5000)
+    monkeypatch.setattr(Config, "FETCH_TIMEOUT_MULTIPLIER", 2.0)
+    health = DomainHealth()
+
+    health.record_success(URL, 4000)
+    health.record_success(URL, 4000)
+    assert health.timeout_ms(URL) == 20000
+
+    health.record_success(URL, 4000)
+    assert health.timeout_ms(URL) == 8000
+    assert health.timeout_ms(OTHER_URL) == 20000
+
+    # Fast domains are clamped to the minimum, slow ones to the default
+    for _ in range(3):
+        health.record_success(OTHER_URL, 100)
+    assert health.timeout_ms(OTHER_URL) == 5000
+    for _ in range(20):
+        health.record_success(URL, 15000)
+    assert health.timeout_ms(URL) == 20000
+
+    snapshot = health.snapshot()["careers.acme.example.com"]
+    assert snapshot["p50_ms"] == 15000
+    assert snapshot["timeout_ms"] == 20000
+
+
+def test_circuit_opens_after_consecutive_failures(monkeypatch):
+    """
+    Test that only consecutive failures open the circuit, which then stays open for the run by default.
+    """
+    monkeypatch.setattr(Config, "CIRCUIT_BREAKER_FAILURES", 3)
+    monkeypatch.setattr(Config, "CIRCUIT_BREAKER_COOLDOWN_SECONDS", 0)
+    health = DomainHealth()
+
+    health.record_failure(URL)
+    health.record_failure(URL)
+    assert health.is_failing(URL) and not health.is_open(URL)
+    health.record_success(URL, 100)
+    assert not health.is_failing(URL)
+
+    for _ in range(3):
+        health.record_failure(URL)
+    assert health.is_open(URL)
+    assert not health.is_open(OTHER_URL)
+    assert health.snapshot()["careers.acme.example.com"]["circuit_open"]
+
+    time.sleep(0.05)
+    assert health.is_open(URL)
+
+
+def test_half_open_trial_closes_or_reopens(monkeypatch):
+    """
+    Test that after the cooldown one trial fetch goes through, closing the circuit on success and reopening it on failure.
+    """
+    monkeypatch.setattr(Config, "CIRCUIT_BREAKER_FAILURES", 2)
+    monkeypatch.setattr(Config, "CIRCUIT_BREAKER_COOLDOWN_SECONDS", 0.1)
+    health = DomainHealth()
+
+    health.record_failure(URL)
+    health.record_failure(URL)
+    assert health.is_open(URL)
+
+    # Half-open: the first caller is the trial, others still fail fast
+    time.sleep(0.15)
+    assert not health.is_open(URL)
+    assert health.is_open(URL)
+    assert health.snapshot()["careers.acme.example.com"]["circuit_half_open"]
+
+    # A failed trial opens the circuit for another cooldown
+    health.record_failure(URL)
+    assert health.is_open(URL)
+    assert not health.snapshot()["careers.acme.example.com"]["circuit_half_open"]
+
+    time.sleep(0.15)
+    assert not health.is_open(URL)
+    health.record_success(URL, 100)
+    assert not health.is_open(URL)
+    assert not health.is_failing(URL)
+    assert not health.snapshot()["careers.acme.example.com"]["circuit_open"]
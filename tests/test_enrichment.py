@@ -0,0 +1,116 @@
+"""
+Test script to verify that background enrichment keeps postponed and finished postings queueable.
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.vm.enrichment as enrichment
+from src.core.queue.base import DEAD, DONE, PENDING
+from src.models import Listing, Posting
+from src.models.company import Company
+from src.utils.config import Config
+from src.utils.tokens import POSTING_STAGE, TokenLedger
+
+
+def make_job(company_name: str) -> tuple[Company, Listing, Posting]:
+    """Build a company, listing and posting published from the listing."""
+    company = Company(name=company_name, url=f"https://{company_name.lower()}.example.com/careers",
+                      paged=False, page_query_param="")
+    listing = Listing(title="Software Intern", location=["Toronto, ON"], term=["Summer"], department="Engineering",
+                      work_arrangement="", href="/jobs/1", href_is_url=False, company=company_name)
+    posting = Posting(title=listing.title, location=list(listing.location), work_arrangement="", salary=0,
+                      salary_type="none", url=listing.href, term=list(listing.term), categories=[],
+                      company=company_name, id=listing.hash(), date=0)
+    return company, listing, posting
+
+
+class FakePostingScraper:
+    """Posting scraper finding no details, recording the companies it was asked about."""
+    scraped = []
+
+    def __init__(self, fetcher=None):
+        pass
+
+    def scrape_details(self, listing, company):
+        self.scraped.append(company.name)
+        return None
+
+
+def test_budget_shed_jobs_keep_their_attempts(monkeypatch):
+    """
+    Test that jobs of a company over its budget stay pending across runs instead of dying.
+    """
+    ledger = TokenLedger(company_budget=100)
+    ledger.reserve(POSTING_STAGE, "Over", 0)
+    ledger.settle(POSTING_STAGE, "Over", 0, prompt_tokens=200)
+    monkeypatch.setattr(Config, "_token_ledger", ledger)
+    monkeypatch.setattr(enrichment, "PostingScraper", FakePostingScraper)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        enrichment_queue = enrichment.create_enrichment_queue(str(Path(tmp) / "enrichment.db"))
+        for company_name in ("Over", "Within"):
+            enrichment.queue_enrichment(enrichment_queue, *make_job(company_name))
+
+        for _ in range(Config.WORK_QUEUE_MAX_ATTEMPTS + 1):
+            enrichment.enrich_postings(enrichment_queue, fetcher=None, posting_repo=None)
+
+        assert FakePostingScraper.scraped == ["Within"]
+        assert enrichment_queue.counts(enrichment.ENRICHMENT_TOPIC) == {PENDING: 1, DONE: 1}
+
+        job = enrichment_queue.lease(enrichment.ENRICHMENT_TOPIC)
+        assert job.payload["company"]["name"] == "Over"
+        assert job.attempts == 1
+        enrichment_queue.close()
+
+
+def test_finished_postings_can_be_queued_again():
+    """
+    Test that a posting enriched or given up on before is queued again when it is republished.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        enrichment_queue = enrichment.create_enrichment_queue(str(Path(tmp) / "enrichment.db"))
+        company, listing, posting = make_job("Acme")
+
+        enrichment.queue_enrichment(enrichment_queue, company, listing, posting)
+        assert enrichment_queue.complete(enrichment_queue.lease(enrichment.ENRICHMENT_TOPIC))
+
+        enrichment.queue_enrichment(enrichment_queue, company, listing, posting)
+        for _ in range(enrichment_queue.max_attempts):
+            enrichment_queue.release(enrichment_queue.lease(enrichment.ENRICHMENT_TOPIC))
+        assert enrichment_queue.counts(enrichment.ENRICHMENT_TOPIC) == {DEAD: 1}
+
+        # A waiting job is left alone, a dead one starts over
+        enrichment.queue_enrichment(enrichment_queue, company, listing, posting)
+        assert not enrichment_queue.requeue(enrichment.ENRICHMENT_TOPIC, posting.id, {})
+        job = enrichment_queue.lease(enrichment.ENRICHMENT_TOPIC)
+        assert job.attempts == 1
+        assert job.payload["listing"]["title"] == "Software Intern"
+        enrichment_queue.close()
+
+
+def test_finished_jobs_pruned_at_the_start_of_a_run():
+    """
+    Test that jobs done or given up on in earlier runs are deleted when the queue is opened, keeping waiting ones.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "enrichment.db")
+        enrichment_queue = enrichment.create_enrichment_queue(path)
+        for company_name in ("Done", "Dead", "Waiting"):
+            enrichment.queue_enrichment(enrichment_queue, *make_job(company_name))
+
+        assert enrichment_queue.complete(enrichment_queue.lease(enrichment.ENRICHMENT_TOPIC))
+        for _ in range(enrichment_queue.max_attempts):
+            enrichment_queue.release(enrichment_queue.lease(enrichment.ENRICHMENT_TOPIC))
+        assert enrichment_queue.counts(enrichment.ENRICHMENT_TOPIC) == {DONE: 1, DEAD: 1, PENDING: 1}
+        enrichment_queue.close()
+
+        enrichment_queue = enrichment.create_enrichment_queue(path)
+        assert enrichment_queue.counts(enrichment.ENRICHMENT_TOPIC) == {PENDING: 1}
+        job = enrichment_queue.lease(enrichment.ENRICHMENT_TOPIC)
+        assert job.payload["company"]["name"] == "Waiting"
+        enrichment_queue.close()
@@ -0,0 +1,87 @@
+"""
+Test script to verify the posting event log and its event stream.
+"""
+import http.client
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.events import EventLog, EventServer, POSTING_CREATED, POSTING_DELETED
+from src.models import Posting
+
+POSTING = Posting(
+    title="Software Engineering Intern",
+    location=["Toronto, ON"],
+    work_arrangement="hybrid",
+    salary=40,
+    salary_type="hourly",
+    url="https://example.com/jobs/1",
+    term=["fall"],
+    categories=["software"],
+    company="Acme",
+    id="abc",
+    date=1700000000,
+)
+
+
+def test_offsets_survive_reopening(tmp_path):
+    """
+    Test that offsets continue after reopening and a torn last line is dropped.
+    """
+    path = str(tmp_path / "events.jsonl")
+    log = EventLog(path)
+    assert log.posting_created(POSTING)["offset"] == 0
+    assert log.posting_deleted("old")["offset"] == 1
+    log.close()
+
+    with open(path, "ab") as f:
+        f.write(b'{"offset": 2, "ty')
+
+    log = EventLog(path)
+    assert log.next_offset == 2
+    assert log.posting_deleted("abc", POSTING)["offset"] == 2
+
+    events = log.read(1)
+    assert [(event["offset"], event["type"], event["id"]) for event in events] == [
+        (1, POSTING_DELETED, "old"),
+        (2, POSTING_DELETED, "abc"),
+    ]
+    assert events[1]["data"]["title"] == POSTING.title
+    assert [event["offset"] for event in log.read(0, limit=1)] == [0]
+    assert log.read(3) == []
+    log.close()
+
+
+def test_stream_resumes_from_offset(tmp_path):
+    """
+    Test that the event server streams events from the requested offset.
+    """
+    log = EventLog(str(tmp_path / "events.jsonl"))
+    log.posting_created(POSTING)
+    log.posting_deleted("old")
+
+    server = EventServer(log, "127.0.0.1", 0)
+    server.start()
+    try:
+        connection = http.client.HTTPConnection(*server.address, timeout=5)
+        connection.request("GET", "/events", headers={"Last-Event-ID": "0"})
+        response = connection.getresponse()
+        assert response.getheader("Content-Type") == "text/event-stream"
+
+        lines = [response.fp.readline().decode().strip() for _ in range(3)]
+        assert lines[:2] == ["id: 1", f"event: {POSTING_DELETED}"]
+        assert json.loads(lines[2][len("data: "):])["id"] == "old"
+
+        # New events reach open streams
+        log.posting_created(POSTING)
+        response.fp.readline()
+        assert response.fp.readline().decode().strip() == "id: 2"
+        assert response.fp.readline().decode().strip() == f"event: {POSTING_CREATED}"
+        connection.close()
+    finally:
+        server.stop()
+        log.close()
@@ -0,0 +1,357 @@
+"""
+Offline benchmark of listing hash stability and extraction drift.
+
+Runs ListingScraper.parse() several times over a recorded corpus of
+cleaned careers pages and reports, per company, how stable the listing
+hashes are, which fields drift between runs and how many extra LLM calls
+the churn implies per run (every new hash is a posting parse, every lost
+one a delete). Results are appended to a history file together with the
+prompt and model they were measured with, so prompt and model changes
+can be compared by their churn cost.
+
+Usage:
+    python tests/test_extraction_drift.py record Stripe Ramp   # fetch pages into the corpus
+    python tests/test_extraction_drift.py run --runs 5          # parse with the model
+    python tests/test_extraction_drift.py replay                # re-score recorded replies, no API calls
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from src.core.scraper.listing import ListingScraper
+from src.models.listing import Listing
+from src.utils.config import Config
+
+DEFAULT_CORPUS_DIR = os.path.join(Config.STATE_DIR, "drift_corpus")
+DEFAULT_HISTORY_PATH = os.path.join(Config.STATE_DIR, "drift_history.jsonl")
+PROMPT_PATH = project_root / "src" / "shared" / "listing_scraper_prompt.txt"
+
+# Listing fields compared between runs, the first three feed the listing hash
+DRIFT_FIELDS = ("title", "location", "term", "department", "work_arrangement", "href_is_url")
+HASH_FIELDS = ("title", "location", "term")
+
+
+def listing_key(listing: Listing) -> str:
+    """Key matching the same job across runs, its link or else its title."""
+    return listing.href.strip().lower() or listing.title.lower().replace(" ", "")
+
+
+def listing_drift(runs: list[list[Listing]]) -> dict:
+    """
+    Measure hash stability and field drift of one page parsed several times.
+
+    Args:
+        runs: Listings of each parse of the page, in run order
+
+    Returns:
+        Dictionary with the number of distinct hashes, the share of them
+        found in every run, the jobs whose fields differ between runs per
+        field, the jobs missing from some runs, and the new hashes and lost
+        hashes per run (LLM calls and deletes the churn causes in production)
+    """
+    hash_sets = [{listing.hash() for listing in listings} for listings in runs]
+    all_hashes = set().union(*hash_sets) if hash_sets else set()
+    stable_hashes = set.intersection(*hash_sets) if hash_sets else set()
+
+    # Jobs matched across runs, with the sorted values of each field per run
+    jobs = {}
+    for run, listings in enumerate(runs):
+        for listing in listings:
+            jobs.setdefault(listing_key(listing), [[] for _ in runs])[run].append(listing)
+
+    field_drift = {field: 0 for field in DRIFT_FIELDS}
+    missing_jobs = 0
+    for per_run in jobs.values():
+        if not all(per_run):
+            missing_jobs += 1
+            continue
+        for field in DRIFT_FIELDS:
+            values = {tuple(sorted(repr(getattr(listing, field)) for listing in listings)) for listings in per_run}
+            if len(values) > 1:
+                field_drift[field] += 1
+
+    pairs = list(zip(hash_sets, hash_sets[1:]))
+    new_per_run = sum(len(after - before) for before, after in pairs) / len(pairs) if pairs else 0
+    lost_per_run = sum(len(before - after) for before, after in pairs) / len(pairs) if pairs else 0
+
+    return {
+        "runs": len(runs),
+        "hashes": len(all_hashes),
+        "hash_stability": round(len(stable_hashes) / len(all_hashes), 3) if all_hashes else 1.0,
+        "field_drift": field_drift,
+        "missing_jobs": missing_jobs,
+        "extra_llm_calls_per_run": round(new_per_run, 2),
+        "deletes_per_run": round(lost_per_run, 2),
+    }
+
+
+def summarize(companies: dict[str, dict]) -> dict:
+    """Add up the per-company results of a benchmark."""
+    field_drift = {field: sum(result["field_drift"][field] for result in companies.values()) for field in DRIFT_FIELDS}
+    hashes = sum(result["hashes"] for result in companies.values())
+    stable = sum(result["hashes"] * result["hash_stability"] for result in companies.values())
+    return {
+        "hashes": hashes,
+        "hash_stability": round(stable / hashes, 3) if hashes else 1.0,
+        "hash_field_drift": sum(field_drift[field] for field in HASH_FIELDS),
+        "field_drift": field_drift,
+        "extra_llm_calls_per_run": round(sum(r["extra_llm_calls_per_run"] for r in companies.values()), 2),
+        "deletes_per_run": round(sum(r["deletes_per_run"] for r in companies.values()), 2),
+    }
+
+
+def load_corpus(corpus_dir: str) -> list[dict]:
+    """Load the recorded pages of a corpus directory, one JSON file per company."""
+    pages = []
+    for path in sorted(Path(corpus_dir).glob("*.json")):
+        with open(path) as f:
+            pages.append({**json.load(f), "path": str(path)})
+    return pages
+
+
+def save_corpus_page(corpus_dir: str, page: dict):
+    """Write a company's recorded page to the corpus directory."""
+    Path(corpus_dir).mkdir(parents=True, exist_ok=True)
+    path = Path(corpus_dir) / f"{page['company'].lower().replace(' ', '_')}.json"
+    with open(path, "w") as f:
+        json.dump({key: value for key, value in page.items() if key != "path"}, f, indent=2)
+
+
+def record_corpus(company_names: list[str], corpus_dir: str):
+    """
+    Fetch the first careers page of companies and save the text the model is given.
+
+    Args:
+        company_names: Names of the companies to record (all if empty)
+        corpus_dir: Directory of the corpus
+    """
+    from src.core.fetch import RoutingFetcher
+    from src.core.fetch.regions import get_listing_region_cache
+    from src.core.repository import CompanyCatalog
+
+    companies = CompanyCatalog().get_all()
+    if company_names:
+        companies = [company for company in companies if company.name in company_names]
+
+    fetcher = RoutingFetcher()
+    regions = get_listing_region_cache() if Config.LISTING_REGION_DETECTION else None
+    for company in companies:
+        listing_region = regions.get(company.name) if regions is not None else None
+        page = fetcher.fetch_page(company.url, listing_region)
+        text = page.region_text or page.text
+        if not text:
+            print(f"{company.name}: no content, skipped")
+            continue
+        save_corpus_page(corpus_dir, {"company": company.name, "url": company.url, "text": text, "replies": []})
+        print(f"{company.name}: recorded {len(text)} chars")
+
+
+def run_benchmark(pages: list[dict], runs: int, replay: bool = False) -> dict[str, dict]:
+    """
+    Parse every recorded page several times and measure its drift.
+
+    Args:
+        pages: Recorded pages from load_corpus()
+        runs: Number of parses per page
+        replay: Use each page's recorded replies instead of calling the model
+
+    Returns:
+        Drift results by company
+    """
+    scraper = None if replay else ListingScraper()
+
+    results = {}
+    for page in pages:
+        company = page["company"]
+        if replay:
+            replies = page.get("replies", [])
+            if not replies:
+                print(f"{company}: no recorded replies, skipped")
+                continue
+            parsed = [[ListingScraper.to_listing(job_dict, company) for job_dict in reply] for reply in replies[:runs]]
+        else:
+            parsed = [scraper.parse(page["text"], company) for _ in range(runs)]
+            # Keep the replies so the benchmark can be re-scored offline
+            page["replies"] = [[listing_dict(listing) for listing in listings] for listings in parsed]
+
+        results[company] = listing_drift(parsed)
+    return results
+
+
+def listing_dict(listing: Listing) -> dict:
+    """Convert a Listing back to the listing prompt's output shape."""
+    return {
+        "title": listing.title,
+        "location": list(listing.location),
+        "term": list(listing.term),
+        "department": listing.department,
+        "work_arrangement": listing.work_arrangement,
+        "href": listing.href,
+        "href_is_url": listing.href_is_url,
+    }
+
+
+def benchmark_settings() -> dict:
+    """Identify the prompt and models a benchmark is measured with."""
+    with open(PROMPT_PATH, "rb") as f:
+        prompt_hash = hashlib.sha256(f.read()).hexdigest()[:12]
+    return {
+        "prompt": prompt_hash,
+        "model": Config.OPENAI_MODEL,
+        "fast_model": Config.OPENAI_FAST_MODEL,
+        "streaming": Config.LLM_STREAMING,
+    }
+
+
+def append_history(history_path: str, entry: dict) -> dict | None:
+    """
+    Append a benchmark result to the history file.
+
+    Args:
+        history_path: Path of the JSONL history
+        entry: Benchmark result
+
+    Returns:
+        The previous entry, or None if the history was empty
+    """
+    previous = None
+    if os.path.exists(history_path):
+        with open(history_path) as f:
+            for line in f:
+                if line.strip():
+                    previous = json.loads(line)
+
+    Path(history_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+    return previous
+
+
+def print_report(entry: dict, previous: dict = None):
+    """Print per-company and total drift, compared to the previous benchmark."""
+    print("=" * 60)
+    print("EXTRACTION DRIFT BENCHMARK")
+    print("=" * 60)
+    print(f"Prompt {entry['settings']['prompt']}, model {entry['settings']['model']} "
+          f"(fast {entry['settings']['fast_model'] or 'off'}), {entry['runs']} runs\n")
+
+    for company, result in sorted(entry["companies"].items()):
+        drifting = {field: count for field, count in result["field_drift"].items() if count}
+        print(f"  - {company}: {result['hashes']} hashes, stability {result['hash_stability']:.0%}, "
+              f"{result['extra_llm_calls_per_run']} extra LLM calls/run, "
+              f"{result['missing_jobs']} jobs missing from some runs, drift {drifting or 'none'}")
+
+    total = entry["total"]
+    print(f"\nTotal: stability {total['hash_stability']:.0%}, {total['extra_llm_calls_per_run']} extra LLM calls "
+          f"and {total['deletes_per_run']} deletes per run, {total['hash_field_drift']} hash field drifts")
+
+    if previous:
+        print(f"Previous ({previous['settings']['prompt']}, {previous['settings']['model']}): "
+              f"stability {previous['total']['hash_stability']:.0%}, "
+              f"{previous['total']['extra_llm_calls_per_run']} extra LLM calls per run")
+    print("=" * 60)
+
+
+def make_listing(title: str, location: list[str], href: str, department: str = "Engineering") -> Listing:
+    """Build a listing for the tests below."""
+    return Listing(title=title, location=location, term=["Summer 2027"], department=department,
+                   work_arrangement="", href=href, href_is_url=True, company="Acme")
+
+
+def test_listing_drift_metrics():
+    """
+    Test that hash churn, field drift and missing jobs are counted per run.
+    """
+    stable = make_listing("Software Intern", ["Toronto, ON"], "https://acme.example.com/jobs/1")
+    runs = [
+        [stable, make_listing("Data Intern", ["Toronto, ON"], "https://acme.example.com/jobs/2")],
+        [stable, make_listing("Data Intern", ["Toronto, Ontario"], "https://acme.example.com/jobs/2", "Data")],
+        [stable, make_listing("Data Intern", ["Toronto, ON"], "https://acme.example.com/jobs/2"),
+         make_listing("ML Intern", ["Remote"], "https://acme.example.com/jobs/3")],
+    ]
+
+    result = listing_drift(runs)
+
+    assert result["hashes"] == 4
+    assert result["hash_stability"] == 0.25
+    assert result["field_drift"]["location"] == 1
+    assert result["field_drift"]["department"] == 1
+    assert result["field_drift"]["title"] == 0
+    assert result["missing_jobs"] == 1
+    # Run 2 swaps one hash, run 3 swaps one back and adds one
+    assert result["extra_llm_calls_per_run"] == 1.5
+    assert result["deletes_per_run"] == 1.0
+
+    assert listing_drift([[stable], [stable]])["extra_llm_calls_per_run"] == 0
+
+
+def test_replay_corpus():
+    """
+    Test that recorded replies are re-scored and tracked in the history without calling the model.
+    """
+    reply = [listing_dict(make_listing("Software Intern", ["Toronto, ON"], "https://acme.example.com/jobs/1"))]
+    drifted = [{**reply[0], "term": ["Summer"]}]
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        save_corpus_page(corpus_dir, {"company": "Acme", "url": "https://acme.example.com/careers",
+                                      "text": "Software Intern", "replies": [reply, drifted, reply]})
+        save_corpus_page(corpus_dir, {"company": "Unrecorded", "url": "https://other.example.com", "text": "x",
+                                      "replies": []})
+
+        companies = run_benchmark(load_corpus(corpus_dir), runs=3, replay=True)
+        assert list(companies) == ["Acme"]
+        assert companies["Acme"]["field_drift"]["term"] == 1
+        assert companies["Acme"]["extra_llm_calls_per_run"] == 1
+
+        history_path = os.path.join(corpus_dir, "history.jsonl")
+        entry = {"time": 0, "runs": 3, "settings": benchmark_settings(), "companies": companies,
+                 "total": summarize(companies)}
+        assert append_history(history_path, entry) is None
+        assert append_history(history_path, entry)["total"]["hash_field_drift"] == 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure listing hash stability and extraction drift over a recorded corpus"
+    )
+    parser.add_argument("mode", choices=["record", "run", "replay"],
+                        help="record pages, parse them with the model, or re-score recorded replies")
+    parser.add_argument("companies", nargs="*", help="Companies to record (all when omitted)")
+    parser.add_argument("--runs", type=int, default=5, help="Parses per page (defaults to 5)")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR, help="Corpus directory")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH, help="JSONL file the results are appended to")
+
+    args = parser.parse_args()
+
+    if args.mode == "record":
+        record_corpus(args.companies, args.corpus)
+        sys.exit(0)
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"Error: no recorded pages in {args.corpus}, run the record mode first")
+        sys.exit(1)
+
+    companies = run_benchmark(pages, args.runs, replay=args.mode == "replay")
+    if args.mode == "run":
+        for page in pages:
+            save_corpus_page(args.corpus, page)
+
+    entry = {
+        "time": int(time.time()),
+        "mode": args.mode,
+        "runs": args.runs,
+        "settings": benchmark_settings(),
+        "companies": companies,
+        "total": summarize(companies),
+    }
+    print_report(entry, append_history(args.history, entry))
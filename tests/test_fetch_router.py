@@ -0,0 +1,100 @@
+"""
+Test script to verify that the routing fetcher escalates degraded headless fetches to a headed browser.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.fetch import router
+from src.core.fetch.page import FetchedPage
+from src.core.fetch.router import HEADED, HEADLESS, RoutingFetcher
+from src.utils.config import Config
+
+URL = "https://careers.acme.example.com/jobs"
+JOBS_PAGE = " ".join(f"Software Intern {i} (HREF: /jobs/{i})" for i in range(10))
+
+
+def make_fetcher(tmp_path, headless_text: str, headed_text: str = JOBS_PAGE) -> RoutingFetcher:
+    """Build a routing fetcher whose browsers return fixed pages, recording which ones ran."""
+    fetcher = RoutingFetcher(state_path=str(tmp_path / "fetch_modes.json"))
+    fetcher.calls = []
+
+    def browser(mode: str, text: str):
+        def fetch(url, listing_region=None):
+            fetcher.calls.append(mode)
+            return FetchedPage(text=text)
+        return fetch
+
+    fetcher.headless_fetcher._fetch_impl = browser(HEADLESS, headless_text)
+    fetcher.headed_fetcher._fetch_impl = browser(HEADED, headed_text)
+    return fetcher
+
+
+def test_is_degraded(tmp_path):
+    """
+    Test that empty pages, bot walls and pages missing most of their links are degraded.
+    """
+    fetcher = make_fetcher(tmp_path, JOBS_PAGE)
+
+    assert fetcher.is_degraded(URL, "")
+    assert fetcher.is_degraded(URL, "Just a moment... Checking your browser before accessing acme.example.com")
+    assert not fetcher.is_degraded(URL, JOBS_PAGE)
+    # A long page mentioning a marker is real content
+    assert not fetcher.is_degraded(URL, JOBS_PAGE * 20 + " Enable JavaScript for the best experience")
+
+    fetcher._record_success(URL, JOBS_PAGE, HEADLESS)
+    few_links = " ".join(f"Intern {i} (HREF: /jobs/{i})" for i in range(3))
+    assert fetcher.is_degraded(URL, few_links)
+    assert not fetcher.is_degraded(URL, " ".join(f"Intern {i} (HREF: /jobs/{i})" for i in range(6)))
+
+
+def test_degraded_headless_escalates_and_is_remembered(tmp_path, monkeypatch):
+    """
+    Test that a bot-walled site is fetched headed, remembered across runs and probed headless again later.
+    """
+    fetcher = make_fetcher(tmp_path, "Verify you are human")
+
+    assert fetcher._fetch_impl(URL).text == JOBS_PAGE
+    assert fetcher.calls == [HEADLESS, HEADED]
+    assert fetcher.mode_for(URL) == HEADED
+
+    # The new mode is written at once, and later runs go straight to the headed browser
+    next_run = make_fetcher(tmp_path, "Verify you are human")
+    assert next_run._fetch_impl(URL).text == JOBS_PAGE
+    assert next_run.calls == [HEADED]
+
+    monkeypatch.setattr(Config, "FETCH_MODE_RETRY_DAYS", 0)
+    time.sleep(0.01)
+    assert next_run.mode_for(URL) == HEADLESS
+
+
+def test_unchanged_fetches_do_not_rewrite_state(tmp_path, monkeypatch):
+    """
+    Test that repeated fetches with unchanged link counts leave the state file alone until it is flushed.
+    """
+    fetcher = make_fetcher(tmp_path, JOBS_PAGE)
+    writes = []
+    save_state = fetcher._save_state
+    monkeypatch.setattr(fetcher, "_save_state", lambda: writes.append(1) or save_state())
+
+    for _ in range(50):
+        fetcher._fetch_impl(URL)
+    assert len(writes) == 1  # The domain's first headless success
+
+    for i in range(50):
+        fetcher._fetch_impl(f"{URL}?page={i}")
+    assert len(writes) == 1
+
+    fetcher.save_state()
+    assert len(writes) == 2
+    with open(tmp_path / "fetch_modes.json") as f:
+        assert len(json.load(f)["link_counts"]) == 51
+
+    monkeypatch.setattr(router, "STATE_SAVE_INTERVAL", 0)
+    fetcher._fetch_impl(f"{URL}?page=new")
+    assert len(writes) == 3
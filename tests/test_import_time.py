@@ -0,0 +1,111 @@
+"""
+Import-time benchmark guarding the cold start of scripts and tests.
+
+Run directly to print the cumulative import time of each package:
+    python tests/test_import_time.py
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Dependencies that must only load when the subsystem using them is touched
+HEAVY_MODULES = ("playwright", "openai", "supabase", "bs4", "psycopg")
+
+# Packages that must import without any heavy dependency
+LIGHT_IMPORTS = (
+    "src",
+    "src.models",
+    "src.utils.config",
+    "src.core.fetch",
+    "src.core.repository",
+    "src.core.queue",
+    "src.core.index",
+)
+
+# Cumulative import time allowed for `import src`
+IMPORT_BUDGET_MS = 200
+
+
+def measure_import(statement: str) -> dict[str, int]:
+    """
+    Import modules in a fresh interpreter with -X importtime.
+
+    Args:
+        statement: Python statement to run, e.g. "import src"
+
+    Returns:
+        Mapping of each imported module to its cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        timings[module.strip()] = int(cumulative)
+    return timings
+
+
+def heavy_modules_loaded(timings: dict[str, int]) -> set[str]:
+    """Get the heavy dependencies among the imported modules."""
+    return {module.split(".")[0] for module in timings} & set(HEAVY_MODULES)
+
+
+def test_light_imports_skip_heavy_dependencies():
+    """
+    Test that importing packages does not load Playwright, OpenAI, Supabase, bs4 or psycopg.
+    """
+    for module in LIGHT_IMPORTS:
+        timings = measure_import(f"import {module}")
+        assert not heavy_modules_loaded(timings), f"import {module} loads {heavy_modules_loaded(timings)}"
+
+
+def test_lazy_exports_resolve():
+    """
+    Test that package exports still resolve when accessed.
+    """
+    timings = measure_import("from src.core.fetch import DomainHealth; from src.core.index import Q")
+    assert "src.core.fetch.health" in timings
+    assert "src.core.index.query" in timings
+
+
+def test_import_src_within_budget():
+    """
+    Test that `import src` stays within the cold start budget.
+    """
+    timings = measure_import("import src")
+    assert timings["src"] / 1000 < IMPORT_BUDGET_MS
+
+
+def run_import_benchmark():
+    """Print the cumulative import time of each package and its slowest dependencies."""
+    print("=" * 80)
+    print("IMPORT TIME BENCHMARK")
+    print("=" * 80)
+
+    for module in LIGHT_IMPORTS + ("src.core.fetch.router", "src.core.repository.posting", "src.vm.worker"):
+        timings = measure_import(f"import {module}")
+        heavy = ", ".join(sorted(heavy_modules_loaded(timings))) or "none"
+        print(f"{module:32} {timings[module] / 1000:8.1f}ms  heavy: {heavy}")
+
+    timings = measure_import("import src.vm.worker")
+    print("\nSlowest imports for the worker:")
+    for module, cumulative in sorted(timings.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {module:40} {cumulative / 1000:8.1f}ms")
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    run_import_benchmark()
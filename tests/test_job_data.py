@@ -0,0 +1,101 @@
+"""
+Test script to verify detection and mapping of job lists captured from careers page APIs.
+"""
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.fetch.job_data import find_job_data
+from src.core.scraper.structured import compact_job_data, is_internship, is_internship_item, map_job_data_item
+from src.core.scraper.validation import validate_listings
+
+JOBS_RESPONSE = {
+    "meta": {"total": 3},
+    "jobs": [
+        {"id": 1, "title": "Software Engineering Intern (Summer 2027)", "absolute_url": "https://boards.example.com/acme/jobs/1",
+         "location": {"name": "Toronto, ON"}, "departments": [{"name": "Engineering"}], "content": "x" * 1000},
+        {"id": 2, "title": "Senior Backend Engineer", "absolute_url": "https://boards.example.com/acme/jobs/2",
+         "location": {"name": "Remote"}, "departments": [{"name": "Engineering"}]},
+        {"id": 3, "title": "Data Co-op", "absolute_url": "https://boards.example.com/acme/jobs/3",
+         "location": {"name": "Remote"}, "departments": [{"name": "Data Platform"}]},
+    ],
+}
+
+OTHER_RESPONSES = [
+    ("https://acme.example.com/api/menu", [{"title": "About", "url": "/about"}, {"title": "Blog", "url": "/blog"}]),
+    ("https://acme.example.com/api/offices", {"offices": [{"name": "Toronto", "location": "Toronto, ON"}]}),
+]
+
+
+def test_job_list_ranked_first():
+    """
+    Test that the job array is picked over menus and office lists.
+    """
+    url, items = find_job_data(OTHER_RESPONSES + [("https://boards.example.com/api/jobs", JOBS_RESPONSE)])
+
+    assert url == "https://boards.example.com/api/jobs"
+    assert [item["id"] for item in items] == [1, 2, 3]
+    assert find_job_data(OTHER_RESPONSES[:1]) == ("", [])
+
+
+def test_job_items_map_to_listings():
+    """
+    Test that internship jobs map to listing fields in the prompt's format.
+    """
+    internships = [item for item in JOBS_RESPONSE["jobs"] if is_internship(item["title"])]
+    assert [item["id"] for item in internships] == [1, 3]
+
+    job_dicts = [map_job_data_item(item) for item in internships]
+    assert job_dicts[0] == {
+        "title": "Software Engineering Intern (Summer 2027)",
+        "location": ["Toronto, ON"],
+        "term": ["spring"],
+        "department": "Engineering",
+        "work_arrangement": "",
+        "href": "https://boards.example.com/acme/jobs/1",
+        "href_is_url": True,
+    }
+    assert validate_listings(job_dicts[:1]) == []
+
+    # "Remote" is not a city and region, the model decides how to write it
+    assert job_dicts[1] is None
+
+
+def test_unmappable_locations_left_to_the_model():
+    """
+    Test that only "CITY, REGION" locations are mapped, normalized like the model writes them.
+    """
+    workday_item = {"title": "Software Developer Co-op", "locationsText": "2 Locations",
+                    "externalPath": "/job/Toronto/Software-Developer-Co-op_R123"}
+    assert map_job_data_item(workday_item) is None
+
+    item = {"title": "Hardware Intern", "url": "/jobs/4",
+            "locations": [{"city": "Waterloo", "state": "Ontario"}, "Austin, Texas, United States", "Waterloo, ON"]}
+    assert map_job_data_item(item)["location"] == ["Waterloo, ON", "Austin, TX"]
+
+    for location in ("Toronto", "Toronto, ON or Remote", "Paris, Ile-de-France, France", "London, United Kingdom", "Building 4, Floor 2"):
+        assert map_job_data_item({**item, "locations": [location]}) is None, location
+
+
+def test_co_ops_marked_by_type_are_internships():
+    """
+    Test that jobs whose employment type marks them as co-ops are kept, like the listing prompt requires.
+    """
+    assert is_internship_item({"title": "Software Developer", "employmentType": "Co-op"})
+    assert is_internship_item({"title": "Data Analyst", "job_type": {"name": "Internship"}})
+    assert is_internship_item({"title": "Data Analyst Intern", "employmentType": "Full-time"})
+    assert not is_internship_item({"title": "Data Analyst", "employmentType": ["Full-time"]})
+
+
+def test_compact_job_data_drops_long_values():
+    """
+    Test that descriptions are left out of the JSON sent to the model.
+    """
+    compacted = json.loads(compact_job_data(JOBS_RESPONSE["jobs"][:1]))
+
+    assert "content" not in compacted[0]
+    assert compacted[0]["departments"] == [{"name": "Engineering"}]
@@ -0,0 +1,175 @@
+"""
+Test script to verify incremental parsing of streamed JSON arrays.
+"""
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.scraper.json_stream import JSONArrayStream
+from src.core.scraper.llm import ModelRouter
+from src.core.scraper.validation import validate_listings
+from src.utils.config import Config
+from src.utils.tokens import LISTING_STAGE, TokenLedger
+
+LISTINGS = [
+    {"title": "Software Engineering Intern", "location": ["Toronto, ON"], "href": "/jobs/1"},
+    {"title": "Data Co-op [Fall]", "location": [], "href": "/jobs/2?q={\"a\": 1}"},
+    {"title": "Quote \" and \\ escapes", "location": ["Remote"], "href": "/jobs/3"},
+]
+
+
+class FakeStream:
+    """Streamed chat completion replaying a reply in small chunks."""
+
+    def __init__(self, reply: str, prompt_tokens: int = 100, completion_tokens: int = 50):
+        self.reply = reply
+        self.usage = SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        self.closed = False
+
+    def __iter__(self):
+        for start in range(0, len(self.reply), 5):
+            yield SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(
+                content=self.reply[start:start + 5]))])
+        yield SimpleNamespace(usage=self.usage, choices=[])
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    """OpenAI client returning one stream per call, recording the models called."""
+
+    def __init__(self, *streams: FakeStream):
+        self.streams = list(streams)
+        self.models = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model: str, **kwargs):
+        self.models.append(model)
+        return self.streams.pop(0)
+
+
+def feed_in_chunks(parser: JSONArrayStream, text: str, size: int) -> list[dict]:
+    """Feed text to a parser in chunks of the given size."""
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    return items
+
+
+def test_objects_returned_as_they_close():
+    """
+    Test that each object is returned by the chunk that closes it, whatever the chunk size.
+    """
+    text = "```json\n" + json.dumps(LISTINGS, indent=2) + "\n```"
+    for size in (1, 3, 7, len(text)):
+        parser = JSONArrayStream()
+        assert feed_in_chunks(parser, text, size) == LISTINGS
+        assert parser.finished
+        assert parser.errors == 0
+
+    parser = JSONArrayStream()
+    first_object_end = text.index("}") + 1
+    assert parser.feed(text[:first_object_end - 1]) == []
+    assert parser.feed(text[first_object_end - 1:first_object_end]) == LISTINGS[:1]
+
+
+def test_truncated_stream_keeps_completed_objects():
+    """
+    Test that a reply cut off mid-object keeps the objects before it.
+    """
+    text = json.dumps(LISTINGS)
+    cut = text.index("Quote")
+
+    parser = JSONArrayStream()
+    assert parser.feed(text[:cut]) == LISTINGS[:2]
+    assert not parser.finished
+
+
+def test_invalid_and_non_object_items_skipped():
+    """
+    Test that values that are not valid objects are skipped without stopping the array.
+    """
+    parser = JSONArrayStream()
+    items = parser.feed('[1, "x", {"title": bad}, {"title": "Intern"}] trailing {"title": "ignored"}')
+
+    assert items == [{"title": "Intern"}]
+    assert parser.errors == 1
+    assert parser.finished
+
+
+def test_last_model_output_accepted_as_is():
+    """
+    Test that objects failing validation on the strongest model are still yielded, like complete_json().
+    """
+    listing = {"title": "Software Intern", "location": ["Toronto, ON"], "term": ["Summer"],
+               "department": "Software", "work_arrangement": "", "href": "/jobs/1", "href_is_url": False}
+    assert validate_listings([listing])
+
+    router = ModelRouter(fast_model="", model="strong-model")
+    client = FakeClient(FakeStream(json.dumps([listing, {**listing, "href": "/jobs/2"}])))
+
+    items = list(router.stream_json_array(client, "system", "page", LISTING_STAGE, "Acme", validate_listings))
+
+    assert [item["href"] for item in items] == ["/jobs/1", "/jobs/2"]
+    assert client.models == ["strong-model"]
+
+
+def test_escalated_stream_charges_the_ledger(monkeypatch):
+    """
+    Test that a stream abandoned for a stronger model is still charged for its prompt and partial reply.
+    """
+    ledger = TokenLedger()
+    monkeypatch.setattr(Config, "_token_ledger", ledger)
+
+    bad = {"title": "Software Intern", "location": "Toronto", "href": "/jobs/1"}
+    good = {"title": "Software Intern", "location": ["Toronto, ON"], "term": ["Summer"],
+            "department": "Engineering", "work_arrangement": "", "href": "/jobs/1", "href_is_url": False}
+    weak_stream = FakeStream(json.dumps([bad] * 20))
+    client = FakeClient(weak_stream, FakeStream(json.dumps([good]), prompt_tokens=100, completion_tokens=50))
+
+    router = ModelRouter(fast_model="weak-model", model="strong-model")
+    items = list(router.stream_json_array(client, "system", "page", LISTING_STAGE, "Acme", validate_listings))
+
+    assert items == [good]
+    assert client.models == ["weak-model", "strong-model"]
+    assert weak_stream.closed
+
+    usage = ledger.usage()
+    weak = usage["models"]["weak-model"]
+    assert weak["calls"] == 1
+    assert weak["prompt_tokens"] == weak["estimated_tokens"] > 0
+    assert weak["completion_tokens"] > 0
+    assert usage["models"]["strong-model"]["prompt_tokens"] == 100
+    assert ledger._reserved == 0
+
+
+def test_listing_model_sticks_per_company(monkeypatch):
+    """
+    Test that a company whose listings needed the stronger model skips the fast model on later pages.
+    """
+    monkeypatch.setattr(Config, "_token_ledger", TokenLedger())
+
+    bad = {"title": "Software Intern", "location": "Toronto", "href": "/jobs/1"}
+    good = {"title": "Software Intern", "location": ["Toronto, ON"], "term": ["spring"],
+            "department": "Engineering", "work_arrangement": "", "href": "/jobs/1", "href_is_url": False}
+    client = FakeClient(FakeStream(json.dumps([bad])), FakeStream(json.dumps([good])),
+                        FakeStream(json.dumps([good])), FakeStream(json.dumps([good])))
+    router = ModelRouter(fast_model="weak-model", model="strong-model")
+
+    def parse(company):
+        return list(router.stream_json_array(client, "system", "page", LISTING_STAGE, company, validate_listings))
+
+    assert parse("Acme") == [good]
+    assert parse("Acme") == [good]
+    assert client.models == ["weak-model", "strong-model", "strong-model"]
+
+    # Other companies still start on the fast model
+    assert parse("Globex") == [good]
+    assert client.models[-1] == "weak-model"
+    assert router.models_for(LISTING_STAGE, 10, "Globex") == ["weak-model", "strong-model"]
@@ -0,0 +1,188 @@
+"""
+Test script to verify that new listings are matched to existing postings only when they are the same job.
+"""
+import queue
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.vm.worker as worker
+from src.core.index import ListingIdentityIndex
+from src.models import Listing, Posting
+from src.models.company import Company
+
+
+def make_listing(title: str, location: list[str], term: list[str]) -> Listing:
+    """Build a listing of the test company."""
+    return Listing(title=title, location=location, term=term, department="Software Engineering",
+                   work_arrangement="", href="/jobs/1", href_is_url=False, company="Acme")
+
+
+def make_posting(listing: Listing) -> Posting:
+    """Build the existing posting of a listing."""
+    return Posting(title=listing.title, location=list(listing.location), work_arrangement="", salary=0,
+                   salary_type="none", url=listing.href, term=list(listing.term), categories=[],
+                   company=listing.company, id=listing.hash(), date=0)
+
+
+def test_term_and_locations_must_match():
+    """
+    Test that a listing for another term or other locations never matches an existing posting.
+    """
+    summer = make_listing("Software Engineering Intern", ["Toronto, ON"], ["Summer 2027"])
+    index = ListingIdentityIndex([make_posting(summer)], threshold=0.5)
+
+    fall = make_listing("Software Engineering Intern", ["Toronto, ON", "Waterloo, ON"], ["Fall 2027"])
+    assert index.match(fall) is None
+    assert index.match(make_listing("Software Engineering Intern", ["Waterloo, ON"], ["Summer 2027"])) is None
+
+    # The same term and locations with a slightly different title is the same job
+    reworded = make_listing("Software Engineer Internship", ["toronto ON"], ["summer 2027"])
+    assert index.match(reworded) == summer.hash()
+
+
+def test_different_titles_do_not_match_at_default_threshold():
+    """
+    Test that shared terms and locations do not make different jobs match at the default threshold.
+    """
+    locations = ["Toronto, ON", "Waterloo, ON", "Vancouver, BC"]
+    pairs = [
+        ("Backend Software Engineer Intern", "Frontend Software Engineer Intern", locations),
+        ("Data Science Intern", "Data Engineering Intern", ["Toronto, ON"]),
+        ("Software Engineering Intern", "Software Engineering Intern - Backend", ["Toronto, ON"]),
+    ]
+    for existing_title, new_title, location in pairs:
+        existing = make_listing(existing_title, location, ["Summer 2027"])
+        index = ListingIdentityIndex([make_posting(existing)])
+        assert index.match(make_listing(new_title, location, ["Summer 2027"])) is None, new_title
+
+    # A reworded title of the same job still matches
+    existing = make_listing("Software Engineering Intern", locations, ["Summer 2027"])
+    index = ListingIdentityIndex([make_posting(existing)])
+    assert index.match(make_listing("Software Engineer Internship", locations, ["summer 2027"])) == existing.hash()
+
+
+def test_exact_listing_keeps_its_posting(monkeypatch):
+    """
+    Test that a look-alike arriving before a posting's exact listing is parsed as a new posting.
+    """
+    existing = make_listing("Software Engineering Intern", ["Toronto, ON"], ["Summer 2027"])
+    look_alike = make_listing("Software Engineering Intern - Backend", ["Toronto, ON"], ["Summer 2027"])
+    company = Company(name="Acme", url="https://acme.example.com/careers", paged=False, page_query_param="")
+
+    class PostingRepo:
+        deleted = []
+
+        def get_all(self):
+            return [make_posting(existing)]
+
+        def bulk_delete(self, posting_ids):
+            self.deleted.extend(posting_ids)
+            return len(posting_ids)
+
+    def start_enrichment(*args, **kwargs):
+        thread = threading.Thread(target=lambda: None)
+        thread.start()
+        return None, threading.Event(), thread
+
+    parsed = []
+    monkeypatch.setattr(worker, "create_posting_repository", lambda: PostingRepo())
+    monkeypatch.setattr(worker, "start_enrichment", start_enrichment)
+    monkeypatch.setattr(worker, "parse_listing", lambda company, listing, *args: parsed.append(listing) or True)
+    monkeypatch.setattr(worker, "ListingIdentityIndex",
+                        lambda postings: ListingIdentityIndex(postings, threshold=0.5))
+
+    listings = queue.Queue()
+    for listing in (look_alike, existing, None):
+        listings.put((company, listing) if listing else None)
+
+    worker.parse_all_listings(listings, fetcher=None)
+
+    assert parsed == [look_alike]
+    assert PostingRepo.deleted == []
+
+
+def test_queued_workers_finish_the_run_once(tmp_path, monkeypatch):
+    """
+    Test that fuzzy listings of several workers are matched and stale postings deleted once, after a crashed finish.
+    """
+    from src.core.queue import SQLiteWorkQueue, FINISH_TOPIC, FUZZY_LISTING_TOPIC, LISTING_TOPIC
+    from src.models import codec
+    from src.utils.config import Config
+
+    company = Company(name="Acme", url="https://acme.example.com/careers", paged=False, page_query_param="")
+    kept = make_listing("Software Engineering Intern", ["Toronto, ON"], ["Summer 2027"])
+    reworded = make_listing("Data Science Intern", ["Waterloo, ON"], ["Summer 2027"])
+    reworded_again = make_listing("Data Science Internship", ["Waterloo, ON"], ["Summer 2027"])
+    held = make_listing("Hardware Engineering Intern", ["Ottawa, ON"], ["Fall 2027"])
+    held_again = make_listing("Hardware Engineer Internship", ["Ottawa, ON"], ["Fall 2027"])
+    stale = make_listing("Product Design Intern", ["Toronto, ON"], ["Summer 2027"])
+    new = make_listing("Product Manager Intern", ["Toronto, ON"], ["Summer 2027"])
+
+    class PostingRepo:
+        lock = threading.Lock()
+        postings = {listing.hash(): make_posting(listing) for listing in (kept, reworded, held, stale)}
+        deletes = []
+
+        def get_all(self):
+            with self.lock:
+                return list(self.postings.values())
+
+        def bulk_delete(self, posting_ids):
+            with self.lock:
+                self.deletes.append(sorted(posting_ids))
+                for posting_id in posting_ids:
+                    self.postings.pop(posting_id)
+            return len(posting_ids)
+
+    def parse_listing(company, listing, *args):
+        with PostingRepo.lock:
+            parsed.append(listing)
+            PostingRepo.postings[listing.hash()] = make_posting(listing)
+        return True
+
+    def start_enrichment(*args, **kwargs):
+        thread = threading.Thread(target=lambda: None)
+        thread.start()
+        return None, threading.Event(), thread
+
+    parsed = []
+    monkeypatch.setattr(Config, "WORK_QUEUE_POLL_SECONDS", 0.05)
+    monkeypatch.setattr(worker, "create_posting_repository", lambda: PostingRepo())
+    monkeypatch.setattr(worker, "start_enrichment", start_enrichment)
+    monkeypatch.setattr(worker, "parse_listing", parse_listing)
+
+    def payload(listing: Listing) -> dict:
+        return {"company": codec.to_dict(company), "listing": codec.to_dict(listing)}
+
+    path = str(tmp_path / "queue.db")
+    seed = SQLiteWorkQueue(path, run_id="test-run")
+    for listing in (kept, reworded_again, new):
+        seed.put(LISTING_TOPIC, listing.hash(), payload(listing))
+
+    # A worker that crashed while finishing the run, holding the finish job and a fuzzy listing
+    crashed = SQLiteWorkQueue(path, run_id="test-run", lease_seconds=1)
+    crashed.put(FINISH_TOPIC, "test-run", {})
+    crashed.lease(FINISH_TOPIC)
+    crashed.put(LISTING_TOPIC, held_again.hash(), payload(held_again))
+    crashed.complete(crashed.lease(LISTING_TOPIC))
+    crashed.put(FUZZY_LISTING_TOPIC, held_again.hash(), payload(held_again))
+    crashed.lease(FUZZY_LISTING_TOPIC)
+
+    queues = [SQLiteWorkQueue(path, run_id="test-run") for _ in range(3)]
+    threads = [threading.Thread(target=worker.parse_queued_listings, args=(work_queue, None)) for work_queue in queues]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert parsed == [new]
+    assert PostingRepo.deletes == [[stale.hash()]]
+    assert set(PostingRepo.postings) == {kept.hash(), reworded.hash(), held.hash(), new.hash()}
+    for topic in (LISTING_TOPIC, FUZZY_LISTING_TOPIC, FINISH_TOPIC):
+        assert seed.is_drained(topic)
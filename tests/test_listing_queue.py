@@ -0,0 +1,87 @@
+"""
+Test script to verify backpressure of the bounded listing queue.
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.fetch.page import FetchedPage
+from src.models import Listing
+from src.models.company import Company
+from src.vm.listing_queue import BoundedListingQueue, estimate_item_size, estimate_page_size
+
+COMPANY = Company(name="Acme", url="https://acme.example.com/careers", paged=False, page_query_param=None)
+
+
+def make_item(job_id: int) -> tuple:
+    return (COMPANY, Listing(title=f"Software Intern {job_id}", location=["Toronto, ON"], term=["Summer"],
+                             department="Engineering", work_arrangement="", href=f"/jobs/{job_id}",
+                             href_is_url=False, company=COMPANY.name))
+
+
+def put_in_thread(listing_queue: BoundedListingQueue, item) -> threading.Thread:
+    thread = threading.Thread(target=listing_queue.put, args=(item,), daemon=True)
+    thread.start()
+    return thread
+
+
+def test_put_blocks_until_get_frees_the_budget():
+    """
+    Test that put() blocks while the memory budget is full and resumes once an item is taken.
+    """
+    first, second = make_item(1), make_item(2)
+    listing_queue = BoundedListingQueue(maxsize=10, memory_budget_bytes=estimate_item_size(first) + 1)
+    listing_queue.put(first)
+
+    thread = put_in_thread(listing_queue, second)
+    time.sleep(0.2)
+    assert thread.is_alive()
+    assert listing_queue.qsize() == 1
+
+    assert listing_queue.get() is first
+    thread.join(timeout=2)
+    assert not thread.is_alive()
+    assert listing_queue.get() is second
+    assert listing_queue.stats()["memory_used_bytes"] == 0
+
+
+def test_page_text_counts_towards_the_budget():
+    """
+    Test that the text of pages being scraped uses up the budget without blocking their own scrape.
+    """
+    class Fetcher:
+        timeout = 30
+
+        def fetch_page(self, url, listing_region=None):
+            return FetchedPage(text="x" * 10_000)
+
+    item = make_item(1)
+    page_size = estimate_page_size(FetchedPage(text="x" * 10_000))
+    listing_queue = BoundedListingQueue(maxsize=10, memory_budget_bytes=page_size + estimate_item_size(item) // 2)
+
+    page_fetcher = listing_queue.fetch_pages_with(Fetcher())
+    page_fetcher.fetch_page("https://acme.example.com/careers")
+    assert page_fetcher.timeout == 30
+    assert listing_queue.stats()["page_text_bytes"] == page_size
+
+    # Nothing queued can free the budget, so the first listing still goes through
+    listing_queue.put(item)
+
+    # With a listing queued, the held page text leaves no room for another one
+    thread = put_in_thread(listing_queue, make_item(2))
+    time.sleep(0.2)
+    assert thread.is_alive()
+
+    page_fetcher.release()
+    thread.join(timeout=2)
+    assert not thread.is_alive()
+    assert listing_queue.stats()["page_text_bytes"] == 0
+
+    # Pages fetched after the scrape is over are not held
+    page_fetcher.fetch_page("https://acme.example.com/careers?page=2")
+    assert listing_queue.stats()["page_text_bytes"] == 0
@@ -0,0 +1,156 @@
+"""
+Test script to verify detection of the job list region of careers pages.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.fetch.base import parse_html
+from src.core.fetch.regions import ListingRegionCache
+
+NAV = "".join(f'<li class="nav-item"><a href="/{name}">{name}</a></li>' for name in ("about", "teams", "blog", "press"))
+
+
+def job_card(title: str, location: str, job_id: int) -> str:
+    return (f'<div class="job-card"><a href="/jobs/{job_id}">{title}</a>'
+            f'<span class="location">{location}</span></div>')
+
+
+CAREERS_PAGE = (
+    "<html><body>"
+    f'<nav><ul class="menu">{NAV}</ul></nav>'
+    '<div class="banner">We use cookies to improve your experience.</div>'
+    '<main id="openings">'
+    '<section class="department"><h2>Engineering</h2>'
+    + job_card("Software Engineering Intern", "Toronto, ON", 1)
+    + job_card("Hardware Engineering Intern", "Waterloo, ON", 2)
+    + job_card("Firmware Engineering Intern", "Ottawa, ON", 3)
+    + "</section>"
+    '<section class="department"><h2>Design</h2>'
+    + job_card("Product Design Intern", "New York, NY", 4)
+    + "</section>"
+    "</main>"
+    "<footer><p>Benefits: free lunch, gym and more</p></footer>"
+    "</body></html>"
+)
+
+
+def test_region_holds_only_job_cards():
+    """
+    Test that every department's cards are kept and the menu, banner and footer are left out.
+    """
+    page = parse_html(CAREERS_PAGE, listing_region="")
+
+    assert page.region_selector == "main#openings"
+    assert "Product Design Intern (HREF: /jobs/4)" in page.region_text
+    assert "Software Engineering Intern (HREF: /jobs/1)" in page.region_text
+    for noise in ("about", "cookies", "free lunch"):
+        assert noise in page.text
+        assert noise not in page.region_text
+
+
+def test_learned_selector_and_fallback():
+    """
+    Test that a learned selector is reused and a stale one falls back to detection.
+    """
+    assert parse_html(CAREERS_PAGE, listing_region="main#openings").region_selector == "main#openings"
+    assert parse_html(CAREERS_PAGE, listing_region="div.gone").region_selector == "main#openings"
+
+    # Pages without a job list are parsed whole, and region extraction is off by default
+    assert parse_html(f"<html><body><ul>{NAV}</ul></body></html>", listing_region="").region_text == ""
+    assert parse_html(CAREERS_PAGE).region_text == ""
+
+
+def test_region_cache(tmp_path):
+    """
+    Test that learned selectors persist and can be forgotten.
+    """
+    path = str(tmp_path / "regions.json")
+    cache = ListingRegionCache(path)
+    cache.set("Acme", "main#openings")
+
+    assert ListingRegionCache(path).get("Acme") == "main#openings"
+    cache.forget("Acme")
+    assert ListingRegionCache(path).get("Acme") == ""
+
+
+def test_prefetched_pages_use_learned_selector(tmp_path, monkeypatch):
+    """
+    Test that pages prefetched before the first page learned the selector are fetched again with it.
+    """
+    from src.core.fetch.page import FetchedPage
+    from src.core.scraper.listing import ListingScraper
+    from src.models import Listing
+    from src.models.company import Company
+    from src.utils.config import Config
+
+    monkeypatch.setattr(Config, "get_openai_client", lambda: None)
+
+    class Fetcher:
+        def __init__(self):
+            self.fetches = []
+
+        def fetch_page(self, url, listing_region=None):
+            self.fetches.append((url[-1], listing_region))
+            return FetchedPage(text=f"page {url}", region_text=f"jobs {url}", region_selector="main#openings")
+
+    def iter_parse_page(fetched_page, company, page):
+        if page == 1:
+            listing_scraper.regions.set(company.name, fetched_page.region_selector)
+        yield Listing(title=f"Intern {page}", location=[], term=[], department="", work_arrangement="",
+                      href=f"/jobs/{page}", href_is_url=False, company=company.name)
+
+    fetcher = Fetcher()
+    listing_scraper = ListingScraper(fetcher=fetcher)
+    listing_scraper.regions = ListingRegionCache(str(tmp_path / "regions.json"))
+    listing_scraper.iter_parse_page = iter_parse_page
+    listing_scraper.calculate_similarity = lambda first, second: 0.0
+
+    company = Company(name="Acme", url="https://acme.example.com/careers?a=1", paged=True, page_query_param="page")
+    listings = listing_scraper.scrape_all_pages(company, max_pages=3, prefetch=2)
+
+    assert [listing.href for listing in listings] == ["/jobs/1", "/jobs/2", "/jobs/3"]
+    # Pages 2 and 3 may have been prefetched without the selector, but are only used with it
+    assert fetcher.fetches[0] == ("1", "")
+    assert ("2", "main#openings") in fetcher.fetches
+    assert ("3", "main#openings") in fetcher.fetches
+
+
+def test_running_prefetch_finishes_before_scrape_returns(monkeypatch):
+    """
+    Test that a page still being prefetched when scraping stops is waited for, so it no longer holds the fetcher.
+    """
+    import threading
+    import time
+    from src.core.fetch.page import FetchedPage
+    from src.core.scraper.listing import ListingScraper
+    from src.models.company import Company
+    from src.utils.config import Config
+
+    monkeypatch.setattr(Config, "get_openai_client", lambda: None)
+    prefetch_started = threading.Event()
+    fetching = set()
+
+    def fetch_page(url, listing_region=None):
+        fetching.add(url)
+        if url.endswith("2"):
+            prefetch_started.set()
+            time.sleep(0.2)
+        fetching.discard(url)
+        return FetchedPage(text=f"page {url}")
+
+    def iter_parse_page(fetched_page, company, page):
+        # Page 1 holds no jobs, so scraping stops while page 2 is being fetched
+        assert prefetch_started.wait(5)
+        return iter(())
+
+    listing_scraper = ListingScraper(fetcher=type("Fetcher", (), {"fetch_page": staticmethod(fetch_page)})())
+    listing_scraper.regions = None
+    listing_scraper.iter_parse_page = iter_parse_page
+
+    company = Company(name="Acme", url="https://acme.example.com/careers?a=1", paged=True, page_query_param="page")
+    assert listing_scraper.scrape_all_pages(company, max_pages=3, prefetch=1) == []
+    assert not fetching
@@ -0,0 +1,73 @@
+"""
+Test script to verify model serialization keeps listing hashes stable.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models import Company, Listing, Posting, codec
+
+# Hash produced by Listing.hash() before listings were made immutable
+EXPECTED_HASH = "cee54d5afca353a184dbf291b15750cd8f854a380150ef2b3444b0a254cef664"
+
+
+def _listing() -> Listing:
+    return Listing(
+        title="t",
+        location=["a"],
+        term=["spring"],
+        department="d",
+        work_arrangement="remote",
+        href="h",
+        href_is_url=True,
+        company="A",
+    )
+
+
+def test_listing_hash_is_unchanged():
+    """
+    Test that the cached hash matches the original hash output.
+    """
+    listing = _listing()
+    assert listing.hash() == EXPECTED_HASH
+    assert listing.hash() == EXPECTED_HASH
+
+
+def test_codec_round_trip():
+    """
+    Test that every model survives an encode/decode round trip.
+    """
+    company = Company(name="Stripe", url="https://stripe.com/jobs", paged=False, page_query_param=None, id="1")
+    posting = Posting(
+        title="Software Engineering Intern",
+        location=["Toronto, ON"],
+        work_arrangement="hybrid",
+        salary=50,
+        salary_type="hourly",
+        url="https://stripe.com/jobs/1",
+        term=["fall"],
+        categories=["software"],
+        company="Stripe",
+        id=EXPECTED_HASH,
+        date=1700000000,
+    )
+    listing = _listing()
+
+    assert codec.decode(codec.encode(company)) == company
+    assert codec.decode(codec.encode(posting)) == posting
+    assert codec.decode(codec.encode([listing, listing])) == [listing, listing]
+    assert codec.decode(codec.encode([])) == []
+
+    decoded = codec.decode(codec.encode(listing))
+    assert decoded == listing
+    assert decoded.hash() == EXPECTED_HASH
+    assert codec.from_dict(Listing, codec.to_dict(listing)).hash() == EXPECTED_HASH
+
+
+if __name__ == "__main__":
+    test_listing_hash_is_unchanged()
+    test_codec_round_trip()
+    print("✓ All model codec tests passed")
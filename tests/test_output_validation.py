@@ -0,0 +1,70 @@
+"""
+Test script to verify schema validation of model output.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.scraper.validation import validate_listings, validate_posting
+
+
+def test_valid_listings_pass():
+    """
+    Test that listings following the prompt's schema have no problems.
+    """
+    listings = [
+        {
+            "title": "Software Engineering Intern",
+            "location": ["San Francisco, CA"],
+            "term": ["winter", "spring"],
+            "department": "Engineering",
+            "work_arrangement": "hybrid",
+            "href": "/jobs/123",
+            "href_is_url": False,
+        },
+        {"title": "Data Co-op", "location": [], "term": [], "department": "", "work_arrangement": ""},
+    ]
+
+    assert validate_listings(listings) == []
+    assert validate_listings([]) == []
+
+
+def test_invalid_listings_fail():
+    """
+    Test that values outside the allowed terms, departments and arrangements are reported.
+    """
+    assert validate_listings({"title": "Intern"}) == ["output is not a JSON array"]
+
+    errors = validate_listings([
+        {"title": "Intern", "location": "Toronto, ON", "term": ["summer"], "department": "Sales",
+         "work_arrangement": "in office"},
+    ])
+    assert len(errors) == 4
+
+
+def test_posting_validation():
+    """
+    Test that posting salaries and categories are checked against the prompt's schema.
+    """
+    posting = {
+        "title": "Hardware Intern",
+        "location": ["Waterloo, ON"],
+        "work_arrangement": "onsite",
+        "salary": {"type": "hourly", "amount": 45},
+        "term": ["fall"],
+        "categories": ["hardware"],
+    }
+    assert validate_posting(posting) == []
+
+    errors = validate_posting({**posting, "salary": {"type": "yearly", "amount": -1}, "categories": ["robotics"]})
+    assert len(errors) == 3
+
+
+if __name__ == "__main__":
+    test_valid_listings_pass()
+    test_invalid_listings_fail()
+    test_posting_validation()
+    print("✓ All validation tests passed")
@@ -0,0 +1,106 @@
+"""
+Test script to verify that the local posting mirror stays in sync with Supabase.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.repository import PostingMirror
+from src.models import Posting
+
+
+def make_posting(posting_id: str, date: int, title: str = "Software Engineering Intern") -> Posting:
+    return Posting(title=title, location=["Toronto, ON"], work_arrangement="", salary=0, salary_type="none",
+                   url=f"/jobs/{posting_id}", term=["fall"], categories=[], company="Acme", id=posting_id, date=date)
+
+
+class FakeRepository:
+    """In-memory stand-in for the Supabase PostingRepository."""
+
+    def __init__(self, postings: list[Posting]):
+        self.postings = {posting.id: posting for posting in postings}
+
+    def get_all(self):
+        return list(self.postings.values())
+
+    def get_since(self, timestamp: int):
+        return [posting for posting in self.postings.values() if posting.date >= timestamp]
+
+    def get_ids(self):
+        return set(self.postings)
+
+    def get_by_ids(self, posting_ids: list[str]):
+        return [self.postings[posting_id] for posting_id in posting_ids if posting_id in self.postings]
+
+    def create(self, posting: Posting):
+        self.postings[posting.id] = posting
+        return posting
+
+    def bulk_delete(self, posting_ids: list[str], batch_size: int = 1000):
+        return sum(self.postings.pop(posting_id, None) is not None for posting_id in posting_ids)
+
+
+def test_incremental_sync_catches_other_writers(tmp_path):
+    """
+    Test that rows other writers inserted with an old date, or deleted, are mirrored without a full sync.
+    """
+    repository = FakeRepository([make_posting("a", 100), make_posting("b", 200)])
+    mirror = PostingMirror(repository, str(tmp_path / "postings.db"))
+    assert mirror.sync() == 2
+
+    # Another worker parsed a listing at time 150 and inserted it after the watermark moved to 200
+    repository.create(make_posting("c", 150, "Data Intern"))
+    repository.bulk_delete(["a"])
+    # A posting updated since the watermark is pulled again
+    repository.postings["b"] = make_posting("b", 300, "Software Engineer Intern")
+
+    mirror.sync()
+
+    assert mirror.get_ids() == {"b", "c"}
+    assert mirror.get_by_id("c").title == "Data Intern"
+    assert mirror.get_by_id("b").title == "Software Engineer Intern"
+    assert [posting.id for posting in mirror.get_by_term("fall")] in (["b", "c"], ["c", "b"])
+    mirror.close()
+
+
+def test_writes_go_through_to_supabase(tmp_path):
+    """
+    Test that creates and deletes made through the mirror reach Supabase and the local copy.
+    """
+    repository = FakeRepository([make_posting("a", 100)])
+    mirror = PostingMirror(repository, str(tmp_path / "postings.db"))
+    mirror.sync()
+
+    mirror.create(make_posting("b", 200))
+    assert mirror.bulk_delete(["a"]) == 1
+
+    assert set(repository.postings) == {"b"}
+    assert mirror.get_ids() == {"b"}
+    assert mirror.exists("b") and not mirror.exists("a")
+    mirror.close()
+
+
+def test_query_index_follows_creates_and_deletes(tmp_path):
+    """
+    Test that queries over the mirror see postings created, deleted and synced after the index was built.
+    """
+    from src.core.index import Q
+
+    repository = FakeRepository([make_posting("a", 100), make_posting("b", 100, "Data Intern")])
+    mirror = PostingMirror(repository, str(tmp_path / "postings.db"))
+    mirror.sync()
+    assert mirror.query(Q(title="intern")).total == 2
+
+    mirror.create(make_posting("c", 200, "Data Science Intern"))
+    mirror.bulk_delete(["b"])
+    assert [posting.id for posting in mirror.query(Q(title="data")).postings] == ["c"]
+
+    # Postings other writers create are indexed by the next sync
+    repository.create(make_posting("d", 50, "Hardware Intern"))
+    mirror.sync()
+    assert mirror.query(Q(term="fall")).total == 3
+    assert mirror.query(Q(title="hardware")).postings[0].id == "d"
+    mirror.close()
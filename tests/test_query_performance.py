@@ -0,0 +1,150 @@
+"""
+Performance test for the in-process posting query engine.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.index import PostingIndex, Q
+from src.models import Posting
+
+TERMS = ["spring", "fall", "winter"]
+LOCATIONS = ["Toronto, ON", "New York, NY", "San Francisco, CA", "Seattle, WA", "Waterloo, ON", "Austin, TX"]
+CATEGORIES = ["software", "hardware", "business", "data", "ui", "product management"]
+ARRANGEMENTS = ["remote", "hybrid", "onsite", ""]
+COMPANIES = [f"Company {i}" for i in range(200)]
+TITLE_WORDS = ["Software", "Engineering", "Data", "Science", "Product", "Hardware", "Machine", "Learning", "Design"]
+
+
+def generate_postings(count: int, seed: int = 0) -> list[Posting]:
+    """
+    Generate random postings.
+
+    Args:
+        count: Number of postings to generate
+        seed: Random seed
+
+    Returns:
+        List of Posting objects
+    """
+    rng = random.Random(seed)
+    return [
+        Posting(
+            title=" ".join(rng.sample(TITLE_WORDS, 2)) + " Intern",
+            location=rng.sample(LOCATIONS, rng.randint(1, 2)),
+            work_arrangement=rng.choice(ARRANGEMENTS),
+            salary=rng.choice([0, rng.randint(20, 80)]),
+            salary_type="hourly",
+            url=f"https://example.com/jobs/{i}",
+            term=rng.sample(TERMS, rng.randint(0, 2)),
+            categories=rng.sample(CATEGORIES, rng.randint(0, 2)),
+            company=rng.choice(COMPANIES),
+            id=f"posting-{i}",
+            date=1700000000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+def linear_scan(postings: list[Posting]) -> list[Posting]:
+    """
+    Reference implementation of the benchmark query as a plain scan.
+    """
+    return [
+        posting for posting in postings
+        if "fall" in posting.term
+        and ("software" in posting.categories or "data" in posting.categories)
+        and (posting.company == "Company 7" or 40 <= posting.salary <= 60)
+    ]
+
+
+BENCHMARK_QUERY = Q(term="fall", categories=["software", "data"]) & (Q(company="Company 7") | Q(salary_min=40, salary_max=60))
+
+
+def test_query_matches_linear_scan():
+    """
+    Test that indexed queries return the same postings as a linear scan,
+    including after incremental removals.
+    """
+    postings = generate_postings(2000)
+    index = PostingIndex(postings)
+
+    expected = [posting.id for posting in linear_scan(postings)]
+    result = index.query(BENCHMARK_QUERY, limit=len(postings))
+    assert result.total == len(expected)
+    assert [posting.id for posting in result.postings] == expected
+
+    # Pagination walks the same results in order
+    page = index.query(BENCHMARK_QUERY, offset=5, limit=10)
+    assert [posting.id for posting in page.postings] == expected[5:15]
+
+    # Removing postings updates the indexes
+    for posting_id in expected[:10]:
+        index.remove(posting_id)
+    assert index.count(BENCHMARK_QUERY) == len(expected) - 10
+
+    # Removing every posting leaves no empty bitmaps behind
+    for posting in postings:
+        index.remove(posting.id)
+    assert len(index) == 0
+    assert not index._titles and not index._salaries and not index._salary_values
+    assert not any(index._values.values())
+    index = PostingIndex(postings)
+
+    # Title keywords must all match
+    titled = index.query(Q(title="machine learning"), limit=len(postings)).postings
+    assert titled and all("Machine" in posting.title and "Learning" in posting.title for posting in titled)
+
+
+def run_query_benchmark(count: int = 100_000, repeats: int = 100):
+    """
+    Compare indexed queries to linear scans over generated postings.
+
+    Args:
+        count: Number of postings to index
+        repeats: Number of times each query is run
+    """
+    print("=" * 80)
+    print(f"POSTING QUERY BENCHMARK ({count} postings)")
+    print("=" * 80)
+
+    postings = generate_postings(count)
+
+    start_time = time.time()
+    index = PostingIndex(postings)
+    build_time = time.time() - start_time
+    print(f"\nIndex build: {build_time:.2f}s ({build_time / count * 1e6:.1f}us per posting)")
+
+    start_time = time.time()
+    for _ in range(repeats):
+        result = index.query(BENCHMARK_QUERY, limit=50)
+    indexed_time = (time.time() - start_time) / repeats
+
+    start_time = time.time()
+    for _ in range(max(repeats // 10, 1)):
+        scanned = linear_scan(postings)
+    scan_time = (time.time() - start_time) / max(repeats // 10, 1)
+
+    print(f"Matches: {result.total} (scan found {len(scanned)})")
+    print(f"Indexed query: {indexed_time * 1000:.2f}ms")
+    print(f"Linear scan:   {scan_time * 1000:.2f}ms")
+    print(f"\n🚀 Indexed query is {scan_time / indexed_time:.1f}x faster")
+
+    start_time = time.time()
+    for posting in postings[:1000]:
+        index.remove(posting.id)
+        index.add(posting)
+    update_time = (time.time() - start_time) / 1000
+    print(f"Incremental remove + add: {update_time * 1e6:.1f}us per posting")
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    run_query_benchmark()
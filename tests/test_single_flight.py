@@ -0,0 +1,91 @@
+"""
+Test script to verify single-flight deduplication of posting detail scrapes.
+"""
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.scraper.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    """
+    Test that callers arriving while a key is in flight wait for its result instead of calling again.
+    """
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def scrape():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "posting"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("https://acme.example.com/jobs/1", scrape)))
+    leader.start()
+    started.wait(5)
+
+    followers = [threading.Thread(target=lambda: results.append(flight.do("https://acme.example.com/jobs/1", scrape)))
+                 for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert results == ["posting"] * 4
+    assert len(calls) == 1
+    assert flight.hits == 3
+
+    # Finished results are reused within the run
+    assert flight.do("https://acme.example.com/jobs/1", scrape) == "posting"
+    assert len(calls) == 1
+
+
+def test_failed_call_is_retried():
+    """
+    Test that an exception or a None result is not stored, so the next caller calls again.
+    """
+    flight = SingleFlight()
+    attempts = []
+
+    def scrape():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("connection reset")
+        return None
+
+    try:
+        flight.do("https://acme.example.com/jobs/2", scrape)
+        assert False, "expected the error to be raised"
+    except RuntimeError:
+        pass
+
+    assert flight.do("https://acme.example.com/jobs/2", scrape) is None
+    assert flight.do("https://acme.example.com/jobs/2", scrape) is None
+    assert len(attempts) == 3
+
+
+def test_clear_forgets_finished_results():
+    """
+    Test that results are scraped again after clear(), as at the start of the next run.
+    """
+    flight = SingleFlight()
+    calls = []
+
+    def scrape():
+        calls.append(1)
+        return "posting"
+
+    assert flight.do("https://acme.example.com/jobs/3", scrape) == "posting"
+    assert flight.do("https://acme.example.com/jobs/3", scrape) == "posting"
+    flight.clear()
+    assert flight.do("https://acme.example.com/jobs/3", scrape) == "posting"
+    assert len(calls) == 2
@@ -0,0 +1,61 @@
+"""
+Test script to verify that the Supabase and OpenAI clients share one pooled HTTP client.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import transport
+from src.utils.config import Config
+
+
+def test_clients_share_pool_but_not_headers(monkeypatch):
+    """
+    Test that both API clients send over the shared httpx.Client, each with its own credentials.
+    """
+    import httpx
+
+    monkeypatch.setattr(Config, "OPENAI_API_KEY", "sk-openai")
+    monkeypatch.setattr(Config, "SUPABASE_URL", "https://project.supabase.co")
+    monkeypatch.setattr(Config, "SUPABASE_KEY", "supabase-key")
+    monkeypatch.setattr(Config, "_openai_client", None)
+    monkeypatch.setattr(Config, "_supabase_client", None)
+    monkeypatch.setattr(transport, "_http_client", None)
+    monkeypatch.setattr(transport, "_metrics", transport.TransportMetrics())
+
+    openai_client = Config.get_openai_client()
+    supabase_client = Config.get_supabase_client()
+    http_client = transport.get_http_client()
+
+    assert openai_client._client is http_client
+    assert supabase_client.postgrest.session is http_client
+    # Credentials are set per request, never on the shared client
+    assert "authorization" not in http_client.headers and "apikey" not in http_client.headers
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.host == "api.openai.com":
+            return httpx.Response(200, json={"object": "list", "data": []})
+        return httpx.Response(200, json=[])
+
+    http_client._transport = httpx.MockTransport(handler)
+    try:
+        openai_client.models.list()
+        supabase_client.table("Postings").select("*").execute()
+    finally:
+        http_client.close()
+
+    openai_request, supabase_request = requests
+    assert openai_request.headers["authorization"] == "Bearer sk-openai"
+    assert "apikey" not in openai_request.headers
+    assert supabase_request.headers["apikey"] == "supabase-key"
+    assert supabase_request.headers["authorization"] == "Bearer supabase-key"
+
+    metrics = transport.get_transport_metrics()
+    assert metrics["api.openai.com"]["requests"] == 1
+    assert metrics["project.supabase.co"]["requests"] == 1
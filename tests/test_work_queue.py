@@ -0,0 +1,158 @@
+"""
+Test script to verify lease semantics of the SQLite work queue.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.queue import SQLiteWorkQueue, LISTING_TOPIC
+
+
+def _open_queue(path: str, lease_seconds: int = 60, max_attempts: int = 3) -> SQLiteWorkQueue:
+    return SQLiteWorkQueue(path, run_id="test-run", lease_seconds=lease_seconds, max_attempts=max_attempts)
+
+
+def test_put_is_idempotent_per_key():
+    """
+    Test that the same key is only queued once per run, even after completion.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        work_queue = _open_queue(str(Path(tmp) / "queue.db"))
+
+        assert work_queue.put(LISTING_TOPIC, "abc", {"n": 1})
+        assert not work_queue.put(LISTING_TOPIC, "abc", {"n": 2})
+
+        job = work_queue.lease(LISTING_TOPIC)
+        assert job.payload == {"n": 1}
+        assert work_queue.complete(job)
+        assert not work_queue.complete(job)
+
+        assert not work_queue.put(LISTING_TOPIC, "abc", {"n": 3})
+        assert work_queue.lease(LISTING_TOPIC) is None
+        assert work_queue.is_drained(LISTING_TOPIC)
+        work_queue.close()
+
+
+def test_lease_is_exclusive_across_workers():
+    """
+    Test that two queue instances on the same file never lease the same job.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "queue.db")
+        first_worker = _open_queue(path)
+        second_worker = _open_queue(path)
+
+        for i in range(10):
+            first_worker.put(LISTING_TOPIC, f"listing-{i}", {"i": i})
+
+        leased_keys = []
+        while True:
+            job = first_worker.lease(LISTING_TOPIC) or second_worker.lease(LISTING_TOPIC)
+            if job is None:
+                break
+            leased_keys.append(job.key)
+
+        assert sorted(leased_keys) == sorted(f"listing-{i}" for i in range(10))
+        assert not first_worker.is_drained(LISTING_TOPIC)
+        first_worker.close()
+        second_worker.close()
+
+
+def test_expired_lease_is_redelivered():
+    """
+    Test that a job becomes visible again once its lease times out, and that
+    the stale lease holder can no longer complete it.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "queue.db")
+        crashed_worker = _open_queue(path, lease_seconds=0)
+        healthy_worker = _open_queue(path)
+
+        crashed_worker.put(LISTING_TOPIC, "abc", {})
+        stale_job = crashed_worker.lease(LISTING_TOPIC)
+        time.sleep(0.01)
+
+        job = healthy_worker.lease(LISTING_TOPIC)
+        assert job is not None
+        assert job.attempts == 2
+        assert not crashed_worker.complete(stale_job)
+        assert healthy_worker.complete(job)
+        assert healthy_worker.keys(LISTING_TOPIC) == {"abc"}
+        crashed_worker.close()
+        healthy_worker.close()
+
+
+def test_release_marks_job_dead_after_max_attempts():
+    """
+    Test that a job that keeps failing stops being retried.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        work_queue = _open_queue(str(Path(tmp) / "queue.db"), max_attempts=2)
+        work_queue.put(LISTING_TOPIC, "abc", {})
+
+        assert work_queue.release(work_queue.lease(LISTING_TOPIC))
+        assert work_queue.release(work_queue.lease(LISTING_TOPIC))
+        assert work_queue.lease(LISTING_TOPIC) is None
+        assert work_queue.counts(LISTING_TOPIC) == {"dead": 1}
+        assert work_queue.is_drained(LISTING_TOPIC)
+        work_queue.close()
+
+
+if __name__ == "__main__":
+    test_put_is_idempotent_per_key()
+    test_lease_is_exclusive_across_workers()
+    test_expired_lease_is_redelivered()
+    test_release_marks_job_dead_after_max_attempts()
+    print("✓ All work queue tests passed")
+
+
+def test_heartbeat_keeps_company_leased_across_pages(monkeypatch):
+    """
+    Test that a company scraped for longer than its lease stays leased while pages keep coming.
+    """
+    from src.core.fetch.page import FetchedPage
+    from src.core.queue import COMPANY_TOPIC
+    from src.core.scraper.listing import ListingScraper
+    from src.models import Listing
+    from src.models.company import Company
+    from src.utils.config import Config
+
+    monkeypatch.setattr(Config, "get_openai_client", lambda: None)
+    monkeypatch.setattr(Config, "LISTING_REGION_DETECTION", False)
+
+    class Fetcher:
+        def fetch_page(self, url, listing_region=None):
+            return FetchedPage(text=f"page {url}")
+
+    def iter_parse_page(fetched_page, company, page):
+        time.sleep(0.4)
+        yield Listing(title=f"Intern {page}", location=[], term=[], department="", work_arrangement="",
+                      href=f"/jobs/{page}", href_is_url=False, company=company.name)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "queue.db")
+        scraping_worker = _open_queue(path, lease_seconds=1)
+        other_worker = _open_queue(path, lease_seconds=1)
+
+        company = Company(name="Acme", url="https://acme.example.com/careers?a=1", paged=True, page_query_param="page")
+        scraping_worker.put(COMPANY_TOPIC, company.name, {})
+        job = scraping_worker.lease(COMPANY_TOPIC)
+
+        heartbeats = []
+        listing_scraper = ListingScraper(fetcher=Fetcher())
+        listing_scraper.iter_parse_page = iter_parse_page
+        listing_scraper.calculate_similarity = lambda first, second: 0.0
+        listings = listing_scraper.scrape_all_pages(company, max_pages=3, prefetch=0,
+                                                    heartbeat=lambda: heartbeats.append(scraping_worker.extend(job)))
+
+        assert len(listings) == 3
+        assert heartbeats == [True, True]
+        assert other_worker.lease(COMPANY_TOPIC) is None
+        assert scraping_worker.complete(job)
+        scraping_worker.close()
+        other_worker.close()